@@ -1,18 +1,25 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import os
 import sys
-from contextlib import suppress
+import threading
+from contextlib import asynccontextmanager, contextmanager, suppress
+from contextvars import ContextVar
 from functools import cache
 from inspect import Parameter, Signature, signature
 from io import TextIOWrapper
+from pathlib import Path
 from shutil import which
 from subprocess import (
     CalledProcessError,
 )
-from typing import TYPE_CHECKING, Any
+from tempfile import TemporaryFile, mkstemp
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Any, BinaryIO
 from urllib.request import urlopen
+from weakref import WeakKeyDictionary
 
 import nest_asyncio  # type: ignore[import-untyped]
 
@@ -24,7 +31,17 @@ from decorative_secrets.subprocess import check_output
 from decorative_secrets.utilities import as_dict, as_tuple
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Coroutine, Iterable, Sequence
+    from collections.abc import (
+        AsyncIterator,
+        Callable,
+        Coroutine,
+        Hashable,
+        Iterable,
+        Iterator,
+        Sequence,
+    )
+    from concurrent.futures import Future
+    from contextvars import Token
 
 
 HOMEBREW_INSTALL_SH: str = (
@@ -94,6 +111,79 @@ def which_winget() -> str | None:
         return winget
 
 
+def get_cache_directory() -> Path:
+    """
+    Get the directory in which `decorative-secrets` persists state shared
+    between processes (creating it, readable only by the current user, if
+    it does not exist).
+    """
+    base: Path
+    if sys.platform.startswith("win"):  # pragma: no cover
+        base = Path(
+            os.getenv("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+        )
+    elif sys.platform == "darwin":  # pragma: no cover
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+    path: Path = base / "decorative-secrets"
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    return path
+
+
+@contextmanager
+def open_private_file(path: Path) -> Iterator[BinaryIO]:
+    """
+    Open a binary file which, when the context exits without an error,
+    atomically replaces `path`, ensuring the file is only ever readable
+    and writable by the current user. If an error occurs, `path` is left
+    unchanged.
+    """
+    descriptor: int
+    temporary_path: str
+    descriptor, temporary_path = mkstemp(
+        dir=path.parent, prefix=f".{path.name}."
+    )
+    try:
+        # `mkstemp` creates the file readable and writable only by the
+        # current user, so the contents are never exposed, even briefly
+        with os.fdopen(descriptor, "wb") as file:
+            yield file
+        os.replace(temporary_path, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.remove(temporary_path)
+        raise
+
+
+def write_private_file(path: Path, data: str | bytes) -> None:
+    """
+    Atomically replace the contents of `path` with `data`, ensuring the
+    file is only ever readable and writable by the current user.
+    """
+    file: BinaryIO
+    with open_private_file(path) as file:
+        file.write(data.encode("utf-8") if isinstance(data, str) else data)
+
+
+def create_anonymous_file(name: str) -> BinaryIO:
+    """
+    Create a readable and writable binary file which has no path, and is
+    discarded when closed. On Linux, this is an in-memory file created using
+    `memfd_create`, which is never written to disk, otherwise it is a
+    temporary file which is unlinked immediately.
+    """
+    memfd_create: Callable[[str, int], int] | None = getattr(
+        os, "memfd_create", None
+    )
+    if memfd_create is not None:
+        with suppress(OSError):
+            return open(  # noqa: SIM115
+                memfd_create(name, os.MFD_CLOEXEC), "w+b"
+            )
+    return TemporaryFile()  # pragma: no cover
+
+
 @as_tuple
 def merge_function_signature_args_kwargs(
     function_signature: Signature, args: Iterable[Any], kwargs: dict[str, Any]
@@ -182,15 +272,321 @@ def get_running_loop() -> asyncio.AbstractEventLoop | None:
     return loop
 
 
+class _BackgroundEventLoop:
+    """
+    A process-wide event loop, running in a daemon thread, to which
+    synchronous code submits coroutines. Because the loop outlives each
+    call, async clients and connections bound to it can be reused between
+    synchronous calls.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the background event loop, starting it if it is not running.
+        """
+        loop: asyncio.AbstractEventLoop | None = self._loop
+        if (loop is None) or loop.is_closed():
+            with self._lock:
+                if (self._loop is None) or self._loop.is_closed():
+                    self._start()
+                loop = self._loop
+        if loop is None:  # pragma: no cover
+            raise RuntimeError
+        return loop
+
+    def _start(self) -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        started: threading.Event = threading.Event()
+
+        def run_forever() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(started.set)
+            loop.run_forever()
+
+        thread: threading.Thread = threading.Thread(
+            target=run_forever,
+            name="decorative-secrets-event-loop",
+            daemon=True,
+        )
+        thread.start()
+        started.wait()
+        self._loop = loop
+        self._thread = thread
+
+    def is_current(self) -> bool:
+        """
+        Return `True` if called from the background event loop's thread.
+        """
+        return (self._thread is not None) and (
+            self._thread is threading.current_thread()
+        )
+
+    def run(self, coroutine: Coroutine) -> Any:
+        """
+        Run a coroutine on the background event loop, blocking until it
+        completes.
+        """
+        future: Future = asyncio.run_coroutine_threadsafe(
+            coroutine, self.get_loop()
+        )
+        try:
+            return future.result()
+        except BaseException:
+            # For example, a `KeyboardInterrupt` while waiting
+            future.cancel()
+            raise
+
+    def stop(self, timeout: float = 5) -> None:
+        """
+        Cancel outstanding tasks, stop the background event loop, and close
+        it. The loop is started again if it is subsequently needed.
+        """
+        with self._lock:
+            loop: asyncio.AbstractEventLoop | None = self._loop
+            thread: threading.Thread | None = self._thread
+            self._loop = self._thread = None
+        if (loop is None) or (thread is None):
+            return
+        if thread.is_alive():
+
+            async def shutdown() -> None:
+                current: asyncio.Task | None = asyncio.current_task()
+                tasks: set[asyncio.Task] = {
+                    task for task in asyncio.all_tasks() if task is not current
+                }
+                task: asyncio.Task
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                await loop.shutdown_asyncgens()
+
+            with suppress(Exception):
+                asyncio.run_coroutine_threadsafe(shutdown(), loop).result(
+                    timeout
+                )
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+        if not loop.is_running():
+            loop.close()
+
+    def reset_after_fork(self) -> None:
+        """
+        Discard the background event loop in a forked child process, where
+        its thread no longer exists. The loop is not closed, since its
+        selector is shared with the parent process.
+        """
+        self._lock = threading.Lock()
+        self._loop = self._thread = None
+
+
+_BACKGROUND_EVENT_LOOP: _BackgroundEventLoop = _BackgroundEventLoop()
+atexit.register(_BACKGROUND_EVENT_LOOP.stop)
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_BACKGROUND_EVENT_LOOP.reset_after_fork)
+
+
+def get_background_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the process-wide background event loop on which `asyncio_run` runs
+    coroutines, starting it if necessary.
+    """
+    return _BACKGROUND_EVENT_LOOP.get_loop()
+
+
 def asyncio_run(coroutine: Coroutine) -> Any:
     """
-    Run a coroutine, applying nest_asyncio if necessary.
+    Run a coroutine to completion from synchronous code.
+
+    Coroutines are run on a process-wide background event loop, so that
+    async clients and connections can be reused between calls, and so that
+    this works even when called from within a running event loop. If called
+    from a coroutine already running *on* the background event loop,
+    nest_asyncio is applied and the coroutine is run re-entrantly instead.
+    """
+    loop: asyncio.AbstractEventLoop | None
+    if _BACKGROUND_EVENT_LOOP.is_current():
+        loop = get_running_loop()
+        if loop is not None:
+            nest_asyncio.apply(loop)
+            return loop.run_until_complete(coroutine)
+    return _BACKGROUND_EVENT_LOOP.run(coroutine)
+
+
+_EVENT_LOOP_OBJECTS: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[Hashable, Any]
+] = WeakKeyDictionary()
+
+
+def get_event_loop_objects() -> dict[Hashable, Any]:
+    """
+    Get a dictionary in which to cache objects bound to the running event
+    loop, such as async clients and connections. The dictionary is
+    discarded along with the event loop.
+    """
+    return _EVENT_LOOP_OBJECTS.setdefault(asyncio.get_running_loop(), {})
+
+
+class RateLimiter:
+    """
+    A token-bucket rate limiter, shared by threads and tasks. Callers who
+    exceed the rate are queued (delayed, in order of arrival) rather than
+    refused. The rate adapts to rate-limit responses: `throttle` halves it,
+    and `recover` restores it gradually.
+
+    Parameters:
+        rate: The maximum sustained number of requests per second.
+        burst: The number of requests which may be made at once, before
+            the rate applies.
+        minimum_rate: The rate below which `throttle` will not reduce the
+            rate, and by which `recover` increases it. Defaults to 1/64th
+            of `rate`.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1,
+        minimum_rate: float | None = None,
+    ) -> None:
+        self.maximum_rate: float = rate
+        self.rate: float = rate
+        self.burst: float = burst
+        self.minimum_rate: float = (
+            rate / 64 if minimum_rate is None else minimum_rate
+        )
+        self._tokens: float = burst
+        self._updated: float = monotonic()
+        self._queue_depth: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of callers currently waiting for the rate limit.
+        """
+        return self._queue_depth
+
+    def _refill(self) -> None:
+        now: float = monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def _reserve(self) -> float:
+        """
+        Take a token, returning the number of seconds to wait before it
+        may be used (tokens may be borrowed against future refills, which
+        is how waiting callers are queued in order).
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0
+            self._queue_depth += 1
+            return -self._tokens / self.rate
+
+    def _dequeue(self, *, cancelled: bool = False) -> None:
+        with self._lock:
+            self._queue_depth -= 1
+            if cancelled:
+                # Return the unused token
+                self._tokens += 1
+
+    def acquire(self) -> None:
+        """
+        Wait (blocking the current thread) until a request may be made.
+        """
+        delay: float = self._reserve()
+        if delay:
+            try:
+                sleep(delay)
+            finally:
+                self._dequeue()
+
+    async def async_acquire(self) -> None:
+        """
+        Wait (without blocking the event loop) until a request may be made.
+        """
+        delay: float = self._reserve()
+        if delay:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._dequeue(cancelled=True)
+                raise
+            self._dequeue()
+
+    def throttle(self, retry_after: float | None = None) -> None:
+        """
+        Halve the rate following a rate-limit response, and pause all
+        callers for `retry_after` seconds (by default, the time taken for
+        one request to be allowed at the reduced rate).
+        """
+        with self._lock:
+            self._refill()
+            self.rate = max(self.minimum_rate, self.rate / 2)
+            pause: float = (
+                1 / self.rate if retry_after is None else retry_after
+            )
+            self._tokens = min(self._tokens, 0) - pause * self.rate
+
+    def recover(self) -> None:
+        """
+        Increase the rate, up to its original maximum, following a
+        successful request.
+        """
+        if self.rate < self.maximum_rate:
+            with self._lock:
+                self._refill()
+                self.rate = min(
+                    self.maximum_rate, self.rate + self.minimum_rate
+                )
+
+
+# The intervals, in seconds, at which a coroutine polls a `threading.Lock`
+# which is held by a thread
+_ASYNC_LOCK_POLL_INTERVAL: float = 0.001
+_ASYNC_LOCK_MAXIMUM_POLL_INTERVAL: float = 0.05
+
+
+@asynccontextmanager
+async def async_lock(lock: threading.Lock) -> AsyncIterator[None]:
+    """
+    Acquire a `threading.Lock` from a coroutine without blocking the event
+    loop, so that the same lock can serialize work across both threads and
+    tasks.
+
+    Tasks first queue on an `asyncio.Lock` paired with `lock` (for the
+    running event loop), so only one task at a time contends for `lock`
+    itself. While `lock` is held by a thread, that task polls it (with
+    backoff) rather than waiting in an executor thread, so waiting tasks
+    never tie up the event loop's default executor, and cancellation
+    leaves nothing behind.
     """
-    loop: asyncio.AbstractEventLoop | None = get_running_loop()
-    if loop is None:
-        return asyncio.run(coroutine)
-    nest_asyncio.apply(loop)
-    return asyncio.run(coroutine)
+    loop_objects: dict[Hashable, Any] = get_event_loop_objects()
+    key: tuple[str, threading.Lock] = (
+        "decorative_secrets._utilities.async_lock",
+        lock,
+    )
+    task_lock: asyncio.Lock | None = loop_objects.get(key)
+    if task_lock is None:
+        task_lock = loop_objects[key] = asyncio.Lock()
+    async with task_lock:
+        interval: float = _ASYNC_LOCK_POLL_INTERVAL
+        while not lock.acquire(blocking=False):
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, _ASYNC_LOCK_MAXIMUM_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            lock.release()
 
 
 def unwrap_function(
@@ -204,7 +600,22 @@ def unwrap_function(
     return function
 
 
-_FUNCTIONS_ERRORS: dict[int, dict[str, list[str]]] = {}
+# Errors encountered looking up arguments, keyed by the ID of the decorated
+# function, for calls made in the current context (so that calls made
+# concurrently, in other threads or tasks, do not share errors)
+_FUNCTIONS_ERRORS: ContextVar[dict[int, dict[str, list[str]]] | None] = (
+    ContextVar("decorative_secrets_functions_errors", default=None)
+)
+
+
+def _get_functions_errors() -> dict[int, dict[str, list[str]]]:
+    functions_errors: dict[int, dict[str, list[str]]] | None = (
+        _FUNCTIONS_ERRORS.get()
+    )
+    if functions_errors is None:
+        functions_errors = {}
+        _FUNCTIONS_ERRORS.set(functions_errors)
+    return functions_errors
 
 
 def get_errors(function: Callable[..., Any]) -> dict[str, list[str]]:
@@ -212,4 +623,34 @@ def get_errors(function: Callable[..., Any]) -> dict[str, list[str]]:
     This function retrieves the current function errors.
     """
     function_id: int = id(function)
-    return _FUNCTIONS_ERRORS.setdefault(function_id, {})
+    return _get_functions_errors().setdefault(function_id, {})
+
+
+def clear_errors(function: Callable[..., Any]) -> None:
+    """
+    This function discards the current function errors.
+    """
+    _get_functions_errors().pop(id(function), None)
+
+
+@contextmanager
+def errors_context(function: Callable[..., Any]) -> Iterator[None]:
+    """
+    Collect errors for a call to `function` separately from those of any
+    other calls (made concurrently, in the same thread or task), unless
+    errors are already being collected for this call (as is the case when
+    decorators are stacked).
+    """
+    functions_errors: dict[int, dict[str, list[str]]] = (
+        _FUNCTIONS_ERRORS.get() or {}
+    )
+    if id(function) in functions_errors:
+        yield
+        return
+    token: Token = _FUNCTIONS_ERRORS.set(
+        {**functions_errors, id(function): {}}
+    )
+    try:
+        yield
+    finally:
+        _FUNCTIONS_ERRORS.reset(token)
@@ -6,8 +6,9 @@ from inspect import Parameter, Signature, signature
 from typing import Any
 
 from decorative_secrets._utilities import (
-    _FUNCTIONS_ERRORS,
     asyncio_run,
+    clear_errors,
+    errors_context,
     get_errors,
     merge_function_signature_args_kwargs,
     unwrap_function,
@@ -66,6 +67,15 @@ def apply_callback_arguments(  # noqa: C901
     which accepts an explicit input, and the corresponding mapped value is
     an argument to pass to the provided callback function(s).
 
+    For synchronous functions, the synchronous callback is called for one
+    parameter at a time. For asynchronous functions, the asynchronous
+    callback is awaited instead, and lookups for multiple parameters are
+    performed concurrently (using `asyncio.gather`), so asynchronous
+    callbacks must be safe to call concurrently. In either case, errors are
+    reported in the order parameters are mapped (regardless of the order in
+    which lookups complete), and errors encountered by calls made
+    concurrently (in other threads or tasks) are reported separately.
+
     Parameters:
         *callbacks: One or more callback functions. If both synchronous and
             asynchronous functions are provided, they will be used
@@ -112,23 +122,21 @@ def apply_callback_arguments(  # noqa: C901
         original_function: Callable[..., Any] = unwrap_function(function)
         function_signature: Signature = signature(original_function)
 
-        def get_args_kwargs(  # noqa: C901
+        def get_args_kwargs_lookups(
             *args: Any, **kwargs: Any
-        ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        ) -> tuple[tuple[Any, ...], dict[str, Any], dict[str, Any]]:
             """
-            This function performs lookups for any parameters for which an
-            argument is not passed explicitly.
+            This function identifies parameters for which an argument is not
+            passed explicitly, and returns a mapping of these parameter
+            names to the arguments with which to perform lookups (or `None`,
+            if there is no argument to look up).
             """
-            # Capture errors
-            errors: dict[str, list[str]] = get_errors(original_function)
             # First we consolidate the keyword arguments with any arguments
             # which are passed to parameters which can be either positional
             # *or* keyword arguments, and were passed as positional arguments
             args = merge_function_signature_args_kwargs(
                 function_signature, args, kwargs
             )
-            # For any arguments where we have callback arguments and do not
-            # have an explicitly passed value, execute the callback
             key: str
             value: Any
             used_keys: set[str] = {
@@ -137,73 +145,192 @@ def apply_callback_arguments(  # noqa: C901
             unused_callback_parameter_names: set[str] = (
                 set(callback_parameter_names.values()) & used_keys
             )
+            lookups: dict[str, Any] = {}
             parameter_name: str
-            for parameter_name in (
-                set(callback_parameter_names.keys()) - used_keys
-            ):
-                callback_parameter_name: str = callback_parameter_names[
-                    parameter_name
-                ]
+            callback_parameter_name: str
+            # Parameters are looked up (and errors reported) in the order
+            # they were mapped
+            for (
+                parameter_name,
+                callback_parameter_name,
+            ) in callback_parameter_names.items():
+                if parameter_name in used_keys:
+                    continue
                 unused_callback_parameter_names.discard(
                     callback_parameter_name
                 )
                 callback_argument: Any = kwargs.pop(
                     callback_parameter_name, None
                 )
-                parameter: Parameter | None = (
-                    function_signature.parameters.get(parameter_name)
-                )
-                callback_: Callable[..., Any] = callback
                 if (
-                    (parameter is not None)
-                    and (isinstance(parameter.annotation, type))
-                    and issubclass(Coroutine, parameter.annotation)
-                ):
-                    callback_ = async_callback
-                if callback_argument is not None:
-                    try:
-                        kwargs[parameter_name] = callback_(callback_argument)
-                        # Clear preceding errors for this parameter
-                        errors.pop(parameter_name, None)
-                    except Exception:  # noqa: BLE001
-                        errors.setdefault(parameter_name, [])
-                        errors[parameter_name].append(get_exception_text())
-                elif callback_parameter_name in function_signature.parameters:
+                    callback_argument is None
+                ) and callback_parameter_name in function_signature.parameters:
                     default: tuple[Sequence[Any], Mapping[str, Any]] | None = (
                         function_signature.parameters[
                             callback_parameter_name
                         ].default
                     )
                     if default not in (Signature.empty, None):
-                        try:
-                            kwargs[parameter_name] = callback_(default)
-                            # Clear preceding errors for this parameter
-                            errors.pop(parameter_name, None)
-                        except Exception:  # noqa: BLE001
-                            errors.setdefault(parameter_name, [])
-                            errors[parameter_name].append(get_exception_text())
-                if (function is original_function) and errors:
-                    arguments_error_messages: dict[str, list[str]] = {}
-                    for key, argument_error_messages in errors.items():
-                        # Don't raise an error for parameters which
-                        # have a value or default value
-                        if kwargs.get(key) is None:
-                            parameter = function_signature.parameters.get(key)
-                            if parameter and (
-                                parameter.default is Signature.empty
-                            ):
-                                arguments_error_messages[key] = (
-                                    argument_error_messages
-                                )
-                    # Clear global errors collection
-                    _FUNCTIONS_ERRORS.pop(id(function), None)
-                    if arguments_error_messages:
-                        raise ArgumentsResolutionError(
-                            arguments_error_messages
-                        )
+                        callback_argument = default
+                lookups[parameter_name] = callback_argument
             # Remove unused callback arguments
             deque(map(kwargs.pop, unused_callback_parameter_names), maxlen=0)
-            return (args, kwargs)
+            return args, kwargs, lookups
+
+        def returns_coroutine(parameter_name: str) -> bool:
+            """
+            Determine whether a parameter accepts a coroutine, in which case
+            the (un-awaited) output of the asynchronous callback is passed to
+            it.
+            """
+            parameter: Parameter | None = function_signature.parameters.get(
+                parameter_name
+            )
+            return (
+                (parameter is not None)
+                and (isinstance(parameter.annotation, type))
+                and issubclass(Coroutine, parameter.annotation)
+            )
+
+        def lookup(
+            callback_: Callable[..., Any], callback_argument: Any
+        ) -> tuple[Any, str | None]:
+            """
+            Perform a lookup, returning the value and (if the lookup failed)
+            error text.
+            """
+            try:
+                return callback_(callback_argument), None
+            except Exception:  # noqa: BLE001
+                return None, get_exception_text()
+
+        async def async_lookup(
+            callback_argument: Any,
+        ) -> tuple[Any, str | None]:
+            """
+            Perform an asynchronous lookup, returning the value and (if the
+            lookup failed) error text.
+            """
+            try:
+                return await async_callback(callback_argument), None
+            except Exception:  # noqa: BLE001
+                return None, get_exception_text()
+
+        def apply_lookups(
+            kwargs: dict[str, Any],
+            results: dict[str, tuple[Any, str | None] | None],
+        ) -> None:
+            """
+            Apply the results of lookups to keyword arguments, and raise an
+            error for required parameters which could not be resolved by
+            this, or any preceding, decorator.
+            """
+            # Capture errors
+            errors: dict[str, list[str]] = get_errors(original_function)
+            key: str
+            parameter_name: str
+            result: tuple[Any, str | None] | None
+            for parameter_name, result in results.items():
+                if result is not None:
+                    value: Any
+                    error: str | None
+                    value, error = result
+                    if error is None:
+                        kwargs[parameter_name] = value
+                        # Clear preceding errors for this parameter
+                        errors.pop(parameter_name, None)
+                    else:
+                        errors.setdefault(parameter_name, [])
+                        errors[parameter_name].append(error)
+            if (function is original_function) and errors:
+                arguments_error_messages: dict[str, list[str]] = {}
+                for key, argument_error_messages in errors.items():
+                    # Don't raise an error for parameters which
+                    # have a value or default value
+                    if kwargs.get(key) is None:
+                        parameter: Parameter | None = (
+                            function_signature.parameters.get(key)
+                        )
+                        if parameter and (
+                            parameter.default is Signature.empty
+                        ):
+                            arguments_error_messages[key] = (
+                                argument_error_messages
+                            )
+                # Clear the errors collected for this call
+                clear_errors(function)
+                if arguments_error_messages:
+                    raise ArgumentsResolutionError(arguments_error_messages)
+
+        def get_args_kwargs(
+            *args: Any, **kwargs: Any
+        ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+            """
+            This function performs lookups for any parameters for which an
+            argument is not passed explicitly.
+            """
+            lookups: dict[str, Any]
+            args, kwargs, lookups = get_args_kwargs_lookups(*args, **kwargs)
+            parameter_name: str
+            callback_argument: Any
+            apply_lookups(
+                kwargs,
+                {
+                    parameter_name: (
+                        None
+                        if callback_argument is None
+                        else lookup(
+                            async_callback
+                            if returns_coroutine(parameter_name)
+                            else callback,
+                            callback_argument,
+                        )
+                    )
+                    for parameter_name, callback_argument in lookups.items()
+                },
+            )
+            return args, kwargs
+
+        async def async_get_args_kwargs(
+            *args: Any, **kwargs: Any
+        ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+            """
+            This function performs lookups for any parameters for which an
+            argument is not passed explicitly, awaiting the asynchronous
+            callback (concurrently, for multiple parameters) so that the
+            event loop is not blocked.
+            """
+            lookups: dict[str, Any]
+            args, kwargs, lookups = get_args_kwargs_lookups(*args, **kwargs)
+            parameter_name: str
+            callback_argument: Any
+            awaited: dict[str, Coroutine[Any, Any, tuple[Any, str | None]]] = {
+                parameter_name: async_lookup(callback_argument)
+                for parameter_name, callback_argument in lookups.items()
+                if (callback_argument is not None)
+                and not returns_coroutine(parameter_name)
+            }
+            awaited_results: dict[str, tuple[Any, str | None]] = dict(
+                zip(
+                    awaited.keys(),
+                    await asyncio.gather(*awaited.values()),
+                    strict=True,
+                )
+            )
+            apply_lookups(
+                kwargs,
+                {
+                    parameter_name: (
+                        None
+                        if callback_argument is None
+                        else awaited_results[parameter_name]
+                        if parameter_name in awaited_results
+                        else lookup(async_callback, callback_argument)
+                    )
+                    for parameter_name, callback_argument in lookups.items()
+                },
+            )
+            return args, kwargs
 
         if iscoroutinefunction(function):
 
@@ -213,9 +340,10 @@ def apply_callback_arguments(  # noqa: C901
                 This function wraps the original and performs lookups for
                 any parameters for which an argument is not passed
                 """
-                args, kwargs = get_args_kwargs(*args, **kwargs)
-                # Execute the wrapped function
-                return await function(*args, **kwargs)
+                with errors_context(original_function):
+                    args, kwargs = await async_get_args_kwargs(*args, **kwargs)
+                    # Execute the wrapped function
+                    return await function(*args, **kwargs)
 
         else:
 
@@ -225,9 +353,10 @@ def apply_callback_arguments(  # noqa: C901
                 This function wraps the original and performs lookups for
                 any parameters for which an argument is not passed
                 """
-                args, kwargs = get_args_kwargs(*args, **kwargs)
-                # Execute the wrapped function
-                return function(*args, **kwargs)
+                with errors_context(original_function):
+                    args, kwargs = get_args_kwargs(*args, **kwargs)
+                    # Execute the wrapped function
+                    return function(*args, **kwargs)
 
         return wrapper
 
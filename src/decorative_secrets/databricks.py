@@ -1,22 +1,39 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import configparser
 import copyreg
+import hashlib
+import heapq
 import inspect
 import json
 import os
+import re
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
 from functools import cache, partial
+from itertools import count
+from pathlib import Path
+from random import uniform
 from shutil import which
 from subprocess import CalledProcessError
-from typing import TYPE_CHECKING, Any, TypedDict
+from time import time
+from typing import TYPE_CHECKING, Any, TypedDict, TypeVar
 from urllib.request import urlopen
+from uuid import uuid4
+from weakref import WeakKeyDictionary
 
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.config import Config
 
 from decorative_secrets._utilities import (
+    get_event_loop_objects,
     which_brew,
     which_winget,
 )
@@ -26,17 +43,29 @@ from decorative_secrets.errors import (
     HomebrewNotInstalledError,
 )
 from decorative_secrets.subprocess import check_call, check_output
-from decorative_secrets.utilities import retry
+from decorative_secrets.utilities import get_logger, retry
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Mapping
+    import logging
+    from collections.abc import (
+        Awaitable,
+        Callable,
+        Hashable,
+        Iterable,
+        Iterator,
+        Mapping,
+    )
 
-    from databricks.sdk.config import Config
+    from cryptography.fernet import Fernet
     from databricks.sdk.credentials_provider import CredentialsStrategy
     from databricks.sdk.dbutils import RemoteDbUtils
     from databricks.sdk.oauth import AuthorizationDetail
 
 
+def _get_log() -> logging.Logger:
+    return get_logger(__name__)
+
+
 # region Make workspace clients pickleable (in most scenarios)
 
 
@@ -61,6 +90,13 @@ def _unpickle_workspace_client(
 def _workspace_client_redux(
     client: WorkspaceClient,
 ) -> tuple[Callable[..., WorkspaceClient], tuple]:
+    handle: _WorkspaceClientHandle | None = _WORKSPACE_CLIENT_HANDLES.get(
+        client
+    )
+    if handle is not None:
+        # Pooled clients are pickled as a handle, without fetching a token,
+        # and resolved to a client pooled by the unpickling process
+        return (_resolve_workspace_client_handle, (handle,))
     token: str | None = None
     with suppress(ValueError, AttributeError):
         token = client.config.oauth_token().access_token
@@ -82,6 +118,33 @@ copyreg.pickle(
 
 # endregion
 
+# The Databricks SDK is synchronous, so asynchronous lookups are performed in
+# a dedicated, bounded, pool of worker threads
+_DATABRICKS_MAX_WORKERS: int = 8
+
+
+def _create_databricks_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=_DATABRICKS_MAX_WORKERS,
+        thread_name_prefix="decorative-secrets-databricks",
+    )
+
+
+_DATABRICKS_EXECUTOR: ThreadPoolExecutor = _create_databricks_executor()
+
+
+def _reset_databricks_executor_after_fork() -> None:
+    """
+    Replace the executor in a forked child process, where its worker threads
+    no longer exist (so it would never run submitted lookups).
+    """
+    global _DATABRICKS_EXECUTOR  # noqa: PLW0603
+    _DATABRICKS_EXECUTOR = _create_databricks_executor()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_reset_databricks_executor_after_fork)
+
 
 @dataclass
 class DatabricksWorkspaceClientArguments:
@@ -191,8 +254,19 @@ def apply_databricks_secrets_arguments(
         if databricks_workspace_client_arguments
         else _get_scope_key_secret
     )
+    async_get_scope_key_secret: Callable[
+        [str | tuple[str, str]], Awaitable[str]
+    ] = (
+        partial(
+            _async_get_scope_key_secret,
+            **asdict(databricks_workspace_client_arguments),
+        )
+        if databricks_workspace_client_arguments
+        else _async_get_scope_key_secret
+    )
     return apply_callback_arguments(
         get_scope_key_secret,
+        async_get_scope_key_secret,
         **kwargs,
     )
 
@@ -283,20 +357,245 @@ class _DatabricksAuthDescription(TypedDict, total=False):
     error: dict[str, Any]
 
 
-@cache
-def _get_host_profile(
-    host: str,
-) -> str | None:
+_T = TypeVar("_T")
+
+# Databricks CLI auth metadata (profiles, and auth descriptions), cached along
+# with the modification times of the files from which it is derived
+_DATABRICKS_AUTH_CACHE: dict[
+    Hashable, tuple[tuple[int | None, int | None], Any]
+] = {}
+# Cached tokens expiring within this number of seconds are not relied upon
+_DATABRICKS_TOKEN_EXPIRY_MARGIN: float = 60
+_DATABRICKS_TOKEN_EXPIRY_PATTERN: re.Pattern = re.compile(
+    r"(.+T\d{2}:\d{2}:\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:\d{2})?"
+)
+
+
+def _get_databricks_config_file() -> Path:
+    return Path(
+        os.getenv("DATABRICKS_CONFIG_FILE") or "~/.databrickscfg"
+    ).expanduser()
+
+
+def _get_databricks_token_cache_file() -> Path:
+    return Path("~", ".databricks", "token-cache.json").expanduser()
+
+
+def _get_modified_time(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _get_cached_databricks_auth(
+    key: Hashable, get_value: Callable[[], _T]
+) -> _T:
+    """
+    Get a value derived from the Databricks configuration file and CLI
+    token cache, which is cached until either file is modified.
+    """
+    state: tuple[int | None, int | None] = (
+        _get_modified_time(_get_databricks_config_file()),
+        _get_modified_time(_get_databricks_token_cache_file()),
+    )
+    cached: tuple[tuple[int | None, int | None], Any] | None = (
+        _DATABRICKS_AUTH_CACHE.get(key)
+    )
+    if cached and (cached[0] == state):
+        return cached[1]
+    value: _T = get_value()
+    _DATABRICKS_AUTH_CACHE[key] = (state, value)
+    return value
+
+
+def _parse_databricks_token_expiry(expiry: str) -> float | None:
+    """
+    Parse a token expiry, as written to the CLI token cache (RFC 3339, with
+    up to nanosecond precision), as seconds since the epoch.
+    """
+    match: re.Match | None = _DATABRICKS_TOKEN_EXPIRY_PATTERN.fullmatch(expiry)
+    if not match:
+        return None
+    seconds: str
+    fraction: str | None
+    offset: str | None
+    seconds, fraction, offset = match.groups()
+    try:
+        return datetime.fromisoformat(
+            f"{seconds}"
+            f"{f'.{fraction[:6]:0<6}' if fraction else ''}"
+            f"{'+00:00' if offset in (None, 'Z') else offset}"
+        ).timestamp()
+    except ValueError:
+        return None
+
+
+def _read_databricks_token_cache() -> dict[str, dict[str, Any]]:
+    """
+    Read the CLI token cache, keyed by (lower-case) host URL or profile
+    name.
+    """
+    try:
+        tokens: Any = json.loads(
+            _get_databricks_token_cache_file().read_text()
+        ).get("tokens")
+    except (OSError, ValueError, AttributeError):
+        return {}
+    if not isinstance(tokens, dict):
+        return {}
+    key: str
+    token: Any
+    return {
+        key.rstrip("/").lower(): token
+        for key, token in tokens.items()
+        if isinstance(token, dict)
+    }
+
+
+def _has_valid_databricks_token(
+    host: str | None = None, profile: str | None = None
+) -> bool:
+    """
+    Determine, from the CLI token cache, whether an unexpired token is
+    cached for a host or profile.
+    """
+    tokens: dict[str, dict[str, Any]] = _get_cached_databricks_auth(
+        "tokens", _read_databricks_token_cache
+    )
+    if host:
+        # The CLI caches tokens by host URL, so a host with no scheme is
+        # normalized to match
+        host = _normalize_databricks_host(host)
+    key: str
+    for key in filter(None, (profile, host)):
+        token: dict[str, Any] | None = tokens.get(key.rstrip("/").lower())
+        if not (token and token.get("access_token")):
+            continue
+        expiry: float | None = _parse_databricks_token_expiry(
+            str(token.get("expiry", ""))
+        )
+        if expiry and (expiry - _DATABRICKS_TOKEN_EXPIRY_MARGIN > time()):
+            return True
+    return False
+
+
+# Authentication types implied by the credentials in a configuration profile,
+# in order of precedence, when not specified using `auth_type`
+_DATABRICKS_CONFIG_AUTH_TYPES: tuple[tuple[tuple[str, ...], str], ...] = (
+    (("token",), "pat"),
+    (("username", "password"), "basic"),
+    (("client_id", "client_secret"), "oauth-m2m"),
+    (
+        ("azure_client_id", "azure_client_secret", "azure_tenant_id"),
+        "azure-client-secret",
+    ),
+    (("google_credentials",), "google-credentials"),
+    (("google_service_account",), "google-id"),
+)
+# A section name which cannot appear in a configuration file, so that the
+# "DEFAULT" section is parsed as a profile rather than as defaults for all
+# other sections (consistent with the Databricks CLI)
+_DATABRICKS_CONFIG_NO_DEFAULT_SECTION: str = "\0"
+
+
+def _normalize_databricks_host(host: str) -> str:
+    host = host.strip().rstrip("/")
+    if host and ("://" not in host):
+        host = f"https://{host}"
+    return host
+
+
+def _get_databricks_host_cloud(host: str) -> str:
     host = host.lower()
-    auth_profile: _DatabricksAuthProfile
-    for auth_profile in _databricks_auth_profiles()["profiles"]:
-        if auth_profile.get("host", "").lower() == host:  # pragma: no cover
-            return auth_profile.get("name")
-    return None
+    if ".azuredatabricks." in host or ".databricks.azure." in host:
+        return "azure"
+    if ".gcp.databricks.com" in host:
+        return "gcp"
+    return "aws"
+
+
+def _create_databricks_config_parser() -> configparser.ConfigParser:
+    return configparser.ConfigParser(
+        default_section=_DATABRICKS_CONFIG_NO_DEFAULT_SECTION,
+        interpolation=None,
+        strict=False,
+    )
 
 
-@cache
-def _databricks_auth_profiles() -> _DatabricksAuthProfiles:
+def _get_databricks_config_auth_type(
+    section: Mapping[str, str], host: str | None = None
+) -> str | None:
+    """
+    Get the authentication type of a configuration profile: either that
+    configured explicitly, or that implied by the credentials it holds
+    (or, for a profile with a host but no credentials, "databricks-cli").
+    """
+    keys: tuple[str, ...]
+    implied_auth_type: str
+    return section.get("auth_type") or next(
+        (
+            implied_auth_type
+            for keys, implied_auth_type in _DATABRICKS_CONFIG_AUTH_TYPES
+            if all(section.get(key) for key in keys)
+        ),
+        "databricks-cli" if host else None,
+    )
+
+
+def _read_databricks_config_profile(
+    profile: str, config_file: str | None = None
+) -> dict[str, str]:
+    """
+    Read the settings for a profile from a Databricks configuration file.
+
+    Raises:
+        ValueError: If the profile is not configured.
+        configparser.Error: If the configuration file cannot be parsed.
+    """
+    path: Path = (
+        Path(config_file).expanduser()
+        if config_file
+        else _get_databricks_config_file()
+    )
+    parser: configparser.ConfigParser = _create_databricks_config_parser()
+    parser.read(path)
+    if not parser.has_section(profile):
+        message: str = f"resolve: {path} has no {profile} profile configured"
+        raise ValueError(message)
+    return dict(parser[profile])
+
+
+def _parse_databricks_config_profiles(
+    text: str,
+) -> _DatabricksAuthProfiles:
+    """
+    Parse the profiles in a Databricks configuration file, deriving the
+    same fields as `databricks auth profiles` (except for `valid`, which
+    requires authenticating).
+
+    Raises:
+        configparser.Error: If the configuration file cannot be parsed.
+    """
+    parser: configparser.ConfigParser = _create_databricks_config_parser()
+    parser.read_string(text)
+    profiles: list[_DatabricksAuthProfile] = []
+    name: str
+    for name in parser.sections():
+        section: configparser.SectionProxy = parser[name]
+        profile: _DatabricksAuthProfile = {"name": name}
+        host: str = _normalize_databricks_host(section.get("host", ""))
+        if host:
+            profile["host"] = host
+            profile["cloud"] = _get_databricks_host_cloud(host)
+        auth_type: str | None = _get_databricks_config_auth_type(section, host)
+        if auth_type:
+            profile["auth_type"] = auth_type
+        profiles.append(profile)
+    return {"profiles": profiles}
+
+
+def _list_databricks_auth_profiles() -> _DatabricksAuthProfiles:
     databricks: str = which_databricks()
     return json.loads(
         check_output(
@@ -306,6 +605,58 @@ def _databricks_auth_profiles() -> _DatabricksAuthProfiles:
     )
 
 
+def _read_databricks_auth_profiles() -> _DatabricksAuthProfiles:
+    """
+    Read profiles from the Databricks configuration file, falling back to
+    the CLI only if the file exists but cannot be parsed.
+    """
+    text: str
+    try:
+        text = _get_databricks_config_file().read_text()
+    except FileNotFoundError:
+        return {"profiles": []}
+    except (OSError, UnicodeDecodeError):  # pragma: no cover
+        return _list_databricks_auth_profiles()
+    try:
+        return _parse_databricks_config_profiles(text)
+    except configparser.Error:
+        return _list_databricks_auth_profiles()
+
+
+def _databricks_auth_profiles() -> _DatabricksAuthProfiles:
+    """
+    List Databricks configuration profiles, cached until the configuration
+    file or token cache is modified.
+    """
+    return _get_cached_databricks_auth(
+        "profiles", _read_databricks_auth_profiles
+    )
+
+
+def _index_databricks_auth_profiles() -> dict[str, str]:
+    """
+    Index Databricks configuration profile names by (normalized,
+    lower-case) host. Where several profiles have the same host, the first
+    is indexed.
+    """
+    index: dict[str, str] = {}
+    auth_profile: _DatabricksAuthProfile
+    for auth_profile in _databricks_auth_profiles()["profiles"]:
+        host: str = _normalize_databricks_host(auth_profile.get("host", ""))
+        name: str | None = auth_profile.get("name")
+        if host and name:
+            index.setdefault(host.lower(), name)
+    return index
+
+
+def _get_host_profile(
+    host: str,
+) -> str | None:
+    return _get_cached_databricks_auth(
+        "host_profiles", _index_databricks_auth_profiles
+    ).get(_normalize_databricks_host(host).lower())
+
+
 def _databricks_auth_describe(
     host: str | None = None,
     profile: str | None = None,
@@ -455,13 +806,21 @@ def databricks_auth_login(
     if (host is None) and (profile is None) and (target is None):
         host = os.getenv("DATABRICKS_HOST")
         profile = os.getenv("DATABRICKS_CONFIG_PROFILE")
-    # with suppress(CalledProcessError):
-    # If we are already authenticated, don't attempt to log in again
+    # If we are already authenticated, don't attempt to log in again. This
+    # is determined from the token cache if possible, otherwise using
+    # `databricks auth describe` (the output of which is cached until the
+    # configuration file or token cache is modified).
+    if (target is None) and _has_valid_databricks_token(host, profile):
+        return
     if (
-        _databricks_auth_describe(
-            host=host,
-            profile=profile,
-            target=target,
+        _get_cached_databricks_auth(
+            ("describe", host, profile, target),
+            partial(
+                _databricks_auth_describe,
+                host=host,
+                profile=profile,
+                target=target,
+            ),
         ).get("status")
         == "success"
     ):
@@ -471,8 +830,416 @@ def databricks_auth_login(
     )
 
 
-@cache
-def _get_env_databricks_workspace_client(
+@dataclass(frozen=True)
+class _WorkspaceClientKey:
+    """
+    A normalized, hashable, workspace client configuration, by which
+    clients are pooled. Scalar arguments other than the host, profile, and
+    authentication type (including credentials) are represented only by a
+    fingerprint, so that they are not retained in the key, or in the
+    handles as which pooled clients are pickled.
+
+    Attributes:
+        host: The workspace host URL, normalized.
+        profile: A Databricks Configuration Profile.
+        auth_type: A Databricks authentication type.
+        fingerprint: A SHA-256 digest of all other (string, number, or
+            boolean) arguments, and the environment variables from which
+            a configuration is loaded.
+        objects: Arguments which are neither strings, numbers, nor
+            booleans (such as credentials strategies), which are compared
+            by identity.
+    """
+
+    host: str | None
+    profile: str | None
+    auth_type: str | None
+    fingerprint: str
+    objects: tuple[tuple[str, Any], ...] = ()
+
+
+@dataclass
+class _PooledWorkspaceClient:
+    """
+    A pooled workspace client, and the handles to its APIs which are reused.
+
+    Attributes:
+        client: The workspace client.
+        dbutils: The client's `dbutils` handle.
+        created: When the client was constructed, in seconds since the
+            epoch.
+        arguments: The arguments from which the client was constructed.
+        env: The environment variables from which the client's
+            configuration was loaded.
+    """
+
+    client: WorkspaceClient
+    dbutils: RemoteDbUtils
+    created: float
+    arguments: Mapping[str, Any] = field(default_factory=dict)
+    env: Mapping[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class _WorkspaceClientHandle:
+    """
+    A lightweight, picklable, reference to a pooled workspace client, as
+    which pooled clients are pickled. When unpickled, a handle resolves to a
+    client from the unpickling process's pool, so that each process (for
+    example, each Spark or multiprocessing worker) constructs and
+    authenticates a client at most once for a given configuration.
+
+    Handles hold only those credentials which were passed explicitly as
+    arguments: a process which has no client pooled for a handle constructs
+    one from the handle's arguments, host, and authentication type, loading
+    any other credentials from its own `DATABRICKS_*` environment variables
+    or Databricks configuration file.
+
+    Attributes:
+        key: The key by which the client is pooled, including its host,
+            profile, authentication type, and a fingerprint of its
+            configuration.
+        arguments: The arguments from which the client was constructed
+            (which do not include credentials loaded from environment
+            variables or a configuration profile).
+    """
+
+    key: _WorkspaceClientKey
+    arguments: Mapping[str, Any] = field(default_factory=dict)
+
+
+# Workspace clients (which each hold a connection pool and credentials) are
+# pooled: the least recently used are evicted beyond the pool size, and each
+# is replaced once its lifetime (in seconds) has elapsed
+_WORKSPACE_CLIENT_POOL_SIZE: int = 16
+_WORKSPACE_CLIENT_LIFETIME: float = 60 * 60
+_WORKSPACE_CLIENTS: OrderedDict[
+    _WorkspaceClientKey, _PooledWorkspaceClient
+] = OrderedDict()
+_WORKSPACE_CLIENTS_LOCK: threading.Lock = threading.Lock()
+# Locks ensuring each client is only constructed once, when it is requested
+# concurrently
+_WORKSPACE_CLIENT_LOCKS: dict[_WorkspaceClientKey, threading.Lock] = {}
+# Handles by which pooled clients are pickled. Clients constructed with
+# arguments which are neither strings, numbers, nor booleans (such as
+# credentials strategies) have no handle.
+_WORKSPACE_CLIENT_HANDLES: WeakKeyDictionary[
+    WorkspaceClient, _WorkspaceClientHandle
+] = WeakKeyDictionary()
+# The parameters accepted by `WorkspaceClient`, and the environment variables
+# read by its configuration
+_WORKSPACE_CLIENT_PARAMETERS: frozenset[str] = frozenset(
+    inspect.signature(WorkspaceClient.__init__).parameters
+)
+_WORKSPACE_CLIENT_ENVIRONMENT_VARIABLES: tuple[str, ...] = tuple(
+    sorted(
+        {
+            name
+            for attribute in Config.attributes()
+            for name in (attribute.env, *attribute.env_aliases)
+            if name
+        }
+    )
+)
+
+
+def _get_workspace_client_key(
+    arguments: Mapping[str, Any], env: Mapping[str, str]
+) -> _WorkspaceClientKey:
+    """
+    Get the key by which a workspace client constructed from `arguments`
+    (and, unless a profile is specified, the environment) is pooled.
+    """
+    profile: str | None = arguments.get("profile")
+    name: str
+    value: Any
+    # Environment variables are ignored when a profile is specified
+    environment: dict[str, str] = (
+        {}
+        if profile and not arguments.get("config")
+        else {
+            name: env[name]
+            for name in _WORKSPACE_CLIENT_ENVIRONMENT_VARIABLES
+            if env.get(name)
+        }
+    )
+    host: str | None = arguments.get("host") or environment.get(
+        "DATABRICKS_HOST"
+    )
+    if host:
+        host = host.rstrip("/").lower()
+    scalars: dict[str, Any] = {}
+    objects: list[tuple[str, Any]] = []
+    for name, value in sorted({**arguments, "host": host}.items()):
+        if (value is None) or isinstance(value, (str, int, float, bool)):
+            scalars[name] = value
+        else:
+            objects.append(
+                (name, tuple(value) if isinstance(value, list) else value)
+            )
+    return _WorkspaceClientKey(
+        host=host,
+        profile=profile,
+        auth_type=arguments.get("auth_type")
+        or environment.get("DATABRICKS_AUTH_TYPE"),
+        fingerprint=hashlib.sha256(
+            json.dumps([scalars, environment], sort_keys=True).encode()
+        ).hexdigest(),
+        objects=tuple(objects),
+    )
+
+
+def _create_workspace_client(
+    arguments: Mapping[str, Any], env: Mapping[str, str]
+) -> WorkspaceClient:
+    """
+    Construct a workspace client, first logging in using the Databricks CLI
+    if no credentials are provided (as arguments, by environment variables,
+    or by the profile).
+    """
+    config: Config | None = arguments.get("config")
+    host: str | None = arguments.get("host")
+    profile: str | None = arguments.get("profile")
+    if config:  # pragma: no cover
+        host = host or config.host
+        profile = profile or config.profile
+    section: dict[str, str] = (
+        _read_databricks_config_profile(profile, arguments.get("config_file"))
+        if profile and not config
+        else {}
+    )
+    credentials: dict[str, Any] = {**section, **arguments}
+    if not (
+        credentials.get("token")
+        or ((not profile) and env.get("DATABRICKS_TOKEN"))
+        or (
+            (
+                credentials.get("client_id")
+                or ((not profile) and env.get("DATABRICKS_CLIENT_ID"))
+                or (config and config.client_id)
+            )
+            and (
+                credentials.get("client_secret")
+                or ((not profile) and env.get("DATABRICKS_CLIENT_SECRET"))
+                or (config and config.client_secret)
+            )
+        )
+    ):
+        with suppress(
+            CalledProcessError,
+            FileNotFoundError,
+            DatabricksCLINotInstalledError,
+        ):
+            databricks_auth_login(host=host, profile=profile)
+    if profile and not config:
+        # If a profile was explicitly provided, ensure it is used, without
+        # modifying (process-wide) `os.environ`: the profile's settings are
+        # passed to the configuration explicitly (taking precedence over
+        # environment variables), along with its authentication type, so
+        # that credentials in `DATABRICKS_*` environment variables are not
+        # used. The configuration still loads any other settings the
+        # profile does not specify (such as `DATABRICKS_CLUSTER_ID`) from
+        # environment variables.
+        key: str
+        value: Any
+        arguments = {
+            **section,
+            **{
+                key: value
+                for key, value in arguments.items()
+                if value is not None
+            },
+        }
+        auth_type: str | None = _get_databricks_config_auth_type(
+            arguments, arguments.get("host")
+        )
+        if auth_type:
+            arguments["auth_type"] = auth_type
+        authorization_details: list[AuthorizationDetail] | None = (
+            arguments.get("authorization_details")
+        )
+        if authorization_details:  # pragma: no cover
+            arguments = {
+                **arguments,
+                "authorization_details": json.dumps(
+                    [detail.as_dict() for detail in authorization_details]
+                ),
+            }
+        return WorkspaceClient(config=Config(**arguments))
+    return WorkspaceClient(**arguments)
+
+
+# OAuth access tokens held by pooled workspace clients are refreshed in the
+# background this number of seconds before they expire (or, for short-lived
+# tokens, once half of their remaining lifetime has elapsed), less a random
+# jitter of up to `_WORKSPACE_CLIENT_REFRESH_JITTER` seconds, so that
+# processes sharing credentials do not all refresh at once. Failed refreshes
+# are retried after `_WORKSPACE_CLIENT_REFRESH_RETRY` seconds.
+_WORKSPACE_CLIENT_REFRESH_MARGIN: float = 5 * 60
+_WORKSPACE_CLIENT_REFRESH_JITTER: float = 60
+_WORKSPACE_CLIENT_REFRESH_RETRY: float = 30
+
+
+def _get_workspace_client_token_expiry(
+    client: WorkspaceClient,
+) -> float | None:
+    """
+    Get the expiry of a workspace client's OAuth access token, in seconds
+    since the epoch, fetching a token if the client does not yet hold one.
+    `None` is returned for clients which are not authenticated using OAuth,
+    or for tokens which do not expire.
+    """
+    try:
+        expiry: datetime | None = client.config.oauth_token().expiry
+    except ValueError:
+        return None
+    # Naive expiries are in local time, as assumed by `timestamp`
+    return None if expiry is None else expiry.timestamp()
+
+
+class _WorkspaceClientRefresher:
+    """
+    A daemon thread which refreshes the OAuth access tokens of pooled
+    workspace clients shortly before they expire, so that secret lookups
+    never wait on the identity provider. A client is refreshed by
+    constructing a replacement, fetching its token, and then swapping it
+    into the pool, so that lookups in progress continue to use the original
+    (still valid) client.
+    """
+
+    def __init__(self) -> None:
+        self._condition: threading.Condition = threading.Condition()
+        self._schedule: list[
+            tuple[float, int, _WorkspaceClientKey, _PooledWorkspaceClient]
+        ] = []
+        self._counter: Iterator[int] = count()
+        self._thread: threading.Thread | None = None
+
+    def schedule(
+        self,
+        key: _WorkspaceClientKey,
+        pooled: _PooledWorkspaceClient,
+        due: float | None = None,
+    ) -> None:
+        """
+        Schedule a pooled client to be checked, and refreshed if its token
+        is due to be refreshed, at `due` (in seconds since the epoch), or
+        immediately.
+        """
+        with self._condition:
+            heapq.heappush(
+                self._schedule,
+                (
+                    time() if due is None else due,
+                    next(self._counter),
+                    key,
+                    pooled,
+                ),
+            )
+            if (self._thread is None) or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="decorative-secrets-databricks-refresh",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            key: _WorkspaceClientKey
+            pooled: _PooledWorkspaceClient
+            with self._condition:
+                while (not self._schedule) or (self._schedule[0][0] > time()):
+                    self._condition.wait(
+                        (self._schedule[0][0] - time())
+                        if self._schedule
+                        else None
+                    )
+                _, _, key, pooled = heapq.heappop(self._schedule)
+            try:
+                self._refresh(key, pooled)
+            except Exception as error:  # noqa: BLE001  # pragma: no cover
+                _get_log().warning(
+                    "Refreshing a Databricks workspace client failed: %s: %s",
+                    type(error).__name__,
+                    error,
+                )
+
+    def _refresh(
+        self, key: _WorkspaceClientKey, pooled: _PooledWorkspaceClient
+    ) -> None:
+        with _WORKSPACE_CLIENTS_LOCK:
+            if _WORKSPACE_CLIENTS.get(key) is not pooled:
+                # The client has been evicted, or replaced
+                return
+        expiry: float | None
+        try:
+            expiry = _get_workspace_client_token_expiry(pooled.client)
+        except Exception:  # noqa: BLE001
+            # Authentication errors are raised when the client is next used
+            return
+        if expiry is None:
+            return
+        now: float = time()
+        due: float = expiry - min(
+            _WORKSPACE_CLIENT_REFRESH_MARGIN
+            + uniform(0, _WORKSPACE_CLIENT_REFRESH_JITTER),
+            max(expiry - pooled.created, 0) / 2,
+        )
+        if due > now:
+            self.schedule(key, pooled, due)
+            return
+        if expiry <= now:
+            # The token expired while failed refreshes were being retried,
+            # so it is refreshed when the client is next used
+            return
+        refreshed: _PooledWorkspaceClient
+        try:
+            refreshed = _create_pooled_workspace_client(
+                key, pooled.arguments, pooled.env
+            )
+            # Fetch the replacement's token before it is pooled
+            _get_workspace_client_token_expiry(refreshed.client)
+        except Exception as error:  # noqa: BLE001
+            _get_log().warning(
+                "Refreshing a Databricks workspace client's OAuth token "
+                "failed, and will be retried: %s: %s",
+                type(error).__name__,
+                error,
+            )
+            self.schedule(
+                key,
+                pooled,
+                min(now + _WORKSPACE_CLIENT_REFRESH_RETRY, expiry),
+            )
+            return
+        with _WORKSPACE_CLIENTS_LOCK:
+            if _WORKSPACE_CLIENTS.get(key) is not pooled:
+                return
+            _WORKSPACE_CLIENTS[key] = refreshed
+        self.schedule(key, refreshed)
+
+    def reset_after_fork(self) -> None:
+        """
+        Discard the refresher thread in a forked child process, where it no
+        longer exists. Scheduled refreshes are retained, and the thread is
+        started again when a refresh is next scheduled.
+        """
+        self._condition = threading.Condition()
+        self._thread = None
+
+
+_WORKSPACE_CLIENT_REFRESHER: _WorkspaceClientRefresher = (
+    _WorkspaceClientRefresher()
+)
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(
+        after_in_child=_WORKSPACE_CLIENT_REFRESHER.reset_after_fork
+    )
+
+
+def _get_pooled_databricks_workspace_client(
     host: str | None = None,
     account_id: str | None = None,
     username: str | None = None,
@@ -502,93 +1269,153 @@ def _get_env_databricks_workspace_client(
     config: Config | None = None,
     scopes: list[str] | None = None,
     authorization_details: list[AuthorizationDetail] | None = None,
-    **env: str,  # noqa: ARG001
-) -> WorkspaceClient:
+    env: Mapping[str, str] | None = None,
+) -> _PooledWorkspaceClient:
     """
-    Get a Databricks WorkspaceClient. This function is cached based on
-    environment variables, to ensure changes to the environment are reflected.
+    Get a Databricks WorkspaceClient from the pool, keyed by normalized
+    arguments and the environment variables from which its configuration
+    is loaded (`env`, which defaults to `os.environ`), constructing one if
+    none is pooled (or the pooled client has expired).
     """
-    if config:  # pragma: no cover
-        host = host or config.host
-        profile = profile or config.profile
-    if not (
-        token
-        or (
+    if env is None:
+        env = os.environ
+    parameter_name: str
+    argument: Any
+    arguments: dict[str, Any] = {
+        parameter_name: argument
+        for parameter_name, argument in (
+            ("host", host),
+            ("account_id", account_id),
+            ("username", username),
+            ("password", password),
+            ("client_id", client_id),
+            ("client_secret", client_secret),
+            ("token", token),
+            ("profile", profile),
+            ("config_file", config_file),
             (
-                client_id
-                or os.getenv("DATABRICKS_CLIENT_ID")
-                or (config and config.client_id)
-            )
-            and (
-                client_secret
-                or os.getenv("DATABRICKS_CLIENT_SECRET")
-                or (config and config.client_secret)
-            )
+                "azure_workspace_resource_id",
+                azure_workspace_resource_id,
+            ),
+            ("azure_client_secret", azure_client_secret),
+            ("azure_client_id", azure_client_id),
+            ("azure_tenant_id", azure_tenant_id),
+            ("azure_environment", azure_environment),
+            ("auth_type", auth_type),
+            ("cluster_id", cluster_id),
+            ("google_credentials", google_credentials),
+            ("google_service_account", google_service_account),
+            ("debug_truncate_bytes", debug_truncate_bytes),
+            ("debug_headers", debug_headers),
+            ("product", product),
+            ("product_version", product_version),
+            ("credentials_strategy", credentials_strategy),
+            ("credentials_provider", credentials_provider),
+            ("token_audience", token_audience),
+            ("config", config),
+            ("scopes", scopes),
+            ("authorization_details", authorization_details),
         )
-    ):
-        with suppress(
-            CalledProcessError,
-            FileNotFoundError,
-            DatabricksCLINotInstalledError,
+        if (parameter_name in _WORKSPACE_CLIENT_PARAMETERS)
+        and (argument is not None)
+    }
+    return _get_pooled_workspace_client(
+        _get_workspace_client_key(arguments, env), arguments, env
+    )
+
+
+def _create_pooled_workspace_client(
+    key: _WorkspaceClientKey,
+    arguments: Mapping[str, Any],
+    env: Mapping[str, str],
+) -> _PooledWorkspaceClient:
+    """
+    Construct a workspace client to be pooled under `key`, and register the
+    handle as which it is pickled.
+    """
+    client: WorkspaceClient = _create_workspace_client(arguments, env)
+    name: str
+    pooled: _PooledWorkspaceClient = _PooledWorkspaceClient(
+        client,
+        client.dbutils,
+        time(),
+        arguments,
+        {
+            name: env[name]
+            for name in _WORKSPACE_CLIENT_ENVIRONMENT_VARIABLES
+            if name in env
+        },
+    )
+    if not key.objects:
+        with _WORKSPACE_CLIENTS_LOCK:
+            _WORKSPACE_CLIENT_HANDLES[client] = _WorkspaceClientHandle(
+                key, pooled.arguments
+            )
+    return pooled
+
+
+def _get_pooled_workspace_client(
+    key: _WorkspaceClientKey,
+    arguments: Mapping[str, Any],
+    env: Mapping[str, str],
+) -> _PooledWorkspaceClient:
+    """
+    Get the workspace client pooled under `key`, constructing one from
+    `arguments` and `env` if none is pooled (or the pooled client has
+    expired).
+    """
+    pooled: _PooledWorkspaceClient | None
+    lock: threading.Lock
+    with _WORKSPACE_CLIENTS_LOCK:
+        pooled = _WORKSPACE_CLIENTS.get(key)
+        if pooled and (time() - pooled.created < _WORKSPACE_CLIENT_LIFETIME):
+            _WORKSPACE_CLIENTS.move_to_end(key)
+            return pooled
+        lock = _WORKSPACE_CLIENT_LOCKS.setdefault(key, threading.Lock())
+    with lock:
+        # Another thread may have constructed the client while we waited
+        with _WORKSPACE_CLIENTS_LOCK:
+            pooled = _WORKSPACE_CLIENTS.get(key)
+        if not (
+            pooled and (time() - pooled.created < _WORKSPACE_CLIENT_LIFETIME)
         ):
-            databricks_auth_login(host=host, profile=profile)
-    environ: Mapping[str, str] = os.environ.copy() if profile else os.environ
-    try:
-        if profile:  # pragma: no cover
-            # If a profile was explicitly provided, ensure it is used,
-            # and environment variables are ignored
-            key: str
-            for key in os.environ:
-                if key.startswith("DATABRICKS_"):
-                    os.environ.pop(key, None)
-        parameter_name: str
-        argument: Any
-        client: WorkspaceClient = WorkspaceClient(
-            **{  # type: ignore[arg-type]
-                parameter_name: argument
-                for parameter_name, argument in (
-                    ("host", host),
-                    ("account_id", account_id),
-                    ("username", username),
-                    ("password", password),
-                    ("client_id", client_id),
-                    ("client_secret", client_secret),
-                    ("token", token),
-                    ("profile", profile),
-                    ("config_file", config_file),
-                    (
-                        "azure_workspace_resource_id",
-                        azure_workspace_resource_id,
-                    ),
-                    ("azure_client_secret", azure_client_secret),
-                    ("azure_client_id", azure_client_id),
-                    ("azure_tenant_id", azure_tenant_id),
-                    ("azure_environment", azure_environment),
-                    ("auth_type", auth_type),
-                    ("cluster_id", cluster_id),
-                    ("google_credentials", google_credentials),
-                    ("google_service_account", google_service_account),
-                    ("debug_truncate_bytes", debug_truncate_bytes),
-                    ("debug_headers", debug_headers),
-                    ("product", product),
-                    ("product_version", product_version),
-                    ("credentials_strategy", credentials_strategy),
-                    ("credentials_provider", credentials_provider),
-                    ("token_audience", token_audience),
-                    ("config", config),
-                    ("scopes", scopes),
-                    ("authorization_details", authorization_details),
-                )
-                if parameter_name
-                in inspect.signature(WorkspaceClient.__init__).parameters
-                and (argument is not None)
-            }
-        )
-    finally:
-        if profile:  # pragma: no cover
-            # Restore the original environment if a profile was used
-            os.environ.update(environ)
-    return client
+            pooled = _create_pooled_workspace_client(key, arguments, env)
+            with _WORKSPACE_CLIENTS_LOCK:
+                _WORKSPACE_CLIENTS[key] = pooled
+                _WORKSPACE_CLIENTS.move_to_end(key)
+                while len(_WORKSPACE_CLIENTS) > _WORKSPACE_CLIENT_POOL_SIZE:
+                    _WORKSPACE_CLIENT_LOCKS.pop(
+                        _WORKSPACE_CLIENTS.popitem(last=False)[0], None
+                    )
+            # Track the expiry of the client's OAuth token (if it has one),
+            # and refresh it in the background
+            _WORKSPACE_CLIENT_REFRESHER.schedule(key, pooled)
+    return pooled
+
+
+def _resolve_workspace_client_handle(
+    handle: _WorkspaceClientHandle,
+) -> WorkspaceClient:
+    """
+    Resolve an unpickled handle to a client from this process's pool,
+    constructing one if none is pooled.
+    """
+    name: str
+    value: str | None
+    arguments: dict[str, Any] = {
+        **{
+            name: value
+            for name, value in (
+                ("host", handle.key.host),
+                ("auth_type", handle.key.auth_type),
+            )
+            if value
+        },
+        **handle.arguments,
+    }
+    return _get_pooled_workspace_client(
+        handle.key, arguments, os.environ
+    ).client
 
 
 def get_databricks_workspace_client(
@@ -622,8 +1449,16 @@ def get_databricks_workspace_client(
 ) -> WorkspaceClient:
     """
     Get a Databricks WorkspaceClient configured from environment variables.
+    Clients are pooled, and reused for the same configuration.
+
+    If a `profile` is specified, the client authenticates using the
+    profile's host and credentials, regardless of any `DATABRICKS_*`
+    environment variables. Settings which the profile does not specify,
+    and which are unrelated to authentication (such as
+    `DATABRICKS_CLUSTER_ID`, `DATABRICKS_ACCOUNT_ID`, or
+    `DATABRICKS_WAREHOUSE_ID`), are still read from environment variables.
     """
-    return _get_env_databricks_workspace_client(
+    return _get_pooled_databricks_workspace_client(
         host=host,
         account_id=account_id,
         username=username,
@@ -650,8 +1485,8 @@ def get_databricks_workspace_client(
         credentials_provider=credentials_provider,
         token_audience=token_audience,
         config=config,
-        **os.environ,
-    )
+        env=os.environ,
+    ).client
 
 
 def get_dbutils(
@@ -715,37 +1550,35 @@ def get_dbutils(
     dbutils = globals().get("dbutils")
     if dbutils is not None:
         return dbutils
-    databricks_workspace_client: WorkspaceClient = (
-        get_databricks_workspace_client(
-            host=host,
-            account_id=account_id,
-            username=username,
-            password=password,
-            client_id=client_id,
-            client_secret=client_secret,
-            token=token,
-            profile=profile,
-            config_file=config_file,
-            azure_workspace_resource_id=azure_workspace_resource_id,
-            azure_client_secret=azure_client_secret,
-            azure_client_id=azure_client_id,
-            azure_tenant_id=azure_tenant_id,
-            azure_environment=azure_environment,
-            auth_type=auth_type,
-            cluster_id=cluster_id,
-            google_credentials=google_credentials,
-            google_service_account=google_service_account,
-            debug_truncate_bytes=debug_truncate_bytes,
-            debug_headers=debug_headers,
-            product=product,
-            product_version=product_version,
-            credentials_strategy=credentials_strategy,
-            credentials_provider=credentials_provider,
-            token_audience=token_audience,
-            config=config,
-        )
-    )
-    return databricks_workspace_client.dbutils
+    return _get_pooled_databricks_workspace_client(
+        host=host,
+        account_id=account_id,
+        username=username,
+        password=password,
+        client_id=client_id,
+        client_secret=client_secret,
+        token=token,
+        profile=profile,
+        config_file=config_file,
+        azure_workspace_resource_id=azure_workspace_resource_id,
+        azure_client_secret=azure_client_secret,
+        azure_client_id=azure_client_id,
+        azure_tenant_id=azure_tenant_id,
+        azure_environment=azure_environment,
+        auth_type=auth_type,
+        cluster_id=cluster_id,
+        google_credentials=google_credentials,
+        google_service_account=google_service_account,
+        debug_truncate_bytes=debug_truncate_bytes,
+        debug_headers=debug_headers,
+        product=product,
+        product_version=product_version,
+        credentials_strategy=credentials_strategy,
+        credentials_provider=credentials_provider,
+        token_audience=token_audience,
+        config=config,
+        env=os.environ,
+    ).dbutils
 
 
 @cache
@@ -880,6 +1713,9 @@ def get_databricks_secret(
         token_audience: A token audience for the SDK.
         config: A Databricks SDK Config instance.
     """
+    bundled: str | None = _get_bundled_databricks_secret(scope, key, host)
+    if bundled is not None:
+        return bundled
     return _get_secret(
         scope,
         key,
@@ -913,6 +1749,613 @@ def get_databricks_secret(
     )
 
 
+def get_databricks_secrets(
+    scope: str,
+    keys: Iterable[str] | None = None,
+    host: str | None = None,
+    account_id: str | None = None,
+    username: str | None = None,
+    password: str | None = None,
+    client_id: str | None = None,
+    client_secret: str | None = None,
+    token: str | None = None,
+    profile: str | None = None,
+    config_file: str | None = None,
+    azure_workspace_resource_id: str | None = None,
+    azure_client_secret: str | None = None,
+    azure_client_id: str | None = None,
+    azure_tenant_id: str | None = None,
+    azure_environment: str | None = None,
+    auth_type: str | None = None,
+    cluster_id: str | None = None,
+    google_credentials: str | None = None,
+    google_service_account: str | None = None,
+    debug_truncate_bytes: int | None = None,
+    *,
+    debug_headers: bool | None = None,
+    product: str = "unknown",
+    product_version: str = "0.0.0",
+    credentials_strategy: CredentialsStrategy | None = None,
+    credentials_provider: CredentialsStrategy | None = None,
+    token_audience: str | None = None,
+    config: Config | None = None,
+) -> dict[str, str | Exception]:
+    """
+    Get multiple secrets from a Databricks secret scope, concurrently, using
+    a bounded pool of worker threads which share one authenticated
+    workspace client. Retrieved secrets are cached, as for
+    `get_databricks_secret`, and secrets installed from a bundle (see
+    `get_databricks_secrets_bundle`) are used without retrieving them (or,
+    if all of the requested keys are bundled, constructing a client).
+
+    Parameters:
+        scope: The Databricks secret scope.
+        keys: The Databricks secret keys. If not provided, all of the keys
+            in the scope are listed and retrieved.
+        host: A Databricks workspace host URL.
+        account_id: A Databricks account ID.
+        username: A Databricks username.
+        password: A Databricks password.
+        client_id: A Databricks OAuth2 Client ID.
+        client_secret: A Databricks OAuth2 Client Secret.
+        token: A Databricks Personal Access Token.
+        profile: A Databricks Configuration Profile.
+        config_file: A Databricks Configuration File path.
+        azure_workspace_resource_id: An Azure Databricks Workspace Resource ID.
+        azure_client_secret: An Azure Client Secret for Azure Databricks auth.
+        azure_client_id: An Azure Client ID for Azure Databricks auth.
+        azure_tenant_id: An Azure Tenant ID for Azure Databricks auth.
+        azure_environment: An Azure Environment for Azure Databricks auth.
+        auth_type: A Databricks authentication type.
+        cluster_id: A Databricks cluster ID.
+        google_credentials: Google Cloud credentials for GCP Databricks auth.
+        google_service_account: A Google Service Account for GCP Databricks
+            auth.
+        debug_truncate_bytes: Number of bytes to truncate in debug logs.
+        debug_headers: Whether to enable debug logging of HTTP headers.
+        product: The product name using the SDK.
+        product_version: The product version using the SDK.
+        credentials_strategy: A credentials strategy for the SDK.
+        credentials_provider: A credentials provider for the SDK.
+        token_audience: A token audience for the SDK.
+        config: A Databricks SDK Config instance.
+
+    Returns:
+        A dictionary mapping each key to its secret value, or to the
+        exception raised when retrieving it.
+    """
+    arguments: dict[str, Any] = {
+        "host": host,
+        "account_id": account_id,
+        "username": username,
+        "password": password,
+        "client_id": client_id,
+        "client_secret": client_secret,
+        "token": token,
+        "profile": profile,
+        "config_file": config_file,
+        "azure_workspace_resource_id": azure_workspace_resource_id,
+        "azure_client_secret": azure_client_secret,
+        "azure_client_id": azure_client_id,
+        "azure_tenant_id": azure_tenant_id,
+        "azure_environment": azure_environment,
+        "auth_type": auth_type,
+        "cluster_id": cluster_id,
+        "google_credentials": google_credentials,
+        "google_service_account": google_service_account,
+        "debug_truncate_bytes": debug_truncate_bytes,
+        "debug_headers": debug_headers,
+        "product": product,
+        "product_version": product_version,
+        "credentials_strategy": credentials_strategy,
+        "credentials_provider": credentials_provider,
+        "token_audience": token_audience,
+        "config": config,
+    }
+    bundled: dict[str, str] = {}
+    if keys is not None:
+        keys = tuple(dict.fromkeys(keys))
+        bundled = _get_bundled_databricks_secrets(scope, keys, host)
+        if len(bundled) == len(keys):
+            return dict(bundled)
+    # Authenticate (and construct the shared workspace client) once, before
+    # secrets are retrieved concurrently
+    dbutils: RemoteDbUtils = get_dbutils(**arguments)
+    if keys is None:
+        keys = tuple(
+            dict.fromkeys(
+                metadata.key for metadata in dbutils.secrets.list(scope)
+            )
+        )
+        bundled = _get_bundled_databricks_secrets(scope, keys, host)
+    key: str
+    retrieved_keys: tuple[str, ...] = tuple(
+        key for key in keys if key not in bundled
+    )
+    if not retrieved_keys:
+        return dict(bundled)
+    get_secret: partial[str] = partial(
+        _get_secret, scope, **arguments, **os.environ
+    )
+
+    def get_secret_or_error(key: str) -> str | Exception:
+        try:
+            return get_secret(key)
+        except Exception as error:  # noqa: BLE001
+            return error
+
+    secrets: dict[str, str | Exception] = dict(bundled)
+    with ThreadPoolExecutor(
+        max_workers=min(len(retrieved_keys), _DATABRICKS_MAX_WORKERS)
+    ) as executor:
+        secrets.update(
+            zip(
+                retrieved_keys,
+                executor.map(get_secret_or_error, retrieved_keys),
+                strict=True,
+            )
+        )
+    return {key: secrets[key] for key in keys}
+
+
+# Secrets installed from bundles (see `get_databricks_secrets_bundle`),
+# keyed by scope and key, with the host from which each was retrieved (if it
+# was specified explicitly)
+_DATABRICKS_BUNDLED_SECRETS: dict[tuple[str, str], tuple[str | None, str]] = {}
+# Bundles unpickled in this process, which are installed when a secret is
+# first looked up, and the identifiers of those which have been installed
+_DATABRICKS_PENDING_BUNDLES: dict[str, DatabricksSecretsBundle] = {}
+_DATABRICKS_INSTALLED_BUNDLES: set[str] = set()
+_DATABRICKS_BUNDLES_LOCK: threading.Lock = threading.Lock()
+# The environment variable from which the key used to encrypt and decrypt
+# bundles is read, if not provided explicitly
+_DATABRICKS_SECRETS_BUNDLE_KEY_VARIABLE: str = "DECORATIVE_SECRETS_BUNDLE_KEY"
+
+
+def _get_databricks_secrets_bundle_fernet(
+    encryption_key: bytes | str | None = None,
+) -> Fernet:
+    from cryptography.fernet import Fernet  # noqa: PLC0415
+
+    encryption_key = encryption_key or os.getenv(
+        _DATABRICKS_SECRETS_BUNDLE_KEY_VARIABLE
+    )
+    if not encryption_key:
+        message: str = (
+            "A key is required to encrypt or decrypt a Databricks secrets "
+            "bundle: either pass `encryption_key`, or set the "
+            f"`{_DATABRICKS_SECRETS_BUNDLE_KEY_VARIABLE}` environment "
+            "variable (for both the driver and workers) to a key generated "
+            "using `cryptography.fernet.Fernet.generate_key()`"
+        )
+        raise ValueError(message)
+    return Fernet(encryption_key)
+
+
+def _load_databricks_secrets_bundle(
+    identifier: str, host: str | None, ciphertext: bytes
+) -> DatabricksSecretsBundle:
+    """
+    Unpickle a secrets bundle, deferring its installation until a secret is
+    first looked up.
+    """
+    bundle: DatabricksSecretsBundle = DatabricksSecretsBundle(
+        identifier, host, ciphertext
+    )
+    with _DATABRICKS_BUNDLES_LOCK:
+        if identifier not in _DATABRICKS_INSTALLED_BUNDLES:
+            _DATABRICKS_PENDING_BUNDLES.setdefault(identifier, bundle)
+    return bundle
+
+
+@dataclass(frozen=True)
+class DatabricksSecretsBundle:
+    """
+    Databricks secrets, resolved once (for example, in a Spark driver) and
+    encrypted, to be shipped to worker processes (for example, in a
+    function passed to `mapPartitions`, or as an argument to a
+    `multiprocessing` or `joblib` task).
+
+    When a bundle is unpickled, it is installed into the unpickling
+    process's secret cache the first time a Databricks secret is looked up,
+    decrypting it using the key in the `DECORATIVE_SECRETS_BUNDLE_KEY`
+    environment variable. Bundled secrets are then retrieved by
+    `get_databricks_secret` (and functions decorated with
+    `apply_databricks_secrets_arguments`) without a workspace client. If
+    the bundle cannot be decrypted (for example, because the key is not
+    set), a warning is logged, the bundle is discarded, and secrets are
+    retrieved from Databricks instead.
+
+    Attributes:
+        identifier: A unique identifier for the bundle.
+        host: The workspace host URL from which the secrets were retrieved,
+            if specified explicitly. Bundled secrets are only used for
+            lookups specifying no host, or the same host.
+        ciphertext: The secrets, encrypted using
+            [Fernet](https://cryptography.io/en/latest/fernet/).
+    """
+
+    identifier: str
+    host: str | None
+    ciphertext: bytes = field(repr=False)
+
+    def __reduce__(
+        self,
+    ) -> tuple[Callable[..., DatabricksSecretsBundle], tuple]:
+        return (
+            _load_databricks_secrets_bundle,
+            (self.identifier, self.host, self.ciphertext),
+        )
+
+    def install(self, encryption_key: bytes | str | None = None) -> None:
+        """
+        Decrypt the bundle, and install its secrets into this process's
+        secret cache. This is done automatically for unpickled bundles, and
+        has no effect if the bundle is already installed.
+
+        Parameters:
+            encryption_key: The key with which the bundle was encrypted. If
+                not provided, the key is read from the
+                `DECORATIVE_SECRETS_BUNDLE_KEY` environment variable.
+
+        Raises:
+            ValueError: If no key is available.
+            cryptography.fernet.InvalidToken: If the bundle was not
+                encrypted with the key.
+        """
+        with _DATABRICKS_BUNDLES_LOCK:
+            if self.identifier in _DATABRICKS_INSTALLED_BUNDLES:
+                return
+        secrets: list[tuple[str, str, str]] = json.loads(
+            _get_databricks_secrets_bundle_fernet(encryption_key).decrypt(
+                self.ciphertext
+            )
+        )
+        scope: str
+        key: str
+        value: str
+        with _DATABRICKS_BUNDLES_LOCK:
+            for scope, key, value in secrets:
+                _DATABRICKS_BUNDLED_SECRETS[(scope, key)] = (self.host, value)
+            _DATABRICKS_INSTALLED_BUNDLES.add(self.identifier)
+            _DATABRICKS_PENDING_BUNDLES.pop(self.identifier, None)
+
+
+def _get_bundled_databricks_secret(
+    scope: str, key: str, host: str | None = None
+) -> str | None:
+    """
+    Get a secret installed from a bundle, first installing any bundles
+    unpickled since the last lookup. Bundles which cannot be installed are
+    discarded, and secrets which are not bundled are not returned, so that
+    they are retrieved from Databricks instead.
+    """
+    bundle: DatabricksSecretsBundle
+    for bundle in tuple(_DATABRICKS_PENDING_BUNDLES.values()):
+        try:
+            bundle.install()
+        except Exception as error:  # noqa: BLE001
+            with _DATABRICKS_BUNDLES_LOCK:
+                _DATABRICKS_PENDING_BUNDLES.pop(bundle.identifier, None)
+            _get_log().warning(
+                "Installing Databricks secrets bundle %s failed, so its "
+                "secrets will be retrieved from Databricks: %s: %s",
+                bundle.identifier,
+                type(error).__name__,
+                error,
+            )
+    bundled: tuple[str | None, str] | None = _DATABRICKS_BUNDLED_SECRETS.get(
+        (scope, key)
+    )
+    if bundled is None:
+        return None
+    bundle_host: str | None
+    value: str
+    bundle_host, value = bundled
+    if (
+        bundle_host
+        and host
+        and (
+            _normalize_databricks_host(bundle_host).lower()
+            != _normalize_databricks_host(host).lower()
+        )
+    ):
+        return None
+    return value
+
+
+def _get_bundled_databricks_secrets(
+    scope: str, keys: Iterable[str], host: str | None = None
+) -> dict[str, str]:
+    """
+    Get those of the specified secrets which are installed from a bundle.
+    """
+    key: str
+    bundled: dict[str, str] = {}
+    for key in keys:
+        value: str | None = _get_bundled_databricks_secret(scope, key, host)
+        if value is not None:
+            bundled[key] = value
+    return bundled
+
+
+def get_databricks_secrets_bundle(
+    scope_keys: Iterable[tuple[str, str]],
+    encryption_key: bytes | str | None = None,
+    host: str | None = None,
+    account_id: str | None = None,
+    username: str | None = None,
+    password: str | None = None,
+    client_id: str | None = None,
+    client_secret: str | None = None,
+    token: str | None = None,
+    profile: str | None = None,
+    config_file: str | None = None,
+    azure_workspace_resource_id: str | None = None,
+    azure_client_secret: str | None = None,
+    azure_client_id: str | None = None,
+    azure_tenant_id: str | None = None,
+    azure_environment: str | None = None,
+    auth_type: str | None = None,
+    cluster_id: str | None = None,
+    google_credentials: str | None = None,
+    google_service_account: str | None = None,
+    debug_truncate_bytes: int | None = None,
+    *,
+    debug_headers: bool | None = None,
+    product: str = "unknown",
+    product_version: str = "0.0.0",
+    credentials_strategy: CredentialsStrategy | None = None,
+    credentials_provider: CredentialsStrategy | None = None,
+    token_audience: str | None = None,
+    config: Config | None = None,
+) -> DatabricksSecretsBundle:
+    """
+    Retrieve a declared set of Databricks secrets once (for example, in a
+    Spark driver), and encrypt them in a bundle to be shipped to worker
+    processes, so that tasks run in those processes look up the secrets
+    without calling Databricks. This requires the
+    [cryptography](https://cryptography.io/) package.
+
+    Parameters:
+        scope_keys: The (scope, key) tuples identifying the secrets to
+            bundle.
+        encryption_key: A key, generated using
+            `cryptography.fernet.Fernet.generate_key()`, with which to
+            encrypt the bundle. If not provided, the key is read from the
+            `DECORATIVE_SECRETS_BUNDLE_KEY` environment variable. Workers
+            decrypt the bundle using the key in the same environment
+            variable, so it must be set for the workers (for example,
+            using the `spark.executorEnv.DECORATIVE_SECRETS_BUNDLE_KEY`
+            Spark configuration property).
+        host: A Databricks workspace host URL.
+        account_id: A Databricks account ID.
+        username: A Databricks username.
+        password: A Databricks password.
+        client_id: A Databricks OAuth2 Client ID.
+        client_secret: A Databricks OAuth2 Client Secret.
+        token: A Databricks Personal Access Token.
+        profile: A Databricks Configuration Profile.
+        config_file: A Databricks Configuration File path.
+        azure_workspace_resource_id: An Azure Databricks Workspace Resource ID.
+        azure_client_secret: An Azure Client Secret for Azure Databricks auth.
+        azure_client_id: An Azure Client ID for Azure Databricks auth.
+        azure_tenant_id: An Azure Tenant ID for Azure Databricks auth.
+        azure_environment: An Azure Environment for Azure Databricks auth.
+        auth_type: A Databricks authentication type.
+        cluster_id: A Databricks cluster ID.
+        google_credentials: Google Cloud credentials for GCP Databricks auth.
+        google_service_account: A Google Service Account for GCP Databricks
+            auth.
+        debug_truncate_bytes: Number of bytes to truncate in debug logs.
+        debug_headers: Whether to enable debug logging of HTTP headers.
+        product: The product name using the SDK.
+        product_version: The product version using the SDK.
+        credentials_strategy: A credentials strategy for the SDK.
+        credentials_provider: A credentials provider for the SDK.
+        token_audience: A token audience for the SDK.
+        config: A Databricks SDK Config instance.
+
+    Example:
+        ```python
+        from decorative_secrets.databricks import (
+            DatabricksSecretsBundle,
+            get_databricks_secret,
+            get_databricks_secrets_bundle,
+        )
+
+        bundle: DatabricksSecretsBundle = get_databricks_secrets_bundle(
+            [("client", "client-id"), ("client", "client-secret")]
+        )
+
+
+        # Referencing the bundle ships it to workers with the function
+        def process_partition(rows, bundle=bundle):
+            # The bundle is installed by the first lookup, so this does not
+            # call Databricks
+            client_id: str = get_databricks_secret("client", "client-id")
+            ...
+
+
+        rdd.mapPartitions(process_partition)
+        ```
+
+    Raises:
+        ValueError: If no encryption key is available.
+    """
+    fernet: Fernet = _get_databricks_secrets_bundle_fernet(encryption_key)
+    keys_by_scope: dict[str, list[str]] = {}
+    scope: str
+    key: str
+    for scope, key in scope_keys:
+        keys_by_scope.setdefault(scope, []).append(key)
+    secrets: list[tuple[str, str, str]] = []
+    keys: list[str]
+    for scope, keys in keys_by_scope.items():
+        value: str | Exception
+        for key, value in get_databricks_secrets(
+            scope,
+            keys,
+            host=host,
+            account_id=account_id,
+            username=username,
+            password=password,
+            client_id=client_id,
+            client_secret=client_secret,
+            token=token,
+            profile=profile,
+            config_file=config_file,
+            azure_workspace_resource_id=azure_workspace_resource_id,
+            azure_client_secret=azure_client_secret,
+            azure_client_id=azure_client_id,
+            azure_tenant_id=azure_tenant_id,
+            azure_environment=azure_environment,
+            auth_type=auth_type,
+            cluster_id=cluster_id,
+            google_credentials=google_credentials,
+            google_service_account=google_service_account,
+            debug_truncate_bytes=debug_truncate_bytes,
+            debug_headers=debug_headers,
+            product=product,
+            product_version=product_version,
+            credentials_strategy=credentials_strategy,
+            credentials_provider=credentials_provider,
+            token_audience=token_audience,
+            config=config,
+        ).items():
+            if isinstance(value, Exception):
+                raise value
+            secrets.append((scope, key, value))
+    return DatabricksSecretsBundle(
+        uuid4().hex,
+        host,
+        fernet.encrypt(json.dumps(secrets).encode()),
+    )
+
+
+async def async_get_databricks_secret(
+    scope: str,
+    key: str,
+    host: str | None = None,
+    account_id: str | None = None,
+    username: str | None = None,
+    password: str | None = None,
+    client_id: str | None = None,
+    client_secret: str | None = None,
+    token: str | None = None,
+    profile: str | None = None,
+    config_file: str | None = None,
+    azure_workspace_resource_id: str | None = None,
+    azure_client_secret: str | None = None,
+    azure_client_id: str | None = None,
+    azure_tenant_id: str | None = None,
+    azure_environment: str | None = None,
+    auth_type: str | None = None,
+    cluster_id: str | None = None,
+    google_credentials: str | None = None,
+    google_service_account: str | None = None,
+    debug_truncate_bytes: int | None = None,
+    *,
+    debug_headers: bool | None = None,
+    product: str = "unknown",
+    product_version: str = "0.0.0",
+    credentials_strategy: CredentialsStrategy | None = None,
+    credentials_provider: CredentialsStrategy | None = None,
+    token_audience: str | None = None,
+    config: Config | None = None,
+) -> str:
+    """
+    Get a secret from Databricks without blocking the event loop.
+
+    The Databricks SDK is synchronous, so secrets are retrieved using a
+    bounded pool of worker threads, and concurrent lookups of the same
+    secret share a single retrieval.
+
+    Parameters:
+        scope: The Databricks secret scope.
+        key: The Databricks secret key.
+        host: A Databricks workspace host URL.
+        account_id: A Databricks account ID.
+        username: A Databricks username.
+        password: A Databricks password.
+        client_id: A Databricks OAuth2 Client ID.
+        client_secret: A Databricks OAuth2 Client Secret.
+        token: A Databricks Personal Access Token.
+        profile: A Databricks Configuration Profile.
+        config_file: A Databricks Configuration File path.
+        azure_workspace_resource_id: An Azure Databricks Workspace Resource ID.
+        azure_client_secret: An Azure Client Secret for Azure Databricks auth.
+        azure_client_id: An Azure Client ID for Azure Databricks auth.
+        azure_tenant_id: An Azure Tenant ID for Azure Databricks auth.
+        azure_environment: An Azure Environment for Azure Databricks auth.
+        auth_type: A Databricks authentication type.
+        cluster_id: A Databricks cluster ID.
+        google_credentials: Google Cloud credentials for GCP Databricks auth.
+        google_service_account: A Google Service Account for GCP Databricks
+            auth.
+        debug_truncate_bytes: Number of bytes to truncate in debug logs.
+        debug_headers: Whether to enable debug logging of HTTP headers.
+        product: The product name using the SDK.
+        product_version: The product version using the SDK.
+        credentials_strategy: A credentials strategy for the SDK.
+        credentials_provider: A credentials provider for the SDK.
+        token_audience: A token audience for the SDK.
+        config: A Databricks SDK Config instance.
+    """
+    bundled: str | None = _get_bundled_databricks_secret(scope, key, host)
+    if bundled is not None:
+        return bundled
+    get_secret: partial[str] = partial(
+        _get_secret,
+        scope,
+        key,
+        host=host,
+        account_id=account_id,
+        username=username,
+        password=password,
+        client_id=client_id,
+        client_secret=client_secret,
+        token=token,
+        profile=profile,
+        config_file=config_file,
+        azure_workspace_resource_id=azure_workspace_resource_id,
+        azure_client_secret=azure_client_secret,
+        azure_client_id=azure_client_id,
+        azure_tenant_id=azure_tenant_id,
+        azure_environment=azure_environment,
+        auth_type=auth_type,
+        cluster_id=cluster_id,
+        google_credentials=google_credentials,
+        google_service_account=google_service_account,
+        debug_truncate_bytes=debug_truncate_bytes,
+        debug_headers=debug_headers,
+        product=product,
+        product_version=product_version,
+        credentials_strategy=credentials_strategy,
+        credentials_provider=credentials_provider,
+        token_audience=token_audience,
+        config=config,
+        **os.environ,
+    )
+    pending_lookups: dict[Hashable, Any] = get_event_loop_objects()
+    pending_key: tuple[Hashable, ...] = (
+        "async_get_databricks_secret",
+        get_secret.args,
+        frozenset(get_secret.keywords.items()),
+    )
+    pending: asyncio.Future[str] | None = pending_lookups.get(pending_key)
+    if pending is None:
+        pending = pending_lookups[pending_key] = (
+            asyncio.get_running_loop().run_in_executor(
+                _DATABRICKS_EXECUTOR, get_secret
+            )
+        )
+        pending.add_done_callback(
+            lambda _: pending_lookups.pop(pending_key, None)
+        )
+    return await asyncio.shield(pending)
+
+
 def _get_scope_key_secret(
     scope_key: tuple[str, str] | str,
     host: str | None = None,
@@ -976,6 +2419,69 @@ def _get_scope_key_secret(
     )
 
 
+async def _async_get_scope_key_secret(
+    scope_key: tuple[str, str] | str,
+    host: str | None = None,
+    account_id: str | None = None,
+    username: str | None = None,
+    password: str | None = None,
+    client_id: str | None = None,
+    client_secret: str | None = None,
+    token: str | None = None,
+    profile: str | None = None,
+    config_file: str | None = None,
+    azure_workspace_resource_id: str | None = None,
+    azure_client_secret: str | None = None,
+    azure_client_id: str | None = None,
+    azure_tenant_id: str | None = None,
+    azure_environment: str | None = None,
+    auth_type: str | None = None,
+    cluster_id: str | None = None,
+    google_credentials: str | None = None,
+    google_service_account: str | None = None,
+    debug_truncate_bytes: int | None = None,
+    *,
+    debug_headers: bool | None = None,
+    product: str = "unknown",
+    product_version: str = "0.0.0",
+    credentials_strategy: CredentialsStrategy | None = None,
+    credentials_provider: CredentialsStrategy | None = None,
+    token_audience: str | None = None,
+    config: Config | None = None,
+) -> str:
+    if isinstance(scope_key, str):  # pragma: no cover
+        scope_key = scope_key.partition("/")[::2]
+    return await async_get_databricks_secret(
+        *scope_key,
+        host=host,
+        account_id=account_id,
+        username=username,
+        password=password,
+        client_id=client_id,
+        client_secret=client_secret,
+        token=token,
+        profile=profile,
+        config_file=config_file,
+        azure_workspace_resource_id=azure_workspace_resource_id,
+        azure_client_secret=azure_client_secret,
+        azure_client_id=azure_client_id,
+        azure_tenant_id=azure_tenant_id,
+        azure_environment=azure_environment,
+        auth_type=auth_type,
+        cluster_id=cluster_id,
+        google_credentials=google_credentials,
+        google_service_account=google_service_account,
+        debug_truncate_bytes=debug_truncate_bytes,
+        debug_headers=debug_headers,
+        product=product,
+        product_version=product_version,
+        credentials_strategy=credentials_strategy,
+        credentials_provider=credentials_provider,
+        token_audience=token_audience,
+        config=config,
+    )
+
+
 def _get_args_options(
     *args: Any,
 ) -> tuple[tuple[Any, ...], DatabricksWorkspaceClientArguments | None]:
@@ -2,48 +2,289 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import hashlib
+import json
 import os
+import re
 import sys
-from contextlib import suppress
-from dataclasses import dataclass
-from functools import cache, partial
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from fnmatch import fnmatchcase
+from functools import cache, partial, wraps
 from importlib.metadata import distribution
+from inspect import Signature, signature
+from math import inf
+from pathlib import Path
+from secrets import token_hex
 from shutil import which
-from subprocess import CalledProcessError
-from typing import TYPE_CHECKING, Any
-from urllib.parse import ParseResult, urlparse
+from subprocess import CalledProcessError, TimeoutExpired
+from time import monotonic, time
+from typing import TYPE_CHECKING, Any, TypeVar, overload
+from urllib.parse import ParseResult, parse_qs, urlparse
 
-from async_lru import alru_cache
+from httpx import TransportError
 from onepassword.client import Client  # type: ignore[import-untyped]
+from onepassword.errors import (  # type: ignore[import-untyped]
+    RateLimitExceededException,
+)
 from onepasswordconnectsdk.client import (  # type: ignore[import-untyped]
     AsyncClient,
     Item,
+    SummaryItem,
+    Vault,
 )
 from onepasswordconnectsdk.client import (  # type: ignore[import-untyped]
     Client as ConnectClient,
 )
+from onepasswordconnectsdk.errors import (  # type: ignore[import-untyped]
+    FailedToRetrieveItemException,
+)
+from onepasswordconnectsdk.utils import (  # type: ignore[import-untyped]
+    is_valid_uuid,
+)
 
 from decorative_secrets._utilities import (  # type: ignore[import-untyped]
+    RateLimiter,
+    async_lock,
+    asyncio_run,
+    create_anonymous_file,
+    get_cache_directory,
+    get_event_loop_objects,
+    open_private_file,
+    unwrap_function,
     which_brew,
     which_winget,
+    write_private_file,
 )
 from decorative_secrets.callback import apply_callback_arguments
 from decorative_secrets.errors import (
+    InterfaceNotInstalledError,
     OnePasswordCommandLineInterfaceNotInstalledError,
     WinGetNotInstalledError,
 )
-from decorative_secrets.subprocess import check_output
+from decorative_secrets.subprocess import (
+    async_check_output,
+    async_check_stream,
+    check_output,
+    check_stream,
+)
+from decorative_secrets.utilities import as_tuple, iscoroutinefunction
+
+_T = TypeVar("_T")
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Coroutine, Iterable
+    from collections.abc import (
+        Awaitable,
+        Callable,
+        Coroutine,
+        Hashable,
+        Iterable,
+        Iterator,
+        Sequence,
+    )
+    from typing import BinaryIO
 
+    from httpx import Response
     from onepassword import Secrets  # type: ignore[import-untyped]
+    from onepassword.types import (  # type: ignore[import-untyped]
+        ItemsGetAllResponse,
+    )
     from onepasswordconnectsdk.models.field import (  # type: ignore[import-untyped]
         Field,
     )
+    from onepasswordconnectsdk.models.file import (  # type: ignore[import-untyped]
+        File,
+    )
 
 _INTEGRATION_NAME: str = "decorative-secrets"
 _INTEGRATION_VERSION: str = distribution("decorative-secrets").version
+# 1Password CLI sessions expire after 30 minutes of inactivity, so a session
+# is considered valid for 30 minutes (less a safety margin) from sign-in
+_OP_SESSION_LIFETIME: float = 30 * 60 - 60
+_OP_SESSION_PATTERN: re.Pattern = re.compile(
+    r"\b(OP_SESSION_\w+)=[\"']?([^\"'\s]+)"
+)
+_OP_SESSION_ERROR_MESSAGES: tuple[str, ...] = (
+    "not currently signed in",
+    "session expired",
+    "invalid session",
+)
+# Located executables, shared by `which_op` and `async_which_op`
+_WHICH: dict[str, str] = {}
+# Service account tokens are limited (depending on the account type) to as
+# many as 10,000 requests per hour, so a burst is allowed (for example, at
+# start-up), after which requests are spread across the hour. Should the
+# quota be lower, the rate is reduced further in response to rate-limit
+# errors, and the request is re-queued (up to a limited number of times).
+_RATE_LIMIT: float = 10_000 / 3600
+_RATE_LIMIT_BURST: int = 100
+_RATE_LIMIT_ATTEMPTS: int = 5
+# The longest pause (in seconds) honored from a `Retry-After` header
+_RATE_LIMIT_MAXIMUM_RETRY_AFTER: float = 60
+_RATE_LIMITERS: dict[str, RateLimiter] = {}
+_RATE_LIMITERS_LOCK: threading.Lock = threading.Lock()
+# Adaptive back-end selection is disabled by default (this is a list so that
+# it can be toggled by `set_adaptive_onepassword_backends`)
+_OP_ADAPTIVE_BACKENDS: list[bool] = [False]
+_OP_BACKEND_STATISTICS: dict[_OpBackend, _OpBackendStatistics] = {}
+_OP_BACKEND_STATISTICS_LOCK: threading.Lock = threading.Lock()
+# Error messages (or CLI output) matching this pattern indicate a back end
+# could not be reached or authenticated with, or failed, rather than that the
+# secret being read does not exist
+_OP_BACKEND_FAILURE_PATTERN: re.Pattern = re.compile(
+    r"received (?:401|403|429|5\d\d)\b|unauthori[sz]ed|unauthenticated|"
+    r"authenticat|forbidden|invalid token|not (?:currently )?signed in|"
+    r"session expired|timed? ?out|deadline exceeded|connection|dial tcp|"
+    r"no such host|network|unavailable|bad gateway|internal server error|"
+    r"rate limit",
+    re.IGNORECASE,
+)
+# The weight of each new measurement in back-end latency and error rate
+# moving averages
+_OP_BACKEND_ALPHA: float = 0.2
+# After a failure, a back end is considered unhealthy for this many seconds,
+# doubling with each consecutive failure up to the maximum
+_OP_BACKEND_COOLDOWN: float = 1
+_OP_BACKEND_MAXIMUM_COOLDOWN: float = 300
+# 1Password Connect vault names and item titles, mapped to IDs, keyed by
+# host and token (for vaults), or host, token, and vault ID (for items)
+_CONNECT_IDS: dict[tuple[str, ...], dict[str, str]] = {}
+# Items retrieved from 1Password Connect, keyed by host, token, vault ID, and
+# item ID, are used for at most this many seconds (or the cache policy TTL of
+# the secret being read, if shorter) before being revalidated
+_CONNECT_ITEM_TTL: float = 60
+# Prefetched vaults, keyed by account, token fingerprint, host, and vault ID
+# or name (so that a vault prefetched using one credential is never read
+# using another), with the time they were retrieved, mapping item IDs and
+# titles to field values and types, keyed by field ID and label (optionally
+# prefixed by a section ID or label)
+_OP_VAULTS: dict[
+    tuple[str | None, str | None, str | None, str],
+    tuple[float, dict[str, dict[str, tuple[str, str | None]]]],
+] = {}
+# Resolved secrets, keyed by resource and authentication arguments, with the
+# (monotonic) time at which they expire
+_OP_VALUES: dict[Hashable, tuple[str, float]] = {}
+# Field types observed when resolving secret references
+_OP_FIELD_TYPES: dict[str, str] = {}
+# Field type names differ between the 1Password CLI, SDK, and Connect
+_OP_FIELD_TYPE_ALIASES: dict[str, str] = {"TOTP": "OTP", "TEXT": "STRING"}
+_CONNECT_ITEMS: dict[tuple[str, str, str, str], _ConnectItem] = {}
+
+
+@dataclass(frozen=True)
+class OnePasswordCachePolicy:
+    """
+    A policy determining how long secrets read from 1Password are cached.
+
+    Parameters:
+        pattern: A shell-style pattern (see `fnmatch`) matched against
+            secret references. For example: "op://Vault Name/*".
+        ttl: The number of seconds for which matching secrets are cached.
+            `None` indicates secrets are cached indefinitely, and `0`
+            indicates they are never cached.
+        field_type: If provided, the policy only applies to fields of this
+            type (for example, "OTP" or "CONCEALED"), where the field type is
+            known (field types are known for fields in prefetched vaults, or
+            read using 1Password Connect).
+    """
+
+    pattern: str = "*"
+    ttl: float | None = None
+    field_type: str | None = None
+
+
+# The first matching policy applies, and secrets matching no policy are
+# cached indefinitely. One-time passwords are never cached.
+ONEPASSWORD_CACHE_POLICIES: list[OnePasswordCachePolicy] = [
+    OnePasswordCachePolicy("*[?&]attribute=otp*", ttl=0),
+    OnePasswordCachePolicy("*[?&]attribute=totp*", ttl=0),
+    OnePasswordCachePolicy(field_type="OTP", ttl=0),
+]
+
+
+def set_onepassword_cache_policy(
+    pattern: str = "*",
+    ttl: float | None = None,
+    field_type: str | None = None,
+) -> None:
+    """
+    Add a cache policy for 1Password secrets, taking precedence over all
+    existing policies. For example, to cache secrets in one vault for no
+    more than 5 minutes:
+
+    ```python
+    set_onepassword_cache_policy("op://Rotated Vault/*", ttl=300)
+    ```
+
+    Parameters:
+        pattern: A shell-style pattern (see `fnmatch`) matched against
+            secret references. For example: "op://Vault Name/*".
+        ttl: The number of seconds for which matching secrets are cached.
+            `None` indicates secrets are cached indefinitely, and `0`
+            indicates they are never cached.
+        field_type: If provided, the policy only applies to fields of this
+            type (for example, "OTP" or "CONCEALED").
+    """
+    ONEPASSWORD_CACHE_POLICIES.insert(
+        0, OnePasswordCachePolicy(pattern, ttl, field_type)
+    )
+
+
+def _normalize_field_type(field_type: Any) -> str | None:
+    """
+    Normalize a field type from the 1Password CLI, SDK, or Connect.
+    """
+    if field_type is None:
+        return None
+    name: str = str(getattr(field_type, "value", field_type)).upper()
+    return _OP_FIELD_TYPE_ALIASES.get(name, name)
+
+
+def _get_onepassword_cache_ttl(
+    resource: str, field_type: str | None = None
+) -> float | None:
+    """
+    Get the number of seconds for which a secret may be cached (`None`
+    indicating indefinitely), according to the first matching cache policy.
+    """
+    field_type = _normalize_field_type(
+        field_type or _OP_FIELD_TYPES.get(resource)
+    )
+    policy: OnePasswordCachePolicy
+    for policy in ONEPASSWORD_CACHE_POLICIES:
+        if (
+            (policy.field_type is None)
+            or (_normalize_field_type(policy.field_type) == field_type)
+        ) and fnmatchcase(resource, policy.pattern):
+            return policy.ttl
+    return None
+
+
+def _get_cached_onepassword_secret(key: Hashable) -> str | None:
+    cached: tuple[str, float] | None = _OP_VALUES.get(key)
+    if cached is None:
+        return None
+    if cached[1] <= monotonic():
+        _OP_VALUES.pop(key, None)
+        return None
+    return cached[0]
+
+
+def _set_cached_onepassword_secret(
+    key: Hashable, resource: str, value: str
+) -> None:
+    """
+    Cache a resolved secret, according to the applicable cache policy.
+    """
+    ttl: float | None = _get_onepassword_cache_ttl(resource)
+    if ttl is None:
+        _OP_VALUES[key] = (value, inf)
+    elif ttl > 0:
+        _OP_VALUES[key] = (value, monotonic() + ttl)
 
 
 def apply_onepassword_arguments(
@@ -115,6 +356,12 @@ def apply_onepassword_arguments(
     options: ApplyOnepasswordArgumentsOptions
     args, options = _get_args_options(*args)
     read_onepassword_secret_: Callable[..., str] = read_onepassword_secret
+    prefetch_onepassword_secrets: Callable[..., None] = (
+        _prefetch_onepassword_secrets
+    )
+    async_prefetch_onepassword_secrets: Callable[
+        ..., Coroutine[Any, Any, None]
+    ] = _async_prefetch_onepassword_secrets
     async_read_onepassword_secret_: Callable[
         [str, str | None, str | None, str | None], Coroutine[Any, Any, str]
     ] = async_read_onepassword_secret
@@ -135,11 +382,112 @@ def apply_onepassword_arguments(
             **({"token": options.token} if options.token else {}),
             **({"host": options.host} if options.host else {}),
         )
-    return apply_callback_arguments(
-        read_onepassword_secret_,
-        async_read_onepassword_secret_,
-        **kwargs,
+        prefetch_onepassword_secrets = partial(
+            prefetch_onepassword_secrets,
+            **({"account": options.account} if options.account else {}),
+            **({"token": options.token} if options.token else {}),
+            **({"host": options.host} if options.host else {}),
+        )
+        async_prefetch_onepassword_secrets = partial(
+            async_prefetch_onepassword_secrets,
+            **({"account": options.account} if options.account else {}),
+            **({"token": options.token} if options.token else {}),
+            **({"host": options.host} if options.host else {}),
+        )
+    decorating_function: Callable[..., Callable[..., Any]] = (
+        apply_callback_arguments(
+            read_onepassword_secret_,
+            async_read_onepassword_secret_,
+            **kwargs,
+        )
     )
+    if len(kwargs) < 2:  # noqa: PLR2004
+        return decorating_function
+    return partial(
+        _apply_prefetch_onepassword_arguments,
+        decorating_function,
+        prefetch_onepassword_secrets,
+        async_prefetch_onepassword_secrets,
+        kwargs,
+    )
+
+
+@as_tuple
+def _get_prefetch_resources(
+    function_signature: Signature,
+    parameter_names: dict[str, str],
+    arguments: dict[str, Any],
+) -> Iterable[str]:
+    """
+    Yield the 1Password resources which will be looked up for parameters
+    not explicitly passed an argument.
+    """
+    parameter_name: str
+    resource_parameter_name: str
+    for parameter_name, resource_parameter_name in parameter_names.items():
+        if arguments.get(parameter_name) is not None:
+            continue
+        resource: Any = arguments.get(resource_parameter_name)
+        if (resource is None) and (
+            resource_parameter_name in function_signature.parameters
+        ):
+            resource = function_signature.parameters[
+                resource_parameter_name
+            ].default
+        if isinstance(resource, str):
+            yield resource
+
+
+def _apply_prefetch_onepassword_arguments(
+    decorating_function: Callable[..., Callable[..., Any]],
+    prefetch_onepassword_secrets: Callable[..., None],
+    async_prefetch_onepassword_secrets: Callable[
+        ..., Coroutine[Any, Any, None]
+    ],
+    parameter_names: dict[str, str],
+    function: Callable[..., Any],
+) -> Callable[..., Any]:
+    """
+    Decorate a function such that, before its 1Password resource arguments
+    are resolved one at a time, all of them are prefetched in a single batch
+    (this only has an effect when using the 1Password CLI).
+    """
+    function_signature: Signature = signature(unwrap_function(function))
+    wrapper: Callable[..., Any] = decorating_function(function)
+
+    def get_prefetch_resources(*args: Any, **kwargs: Any) -> tuple[str, ...]:
+        try:
+            return _get_prefetch_resources(
+                function_signature,
+                parameter_names,
+                function_signature.bind_partial(*args, **kwargs).arguments,
+            )
+        except TypeError:
+            return ()
+
+    if iscoroutinefunction(wrapper):
+
+        @wraps(wrapper)
+        async def prefetching_wrapper(*args: Any, **kwargs: Any) -> Any:
+            resources: tuple[str, ...] = get_prefetch_resources(
+                *args, **kwargs
+            )
+            if len(resources) > 1:
+                await async_prefetch_onepassword_secrets(resources)
+            return await wrapper(*args, **kwargs)
+
+    else:
+
+        @wraps(wrapper)
+        def prefetching_wrapper(*args: Any, **kwargs: Any) -> Any:
+            resources: tuple[str, ...] = get_prefetch_resources(
+                *args, **kwargs
+            )
+            if len(resources) > 1:
+                prefetch_onepassword_secrets(resources)
+            return wrapper(*args, **kwargs)
+
+    return prefetching_wrapper
 
 
 def _install_op() -> None:
@@ -170,25 +518,250 @@ def which_op() -> str:
     Locate the 1Password CLI executable, or attempt
     to install it if not found.
     """
-    op: str = which("op") or "op"
-    try:
-        check_output((op, "--version"))
-    except (CalledProcessError, FileNotFoundError):  # pragma: no cover
-        _install_op()
+    op: str | None = _WHICH.get("op")
+    if op is None:
         op = which("op") or "op"
+        try:
+            check_output((op, "--version"))
+        except (CalledProcessError, FileNotFoundError):  # pragma: no cover
+            _install_op()
+            op = which("op") or "op"
+        _WHICH["op"] = op
     return op
 
 
-@cache
-def _op_signin(account: str | None = None) -> str:
-    op: str = which_op()
+async def async_which_op() -> str:
+    """
+    Asynchronously locate the 1Password CLI executable, or attempt
+    to install it if not found.
+    """
+    op: str | None = _WHICH.get("op")
+    if op is None:
+        op = which("op") or "op"
+        try:
+            await async_check_output((op, "--version"))
+        except (CalledProcessError, FileNotFoundError):  # pragma: no cover
+            return await asyncio.to_thread(which_op)
+        _WHICH["op"] = op
+    return op
+
+
+@dataclass(frozen=True)
+class _OpSession:
+    """
+    A 1Password CLI session, as captured from the output of `op signin`.
+
+    Attributes:
+        name: The name of the `OP_SESSION_*` environment variable the CLI
+            reads the session token from, if known.
+        token: The session token. This is `None` when the CLI is integrated
+            with the 1Password desktop app, in which case the app
+            authenticates CLI calls and no token is issued.
+        expires: The time (in seconds since the epoch) after which the
+            session can no longer be assumed to be valid.
+    """
+
+    name: str | None
+    token: str | None
+    expires: float
+
+
+# Sessions are keyed by account, with the key "" representing a sign-in to
+# every configured account
+_OP_SESSIONS: dict[str, _OpSession] = {}
+_OP_SIGNIN_LOCKS: dict[str, threading.Lock] = {}
+# Secrets resolved in batches using the CLI, keyed by account and resource,
+# with the (monotonic) time at which they expire, which are removed once
+# read (and cached subject to cache policies). Secrets expire according to
+# cache policies, and no more than `_OP_SECRETS_TTL` seconds after they are
+# resolved, and the least recently resolved are evicted beyond
+# `_OP_SECRETS_SIZE`.
+_OP_SECRETS: dict[tuple[str | None, str], tuple[str, float]] = {}
+_OP_SECRETS_TTL: float = 5 * 60
+_OP_SECRETS_SIZE: int = 1024
+_OP_SECRETS_LOCK: threading.Lock = threading.Lock()
+_OP_SIGNIN_LOCKS_LOCK: threading.Lock = threading.Lock()
+
+
+def _get_op_sessions_path() -> Path:
+    return get_cache_directory() / "onepassword-sessions.json"
+
+
+def _load_op_sessions() -> dict[str, _OpSession]:
+    """
+    Load unexpired sessions persisted by this, or any sibling, process.
+    """
+    now: float = time()
+    try:
+        data: dict[str, dict[str, Any]] = json.loads(
+            _get_op_sessions_path().read_text()
+        )
+        return {
+            account: session
+            for account, session in (
+                (account, _OpSession(**value))
+                for account, value in data.items()
+            )
+            if session.expires > now
+        }
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+def _save_op_session(account: str, session: _OpSession | None) -> None:
+    """
+    Persist (or, if `session` is `None`, discard) the session for an account
+    so that sibling processes can skip signing in.
+    """
+    sessions: dict[str, _OpSession] = _load_op_sessions()
+    if session is None:
+        sessions.pop(account, None)
+    else:
+        sessions[account] = session
+    with suppress(OSError):
+        write_private_file(
+            _get_op_sessions_path(),
+            json.dumps(
+                {
+                    account: asdict(session)
+                    for account, session in sessions.items()
+                }
+            ),
+        )
+
+
+def _get_op_session(account: str) -> _OpSession | None:
+    """
+    Get an unexpired session for an account, from memory if possible,
+    otherwise from the sessions persisted by sibling processes.
+    """
+    session: _OpSession | None = _OP_SESSIONS.get(account)
+    if (session is None) or (session.expires <= time()):
+        _OP_SESSIONS.pop(account, None)
+        _OP_SESSIONS.update(_load_op_sessions())
+        session = _OP_SESSIONS.get(account)
+    return session
+
+
+def _discard_op_sessions(account: str | None) -> None:
+    """
+    Forget a session which the CLI has rejected, along with the session
+    representing a sign-in to all accounts.
+    """
+    key: str
+    for key in {account or "", ""}:
+        _OP_SESSIONS.pop(key, None)
+        _save_op_session(key, None)
+
+
+def _parse_op_signin_output(output: str) -> tuple[str | None, str | None]:
+    """
+    Parse the `OP_SESSION_*` environment variable name and session token
+    from the output of `op signin` (in any of the shell formats the CLI
+    emits), or a raw token (as output by `op signin --raw`).
+    """
+    match: re.Match | None = _OP_SESSION_PATTERN.search(output)
+    if match:
+        return match.group(1), match.group(2)
+    output = output.strip()
+    if output and not any(character.isspace() for character in output):
+        return None, output
+    return None, None
+
+
+def _get_op_signin_lock(account: str) -> threading.Lock:
+    """
+    Get the lock serializing sign-in to an account, so that concurrent
+    callers encountering a cold cache trigger only one `op signin`
+    subprocess (and, with the desktop app, only one authentication prompt).
+    """
+    with _OP_SIGNIN_LOCKS_LOCK:
+        lock: threading.Lock | None = _OP_SIGNIN_LOCKS.get(account)
+        if lock is None:
+            lock = _OP_SIGNIN_LOCKS[account] = threading.Lock()
+        return lock
+
+
+def _get_op_signin_args_input(
+    op: str, account: str | None
+) -> tuple[tuple[str, ...], bytes | None]:
+    if account:
+        return (op, "signin", "--account", account), None
+    return (op, "signin"), b"\n\n"
+
+
+def _set_op_session(account: str | None, output: str) -> _OpSession:
+    """
+    Store (in memory, and persisted for sibling processes) the session
+    established by an `op signin` command with the given output.
+    """
+    name: str | None
+    token: str | None
+    name, token = _parse_op_signin_output(output)
+    session: _OpSession = _OpSession(
+        name=name, token=token, expires=time() + _OP_SESSION_LIFETIME
+    )
+    _OP_SESSIONS[account or ""] = session
+    _save_op_session(account or "", session)
+    return session
+
+
+def _set_op_all_accounts_session(sessions: Iterable[_OpSession]) -> None:
+    """
+    Record that all configured accounts have been signed into, until the
+    first of their sessions expires.
+    """
+    session: _OpSession = _OpSession(
+        name=None,
+        token=None,
+        expires=min(session.expires for session in sessions),
+    )
+    _OP_SESSIONS[""] = session
+    _save_op_session("", session)
+
+
+def _op_signin(account: str | None = None) -> _OpSession:
     if not account:  # pragma: no cover
         account = os.getenv("OP_ACCOUNT")
-    check_output(
-        (op, "signin", "--account", account) if account else (op, "signin"),
-        input=None if account else b"\n\n",
-    )
-    return op
+    session: _OpSession | None = _get_op_session(account or "")
+    if session is not None:
+        return session
+    with _get_op_signin_lock(account or ""):
+        # Callers which were waiting on the lock share the session
+        # established by the caller which held it
+        session = _get_op_session(account or "")
+        if session is not None:
+            return session
+        args: tuple[str, ...]
+        input_: bytes | None
+        args, input_ = _get_op_signin_args_input(which_op(), account)
+        return _set_op_session(account, check_output(args, input=input_))
+
+
+async def _async_op_signin(account: str | None = None) -> _OpSession:
+    if not account:  # pragma: no cover
+        account = os.getenv("OP_ACCOUNT")
+    session: _OpSession | None = _get_op_session(account or "")
+    if session is not None:
+        return session
+    async with async_lock(_get_op_signin_lock(account or "")):
+        session = _get_op_session(account or "")
+        if session is not None:
+            return session
+        args: tuple[str, ...]
+        input_: bytes | None
+        args, input_ = _get_op_signin_args_input(
+            await async_which_op(), account
+        )
+        return _set_op_session(
+            account, await async_check_output(args, input=input_)
+        )
+
+
+def _parse_op_account_list_output(output: str) -> Iterable[str]:
+    line: str
+    for line in output.strip().split("\n")[1:]:
+        yield line.partition(" ")[0]
 
 
 def iter_op_account_list() -> Iterable[str]:
@@ -196,193 +769,1467 @@ def iter_op_account_list() -> Iterable[str]:
     Yield all 1password account names.
     """
     op: str = which_op()
-    line: str
-    for line in check_output((op, "account", "list")).strip().split("\n")[1:]:
-        yield line.partition(" ")[0]
+    yield from _parse_op_account_list_output(
+        check_output((op, "account", "list"))
+    )
 
 
 def op_signin(account: str | None = None) -> str:
     """
     Sign in to 1Password using the CLI if not already signed in.
+
+    Session tokens issued by the CLI are persisted (readable only by the
+    current user) until they expire, so that sibling processes can reuse
+    them rather than signing in again. When no account is specified, all
+    configured accounts are signed into concurrently.
     """
     account = account or os.getenv("OP_ACCOUNT")
     if account:
-        return _op_signin(account)
-    op: str | None = None
-    for account in iter_op_account_list():
-        op = _op_signin(account)
-    return op or which_op()
+        _op_signin(account)
+        return which_op()
+    if _get_op_session("") is None:
+        with _get_op_signin_lock(""):
+            if _get_op_session("") is None:
+                accounts: tuple[str, ...] = tuple(iter_op_account_list())
+                if accounts:
+                    with ThreadPoolExecutor(
+                        max_workers=len(accounts)
+                    ) as executor:
+                        _set_op_all_accounts_session(
+                            tuple(executor.map(_op_signin, accounts))
+                        )
+    return which_op()
 
 
-def _resolve_auth_arguments(
-    account: str | None = None,
-    token: str | None = None,
-    host: str | None = None,
-) -> tuple[str | None, str | None, str | None]:
+async def async_op_signin(account: str | None = None) -> str:
     """
-    Parameters:
-        account:
-        token:
-        host:
+    Asynchronously sign in to 1Password using the CLI if not already signed
+    in. This behaves as [op_signin
+    ](./#decorative_secrets.onepassword.op_signin), but does not block the
+    event loop.
     """
-    if account is None:
-        account = os.getenv("OP_ACCOUNT")
-    if token is None:
-        token = os.getenv("OP_SERVICE_ACCOUNT_TOKEN")
-    if host is None:
-        host = os.getenv("OP_CONNECT_HOST")
-    if (token is None) or (host is not None):
-        token = os.getenv("OP_CONNECT_TOKEN") or token
-    return account, token, host
-
-
-def _parse_resource(resource: str) -> tuple[str, str, str]:
-    parse_result: ParseResult = urlparse(resource)
-    return (parse_result.netloc, *parse_result.path[1:].partition("/")[::2])
+    account = account or os.getenv("OP_ACCOUNT")
+    if account:
+        await _async_op_signin(account)
+        return await async_which_op()
+    if _get_op_session("") is None:
+        async with async_lock(_get_op_signin_lock("")):
+            if _get_op_session("") is None:
+                op: str = await async_which_op()
+                accounts: tuple[str, ...] = tuple(
+                    _parse_op_account_list_output(
+                        await async_check_output((op, "account", "list"))
+                    )
+                )
+                if accounts:
+                    _set_op_all_accounts_session(
+                        await asyncio.gather(*map(_async_op_signin, accounts))
+                    )
+    return await async_which_op()
 
 
-async def _async_resolve_resource(
-    token: str, resource: str
-) -> str:  # pragma: no cover
+def _get_op_args_env(
+    op: str, command: str, *arguments: str, account: str | None = None
+) -> tuple[tuple[str, ...], dict[str, str] | None]:
     """
-    Asynchronously resolve a 1Password resource using the
-    `onepassword-sdk` library.
+    Get the arguments and environment for an `op` command which reuses
+    any sessions established by `op_signin`. Session tokens are passed using
+    the `OP_SESSION_*` environment variables the CLI reads them from, where
+    known, rather than on the command line where they would be visible to
+    other users.
     """
-    client: Client = await Client.authenticate(
-        auth=token,
-        integration_name=_INTEGRATION_NAME,
-        integration_version=_INTEGRATION_VERSION,
-    )
-    secrets: Secrets = client.secrets
-    return await secrets.resolve(resource)
-
-
-async def _async_resolve_connect_resource(
-    token: str, host: str, resource: str
-) -> str:  # pragma: no cover
-    connect_client: AsyncClient = AsyncClient(
-        url=host,
-        token=token,
-    )
-    vault: str
-    item_name: str
-    field_id: str
-    vault, item_name, field_id = _parse_resource(resource)
-    item: Item = await connect_client.get_item(item=item_name, vault=vault)
-    field: Field
-    for field in item.fields:
-        if field.id == field_id:
-            return field.value
-    raise KeyError(resource)
+    now: float = time()
+    session: _OpSession | None = _OP_SESSIONS.get(account) if account else None
+    session_env: dict[str, str] = {
+        session_.name: session_.token
+        for session_ in _OP_SESSIONS.values()
+        if session_.name and session_.token and (session_.expires > now)
+    }
+    return (
+        (op, command)
+        + (("--account", account) if account else ())
+        + (
+            ("--session", session.token)
+            if session and session.token and not session.name
+            else ()
+        )
+        + arguments
+    ), ({**os.environ, **session_env} if session_env else None)
 
 
-def _resolve_connect_resource(
-    token: str, host: str, resource: str
-) -> str:  # pragma: no cover
-    connect_client: ConnectClient = ConnectClient(
-        url=host,
-        token=token,
+def _is_op_session_error(error: CalledProcessError) -> bool:
+    message: str = (
+        error.stderr.decode("utf-8", errors="ignore")
+        if isinstance(error.stderr, bytes)
+        else (error.stderr or "")
+    ).lower()
+    return any(
+        session_error_message in message
+        for session_error_message in _OP_SESSION_ERROR_MESSAGES
     )
-    vault: str
-    item_name: str
-    field_id: str
-    vault, item_name, field_id = _parse_resource(resource)
-    item: Item = connect_client.get_item(item=item_name, vault=vault)
-    field: Field
-    for field in item.fields:
-        if field.id == field_id:
-            return field.value
-    raise KeyError(resource)
 
 
-@alru_cache(maxsize=None)
-async def async_read_onepassword_secret(
-    resource: str,
+def _run_op(
+    run: Callable[[tuple[str, ...], dict[str, str] | None], _T],
+    command: str,
+    *arguments: str,
     account: str | None = None,
-    token: str | None = None,
-    host: str | None = None,
-) -> str:
+) -> _T:
     """
-    Asynchronously read a secret from 1Password using either the
-    `onepassword-sdk` or `onepasswordconnectsdk` libraries, or the `op`
-    executable (1password CLI), depending on the provided arguments and
-    environment variables.
-
-    Parameters:
-        resource: A 1Password secret resource path. For example:
-            "op://Vault Name/Client Secret Item Name/credential"
-        account: A 1Password account URL. For example, individuals and families
-            will use "my.1password.com", while teams and businesses will use
-            a custom subdomain. This is only necessary when using
-            the 1Password CLI where multiple accounts are configured.
-        token: A 1Password or 1Password connect service account token.
-        host: A 1Password Connect host URL. This is required when using
-            self-hosted 1Password Connect.
-
-    Returns:
-        The resolved secret value.
+    Run an `op` command by passing its arguments and environment to `run`,
+    signing in again (once) if the CLI rejects a session which has expired
+    or been revoked.
     """
-    account, token, host = _resolve_auth_arguments(account, token, host)
-    if token:  # pragma: no cover
-        if host:
-            return await _async_resolve_connect_resource(token, host, resource)
-        return await _async_resolve_resource(token, resource)
+    args: tuple[str, ...]
+    env: dict[str, str] | None
     op: str | None = None
     with suppress(FileNotFoundError, CalledProcessError):
         op = op_signin(account)
     if not op:  # pragma: no cover
         op = which_op() or "op"
-    return check_output(
-        (op, "read")
-        + (("--account", account) if account else ())
-        + (("--session", token) if token else ())
-        + (resource,)
+    args, env = _get_op_args_env(op, command, *arguments, account=account)
+    try:
+        return run(args, env)
+    except CalledProcessError as error:
+        if not _is_op_session_error(error):
+            raise
+    _discard_op_sessions(account)
+    args, env = _get_op_args_env(
+        op_signin(account), command, *arguments, account=account
     )
+    return run(args, env)
 
 
-@cache
-def _read_onepassword_secret(
-    resource: str,
+async def _async_run_op(
+    run: Callable[[tuple[str, ...], dict[str, str] | None], Awaitable[_T]],
+    command: str,
+    *arguments: str,
     account: str | None = None,
-    token: str | None = None,
-    host: str | None = None,
-    **env: str,  # noqa: ARG001
-) -> str:
+) -> _T:
     """
-    This function is wrapped by `read_onepassword_secret` to allow caching
-    to be invalidated based on environment variable changes.
+    Asynchronously run an `op` command by passing its arguments and
+    environment to `run`, signing in again (once) if the CLI rejects a
+    session which has expired or been revoked.
     """
-    account, token, host = _resolve_auth_arguments(account, token, host)
-    if token:  # pragma: no cover
-        if host:
-            return _resolve_connect_resource(token, host, resource)
-        return asyncio.run(_async_resolve_resource(token, resource))
+    args: tuple[str, ...]
+    env: dict[str, str] | None
     op: str | None = None
     with suppress(FileNotFoundError, CalledProcessError):
-        op = op_signin(account)
+        op = await async_op_signin(account)
     if not op:  # pragma: no cover
-        op = which_op() or "op"
-    return check_output(
-        (op, "read")
-        + (("--account", account) if account else ())
-        + (("--session", token) if token else ())
-        + (resource,)
+        op = await async_which_op() or "op"
+    args, env = _get_op_args_env(op, command, *arguments, account=account)
+    try:
+        return await run(args, env)
+    except CalledProcessError as error:
+        if not _is_op_session_error(error):
+            raise
+    _discard_op_sessions(account)
+    args, env = _get_op_args_env(
+        await async_op_signin(account), command, *arguments, account=account
     )
+    return await run(args, env)
 
 
-def get_onepassword_secret(
-    resource: str,
+def _check_op_output(
+    command: str,
+    *arguments: str,
+    account: str | None = None,
+    input: str | None = None,  # noqa: A002
+) -> str:
+    """
+    Run an `op` command, signing in again (once) if the CLI rejects a
+    session which has expired or been revoked.
+    """
+
+    def run(args: tuple[str, ...], env: dict[str, str] | None) -> str:
+        return check_output(args, env=env, input=input)
+
+    return _run_op(run, command, *arguments, account=account)
+
+
+async def _async_check_op_output(
+    command: str,
+    *arguments: str,
+    account: str | None = None,
+    input: str | None = None,  # noqa: A002
+) -> str:
+    """
+    Asynchronously run an `op` command, signing in again (once) if the CLI
+    rejects a session which has expired or been revoked.
+    """
+
+    async def run(args: tuple[str, ...], env: dict[str, str] | None) -> str:
+        return await async_check_output(args, env=env, input=input)
+
+    return await _async_run_op(run, command, *arguments, account=account)
+
+
+def _rewind(file: BinaryIO, position: int | None) -> None:
+    """
+    Discard anything written to `file` after `position`, so that output
+    from a failed attempt is not left in place when a command is retried.
+    """
+    if (position is not None) and (file.tell() != position):
+        file.seek(position)
+        file.truncate()
+
+
+def _stream_op_output(
+    command: str, *arguments: str, file: BinaryIO, account: str | None = None
+) -> None:
+    """
+    Run an `op` command, writing its output to `file`, and signing in
+    again (once) if the CLI rejects a session which has expired or been
+    revoked.
+    """
+    position: int | None = file.tell() if file.seekable() else None
+
+    def run(args: tuple[str, ...], env: dict[str, str] | None) -> None:
+        _rewind(file, position)
+        check_stream(args, file, env=env)
+
+    _run_op(run, command, *arguments, account=account)
+
+
+async def _async_stream_op_output(
+    command: str, *arguments: str, file: BinaryIO, account: str | None = None
+) -> None:
+    """
+    Asynchronously run an `op` command, writing its output to `file`, and
+    signing in again (once) if the CLI rejects a session which has expired
+    or been revoked.
+    """
+    position: int | None = file.tell() if file.seekable() else None
+
+    async def run(args: tuple[str, ...], env: dict[str, str] | None) -> None:
+        _rewind(file, position)
+        await async_check_stream(args, file, env=env)
+
+    await _async_run_op(run, command, *arguments, account=account)
+
+
+def _evict_op_secrets() -> None:
+    """
+    Remove expired secrets resolved in batches.
+    """
+    now: float = monotonic()
+    key: tuple[str | None, str]
+    expires: float
+    with _OP_SECRETS_LOCK:
+        for key, (_, expires) in tuple(_OP_SECRETS.items()):
+            if expires <= now:
+                _OP_SECRETS.pop(key, None)
+
+
+def _set_op_secret(account: str | None, resource: str, value: str) -> None:
+    """
+    Store a secret resolved in a batch, to be read by `_op_read`.
+    """
+    ttl: float | None = _get_onepassword_cache_ttl(resource)
+    expires: float = monotonic() + (
+        _OP_SECRETS_TTL if ttl is None else min(ttl, _OP_SECRETS_TTL)
+    )
+    with _OP_SECRETS_LOCK:
+        _OP_SECRETS.pop((account, resource), None)
+        _OP_SECRETS[(account, resource)] = (value, expires)
+        while len(_OP_SECRETS) > _OP_SECRETS_SIZE:
+            _OP_SECRETS.pop(next(iter(_OP_SECRETS)))
+
+
+def _pop_op_secret(account: str | None, resource: str) -> str | None:
+    """
+    Remove and return a secret resolved in a batch, if it has not expired.
+    """
+    _evict_op_secrets()
+    with _OP_SECRETS_LOCK:
+        secret: tuple[str, float] | None = _OP_SECRETS.pop(
+            (account, resource), None
+        )
+    if (secret is None) or (secret[1] <= monotonic()):
+        return None
+    return secret[0]
+
+
+def _op_read(resource: str, account: str | None = None) -> str:
+    """
+    Read a secret using the 1Password CLI, or from secrets previously
+    resolved in a batch by `_op_inject`.
+    """
+    value: str | None = _pop_op_secret(account, resource)
+    if value is not None:
+        return value
+    return _check_op_output("read", resource, account=account)
+
+
+async def _async_op_read(resource: str, account: str | None = None) -> str:
+    """
+    Asynchronously read a secret using the 1Password CLI, or from secrets
+    previously resolved in a batch.
+    """
+    value: str | None = _pop_op_secret(account, resource)
+    if value is not None:
+        return value
+    return await _async_check_op_output("read", resource, account=account)
+
+
+def _get_op_inject_template(resources: Sequence[str]) -> tuple[str, str]:
+    """
+    Get a template for `op inject` in which each reference is enclosed
+    in delimiters incorporating a random marker, so that values (which may
+    span multiple lines) can be parsed unambiguously from the output.
+
+    Returns:
+        A tuple containing the marker and the template.
+    """
+    marker: str = token_hex(16)
+    index: int
+    resource: str
+    return marker, "".join(
+        f"{marker}{index}>{{{{ {resource} }}}}<{marker}{index}\n"
+        for index, resource in enumerate(resources)
+    )
+
+
+def _parse_op_inject_output(
+    resources: Sequence[str], marker: str, output: str
+) -> dict[str, str]:
+    match: re.Match
+    return {
+        resources[int(match.group(1))]: match.group(2)
+        for match in re.finditer(
+            rf"{marker}(\d+)>(.*?)<{marker}\1", output, flags=re.DOTALL
+        )
+    }
+
+
+def _op_inject(
+    resources: Sequence[str], account: str | None = None
+) -> dict[str, str]:
+    """
+    Resolve many secrets using a single `op inject` command. The template
+    is passed to, and the injected secrets read from, the CLI using pipes,
+    so secret values are never written to disk.
+    """
+    marker: str
+    template: str
+    marker, template = _get_op_inject_template(resources)
+    return _parse_op_inject_output(
+        resources,
+        marker,
+        _check_op_output("inject", account=account, input=template),
+    )
+
+
+async def _async_op_inject(
+    resources: Sequence[str], account: str | None = None
+) -> dict[str, str]:
+    """
+    Asynchronously resolve many secrets using a single `op inject` command.
+    """
+    marker: str
+    template: str
+    marker, template = _get_op_inject_template(resources)
+    return _parse_op_inject_output(
+        resources,
+        marker,
+        await _async_check_op_output(
+            "inject", account=account, input=template
+        ),
+    )
+
+
+def _resolve_auth_arguments(
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> tuple[str | None, str | None, str | None]:
+    """
+    Parameters:
+        account:
+        token:
+        host:
+    """
+    if account is None:
+        account = os.getenv("OP_ACCOUNT")
+    if token is None:
+        token = os.getenv("OP_SERVICE_ACCOUNT_TOKEN")
+    if host is None:
+        host = os.getenv("OP_CONNECT_HOST")
+    if (token is None) or (host is not None):
+        token = os.getenv("OP_CONNECT_TOKEN") or token
+    return account, token, host
+
+
+def _get_rate_limiter(token: str) -> RateLimiter:
+    """
+    Get the rate limiter shared by all requests made using `token`.
+    """
+    rate_limiter: RateLimiter | None = _RATE_LIMITERS.get(token)
+    if rate_limiter is None:
+        with _RATE_LIMITERS_LOCK:
+            rate_limiter = _RATE_LIMITERS.get(token)
+            if rate_limiter is None:
+                rate_limiter = _RATE_LIMITERS[token] = RateLimiter(
+                    _RATE_LIMIT, burst=_RATE_LIMIT_BURST
+                )
+    return rate_limiter
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """
+    Determine whether an error raised by `onepassword-sdk` or
+    `onepasswordconnectsdk` indicates a rate limit has been exceeded.
+    """
+    if isinstance(error, RateLimitExceededException):
+        return True
+    if getattr(error, "status_code", None) == 429:
+        return True
+    message: str = str(error).lower()
+    return ("received 429" in message) or ("rate limit" in message)
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """
+    Parse a `Retry-After` header value (a number of seconds, or an HTTP
+    date) as a number of seconds from now.
+    """
+    seconds: float
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0), _RATE_LIMIT_MAXIMUM_RETRY_AFTER)
+
+
+def _iter_error_chain(error: BaseException) -> Iterable[BaseException]:
+    """
+    Yield an error, followed by the errors which caused it, or during the
+    handling of which it was raised.
+    """
+    seen: set[int] = set()
+    cause: BaseException | None = error
+    while (cause is not None) and (id(cause) not in seen):
+        seen.add(id(cause))
+        yield cause
+        cause = cause.__cause__ or cause.__context__
+
+
+def _get_retry_after(error: BaseException) -> float | None:
+    """
+    Get the number of seconds a rate-limit error asks callers to wait, from
+    the `Retry-After` header of the HTTP response which caused it (the
+    `onepasswordconnectsdk` raises its errors while handling an
+    `httpx.HTTPStatusError`, which references the response), if present.
+    """
+    cause: BaseException
+    for cause in _iter_error_chain(error):
+        response: Any = getattr(cause, "response", None)
+        value: str | None = (
+            response.headers.get("Retry-After")
+            if getattr(response, "headers", None) is not None
+            else None
+        )
+        if value:
+            return _parse_retry_after(value)
+    return None
+
+
+def _call_rate_limited(
+    token: str, function: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    """
+    Call `function` once the rate limit for `token` allows, re-queueing
+    the call if a rate-limit error is encountered.
+    """
+    rate_limiter: RateLimiter = _get_rate_limiter(token)
+    attempt: int
+    for attempt in range(1, _RATE_LIMIT_ATTEMPTS + 1):  # noqa: RET503
+        rate_limiter.acquire()
+        try:
+            result: Any = function(*args, **kwargs)
+        except Exception as error:
+            if (attempt == _RATE_LIMIT_ATTEMPTS) or not _is_rate_limit_error(
+                error
+            ):
+                raise
+            rate_limiter.throttle(_get_retry_after(error))
+        else:
+            rate_limiter.recover()
+            return result
+
+
+async def _async_call_rate_limited(
+    token: str,
+    function: Callable[..., Coroutine[Any, Any, Any]],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """
+    Await `function` once the rate limit for `token` allows, re-queueing
+    the call if a rate-limit error is encountered.
+    """
+    rate_limiter: RateLimiter = _get_rate_limiter(token)
+    attempt: int
+    for attempt in range(1, _RATE_LIMIT_ATTEMPTS + 1):  # noqa: RET503
+        await rate_limiter.async_acquire()
+        try:
+            result: Any = await function(*args, **kwargs)
+        except Exception as error:
+            if (attempt == _RATE_LIMIT_ATTEMPTS) or not _is_rate_limit_error(
+                error
+            ):
+                raise
+            rate_limiter.throttle(_get_retry_after(error))
+        else:
+            rate_limiter.recover()
+            return result
+
+
+def get_onepassword_queue_depth(
+    token: str | None = None, host: str | None = None
+) -> int:
+    """
+    Get the number of 1Password requests currently queued, waiting on the
+    client-side rate limit for a service account or Connect token.
+
+    Parameters:
+        token: A 1Password or 1Password connect service account token.
+        host: A 1Password Connect host URL.
+
+    Returns:
+        The number of queued requests.
+    """
+    token = _resolve_auth_arguments(None, token, host)[1]
+    rate_limiter: RateLimiter | None = (
+        _RATE_LIMITERS.get(token) if token else None
+    )
+    return rate_limiter.queue_depth if rate_limiter else 0
+
+
+def _parse_resource(resource: str) -> tuple[str, str, str]:
+    parse_result: ParseResult = urlparse(resource)
+    return (parse_result.netloc, *parse_result.path[1:].partition("/")[::2])
+
+
+async def _async_get_client(token: str) -> Client:  # pragma: no cover
+    """
+    Get an authenticated `onepassword-sdk` client for the running event loop,
+    authenticating only once per token (concurrent callers await the same
+    authentication).
+    """
+    clients: dict[Hashable, Any] = get_event_loop_objects()
+    key: tuple[str, str] = ("onepassword.client.Client", token)
+    authenticating: asyncio.Future | None = clients.get(key)
+    if authenticating is None:
+        authenticating = clients[key] = asyncio.ensure_future(
+            Client.authenticate(
+                auth=token,
+                integration_name=_INTEGRATION_NAME,
+                integration_version=_INTEGRATION_VERSION,
+            )
+        )
+    try:
+        return await asyncio.shield(authenticating)
+    except Exception:
+        if clients.get(key) is authenticating:
+            del clients[key]
+        raise
+
+
+async def _async_resolve_resource(
+    token: str, resource: str
+) -> str:  # pragma: no cover
+    """
+    Asynchronously resolve a 1Password resource using the
+    `onepassword-sdk` library.
+    """
+    client: Client = await _async_get_client(token)
+    secrets: Secrets = client.secrets
+    return await _async_call_rate_limited(token, secrets.resolve, resource)
+
+
+def _get_async_connect_client(token: str, host: str) -> AsyncClient:
+    """
+    Get a 1Password Connect async client, and its connection pool, for the
+    running event loop.
+    """
+    clients: dict[Hashable, Any] = get_event_loop_objects()
+    key: tuple[str, str, str] = (
+        "onepasswordconnectsdk.client.AsyncClient",
+        token,
+        host,
+    )
+    client: AsyncClient | None = clients.get(key)
+    if client is None:
+        client = clients[key] = AsyncClient(url=host, token=token)
+    return client
+
+
+@cache
+def _get_connect_client(token: str, host: str) -> ConnectClient:
+    """
+    Get a 1Password Connect client, and its connection pool.
+    """
+    return ConnectClient(url=host, token=token)
+
+
+def _get_unambiguous_mapping(
+    items: Iterable[tuple[str, _T]],
+) -> dict[str, _T]:
+    """
+    Create a dictionary from key/value pairs, omitting any keys which are
+    ambiguous (paired with more than one distinct value).
+    """
+    mapping: dict[str, _T] = {}
+    ambiguous: set[str] = set()
+    key: str
+    value: _T
+    for key, value in items:
+        if (key in mapping) and (mapping[key] != value):
+            ambiguous.add(key)
+        mapping[key] = value
+    for key in ambiguous:
+        del mapping[key]
+    return mapping
+
+
+def _index_connect_ids(
+    objects: Iterable[Vault | SummaryItem],
+) -> dict[str, str]:
+    """
+    Map vault names or item titles to IDs, omitting any which are ambiguous
+    (these are left for 1Password Connect to report).
+    """
+    item: Vault | SummaryItem
+    return _get_unambiguous_mapping(
+        (item.name if isinstance(item, Vault) else item.title, item.id)
+        for item in objects
+    )
+
+
+def _get_connect_index_id(
+    key: tuple[str, ...], name: str, index: Callable[[], dict[str, str]]
+) -> str:
+    """
+    Look up the ID for a vault name or item title in the index for `key`,
+    (re-)building the index if it is missing or does not include `name`.
+    If an ID cannot be found, `name` is returned.
+    """
+    if is_valid_uuid(name):
+        return name
+    ids: dict[str, str] | None = _CONNECT_IDS.get(key)
+    if (ids is None) or (name not in ids):
+        ids = _CONNECT_IDS[key] = index()
+    return ids.get(name, name)
+
+
+async def _async_get_connect_index_id(
+    key: tuple[str, ...],
+    name: str,
+    index: Callable[[], Coroutine[Any, Any, dict[str, str]]],
+) -> str:
+    """
+    Look up the ID for a vault name or item title in the index for `key`,
+    (re-)building the index if it is missing or does not include `name`.
+    If an ID cannot be found, `name` is returned.
+    """
+    if is_valid_uuid(name):
+        return name
+    ids: dict[str, str] | None = _CONNECT_IDS.get(key)
+    if (ids is None) or (name not in ids):
+        ids = _CONNECT_IDS[key] = await index()
+    return ids.get(name, name)
+
+
+@dataclass(frozen=True)
+class _ConnectItem:
+    item: Item
+    validated: float
+
+
+def _set_connect_item(host: str, token: str, item: Item) -> None:
+    """
+    Cache an item retrieved from 1Password Connect.
+    """
+    if item.id and item.vault and item.vault.id:
+        _CONNECT_ITEMS[(host, token, item.vault.id, item.id)] = _ConnectItem(
+            item, time()
+        )
+
+
+def _revalidate_connect_items(
+    host: str, token: str, vault_id: str, summaries: Iterable[SummaryItem]
+) -> None:
+    """
+    Given summaries of all items in a vault, mark cached items from the vault
+    which are unchanged as valid, discard those which have changed or been
+    removed, and refresh the index of item titles to IDs.
+    """
+    summaries = tuple(summaries)
+    _CONNECT_IDS[(host, token, vault_id)] = _index_connect_ids(summaries)
+    summary: SummaryItem
+    versions: dict[str, tuple[Any, Any]] = {
+        summary.id: (summary.version, summary.updated_at)
+        for summary in summaries
+    }
+    now: float = time()
+    key: tuple[str, str, str, str]
+    cached: _ConnectItem
+    for key, cached in tuple(_CONNECT_ITEMS.items()):
+        if key[:3] == (host, token, vault_id):
+            if versions.get(key[3]) == (
+                cached.item.version,
+                cached.item.updated_at,
+            ):
+                _CONNECT_ITEMS[key] = _ConnectItem(cached.item, now)
+            else:
+                del _CONNECT_ITEMS[key]
+
+
+def _get_connect_item_ttl(ttl: float | None) -> float:
+    """
+    Get the number of seconds for which a cached 1Password Connect item is
+    used before being revalidated, given the cache policy TTL of the secret
+    being read from it.
+    """
+    return _CONNECT_ITEM_TTL if ttl is None else min(ttl, _CONNECT_ITEM_TTL)
+
+
+def _get_connect_item(
+    client: ConnectClient,
+    token: str,
+    host: str,
+    vault: str,
+    item: str,
+    *,
+    ttl: float | None = None,
+) -> Item:
+    """
+    Get an item from 1Password Connect by vault name (or ID) and item title
+    (or ID), using cached indices of names to IDs so that the item can be
+    retrieved directly, by ID.
+
+    Items are cached, and once an item has been cached for longer than
+    `ttl` (the cache policy TTL of the secret being read) or
+    `_CONNECT_ITEM_TTL` seconds, whichever is shorter, it is revalidated
+    against the versions listed for its vault, and only retrieved again if
+    it has changed. If `ttl` is 0, the item is always retrieved.
+    """
+    vault_id: str = _get_connect_index_id(
+        (host, token),
+        vault,
+        lambda: _index_connect_ids(
+            _call_rate_limited(token, client.get_vaults)
+        ),
+    )
+    item_id: str = _get_connect_index_id(
+        (host, token, vault_id),
+        item,
+        lambda: _index_connect_ids(
+            _call_rate_limited(token, client.get_items, vault_id)
+        ),
+    )
+    key: tuple[str, str, str, str] = (host, token, vault_id, item_id)
+    cached: _ConnectItem | None = _CONNECT_ITEMS.get(key) if ttl != 0 else None
+    if (cached is not None) and (
+        time() - cached.validated >= _get_connect_item_ttl(ttl)
+    ):
+        _revalidate_connect_items(
+            host,
+            token,
+            vault_id,
+            _call_rate_limited(token, client.get_items, vault_id),
+        )
+        cached = _CONNECT_ITEMS.get(key)
+    if cached is not None:
+        return cached.item
+    item_: Item
+    try:
+        item_ = _call_rate_limited(
+            token, client.get_item, item=item_id, vault=vault_id
+        )
+    except FailedToRetrieveItemException:
+        if (vault_id, item_id) == (vault, item):
+            raise
+        # The indices may be stale, so discard them and try by name
+        _CONNECT_IDS.pop((host, token), None)
+        _CONNECT_IDS.pop((host, token, vault_id), None)
+        item_ = _call_rate_limited(
+            token, client.get_item, item=item, vault=vault
+        )
+    _set_connect_item(host, token, item_)
+    return item_
+
+
+async def _async_get_connect_item(
+    client: AsyncClient,
+    token: str,
+    host: str,
+    vault: str,
+    item: str,
+    *,
+    ttl: float | None = None,
+) -> Item:
+    """
+    Get an item from 1Password Connect by vault name (or ID) and item title
+    (or ID), using cached indices of names to IDs so that the item can be
+    retrieved directly, by ID.
+
+    Items are cached, and once an item has been cached for longer than
+    `ttl` (the cache policy TTL of the secret being read) or
+    `_CONNECT_ITEM_TTL` seconds, whichever is shorter, it is revalidated
+    against the versions listed for its vault, and only retrieved again if
+    it has changed. If `ttl` is 0, the item is always retrieved.
+    """
+
+    async def index_vaults() -> dict[str, str]:
+        return _index_connect_ids(
+            await _async_call_rate_limited(token, client.get_vaults)
+        )
+
+    async def index_items() -> dict[str, str]:
+        return _index_connect_ids(
+            await _async_call_rate_limited(token, client.get_items, vault_id)
+        )
+
+    vault_id: str = await _async_get_connect_index_id(
+        (host, token), vault, index_vaults
+    )
+    item_id: str = await _async_get_connect_index_id(
+        (host, token, vault_id), item, index_items
+    )
+    key: tuple[str, str, str, str] = (host, token, vault_id, item_id)
+    cached: _ConnectItem | None = _CONNECT_ITEMS.get(key) if ttl != 0 else None
+    if (cached is not None) and (
+        time() - cached.validated >= _get_connect_item_ttl(ttl)
+    ):
+        _revalidate_connect_items(
+            host,
+            token,
+            vault_id,
+            await _async_call_rate_limited(token, client.get_items, vault_id),
+        )
+        cached = _CONNECT_ITEMS.get(key)
+    if cached is not None:
+        return cached.item
+    item_: Item
+    try:
+        item_ = await _async_call_rate_limited(
+            token, client.get_item, item=item_id, vault=vault_id
+        )
+    except FailedToRetrieveItemException:
+        if (vault_id, item_id) == (vault, item):
+            raise
+        # The indices may be stale, so discard them and try by name
+        _CONNECT_IDS.pop((host, token), None)
+        _CONNECT_IDS.pop((host, token, vault_id), None)
+        item_ = await _async_call_rate_limited(
+            token, client.get_item, item=item, vault=vault
+        )
+    _set_connect_item(host, token, item_)
+    return item_
+
+
+def _get_connect_field_value(item: Item, resource: str) -> str:
+    """
+    Get the value of the field, in a 1Password Connect item, to which
+    `resource` refers by field ID or label (or the current one-time password
+    for a "?attribute=otp" reference), and record the field's type.
+    """
+    field_id: str = _parse_resource(resource)[2]
+    attribute: str = (
+        parse_qs(urlparse(resource).query).get("attribute", [""])[0].lower()
+    )
+    field: Field
+    for field in item.fields or ():
+        if field_id in (field.id, field.label):
+            if field.type:
+                _OP_FIELD_TYPES[resource] = field.type
+            return field.totp if attribute in ("otp", "totp") else field.value
+    raise KeyError(resource)
+
+
+async def _async_resolve_connect_resource(
+    token: str, host: str, resource: str
+) -> str:
+    connect_client: AsyncClient = _get_async_connect_client(token, host)
+    vault: str
+    item_name: str
+    vault, item_name, _ = _parse_resource(resource)
+    item: Item = await _async_get_connect_item(
+        connect_client,
+        token,
+        host,
+        vault,
+        item_name,
+        ttl=_get_onepassword_cache_ttl(resource),
+    )
+    return _get_connect_field_value(item, resource)
+
+
+def _resolve_connect_resource(token: str, host: str, resource: str) -> str:
+    connect_client: ConnectClient = _get_connect_client(token, host)
+    vault: str
+    item_name: str
+    vault, item_name, _ = _parse_resource(resource)
+    item: Item = _get_connect_item(
+        connect_client,
+        token,
+        host,
+        vault,
+        item_name,
+        ttl=_get_onepassword_cache_ttl(resource),
+    )
+    return _get_connect_field_value(item, resource)
+
+
+@dataclass(frozen=True)
+class _OpBackend:
+    """
+    A means of reading secrets from 1Password: "connect" (using
+    `onepasswordconnectsdk`), "sdk" (using `onepassword-sdk`), or "cli"
+    (using the `op` executable).
+    """
+
+    name: str
+    token: str | None = None
+    host: str | None = None
+
+
+@dataclass
+class _OpBackendStatistics:
+    """
+    Exponentially weighted moving averages of the latency and error rate of
+    a back end, and the number of consecutive failures, following which the
+    back end is considered unhealthy until `retry_after` (a monotonic time).
+    """
+
+    latency: float | None = None
+    error_rate: float = 0
+    failures: int = 0
+    retry_after: float = 0
+
+
+def set_adaptive_onepassword_backends(*, enabled: bool = True) -> None:
+    """
+    Enable (or disable) adaptive back-end selection. By default, secrets are
+    read using 1Password Connect if a host is configured, otherwise using
+    the `onepassword-sdk` library if a service account token is configured,
+    and otherwise using the `op` executable (1Password CLI).
+
+    When adaptive back-end selection is enabled, every back end for which
+    the necessary arguments or environment variables are present (and the
+    CLI, if installed) is considered. Back ends are initially tried in the
+    default order, and others are only tried (and measured) if those
+    preferred fail. The latency and error rate of each back end used are
+    measured, and each secret is read using the fastest healthy back end,
+    failing over to the others if it cannot be read.
+    Only failures to reach or authenticate with a back end (and server
+    errors) count against its health, and cause failing over. Errors
+    indicating that a secret does not exist are raised immediately.
+
+    Parameters:
+        enabled: Whether to select back ends adaptively.
+    """
+    _OP_ADAPTIVE_BACKENDS[0] = enabled
+
+
+def get_onepassword_backend_statistics() -> dict[str, dict[str, Any]]:
+    """
+    Get the measured latency (in seconds), error rate, and health of each
+    back end used with adaptive back-end selection (see
+    `set_adaptive_onepassword_backends`).
+
+    Returns:
+        A dictionary mapping back-end names ("connect", "sdk", or "cli") to
+            statistics.
+    """
+    now: float = monotonic()
+    backend: _OpBackend
+    statistics: _OpBackendStatistics
+    with _OP_BACKEND_STATISTICS_LOCK:
+        return {
+            backend.name: {
+                "latency": statistics.latency,
+                "error_rate": statistics.error_rate,
+                "healthy": statistics.retry_after <= now,
+            }
+            for backend, statistics in _OP_BACKEND_STATISTICS.items()
+        }
+
+
+def _get_onepassword_backends(
+    token: str | None = None, host: str | None = None
+) -> tuple[_OpBackend, ...]:
+    """
+    Get all back ends available, given resolved authentication arguments
+    (see `_resolve_auth_arguments`) and environment variables, in the
+    default order of preference.
+    """
+    backends: list[_OpBackend] = []
+    connect_token: str | None = os.getenv("OP_CONNECT_TOKEN") or (
+        token if host else None
+    )
+    if host and connect_token:
+        backends.append(_OpBackend("connect", connect_token, host))
+    service_account_token: str | None = os.getenv(
+        "OP_SERVICE_ACCOUNT_TOKEN"
+    ) or (None if host else token)
+    if service_account_token:
+        backends.append(_OpBackend("sdk", service_account_token))
+    if _WHICH.get("op") or which("op"):
+        backends.append(_OpBackend("cli"))
+    return tuple(backends)
+
+
+def _rank_onepassword_backends(
+    backends: Iterable[_OpBackend],
+) -> list[_OpBackend]:
+    """
+    Order back ends by preference: healthy back ends first, and of those,
+    back ends which have been measured first, fastest first (penalizing
+    latency by error rate). Back ends not yet measured retain the order in
+    which they are passed (Connect, then the SDK, then the CLI; see
+    `_get_onepassword_backends`), so that they are only tried if those
+    preferred fail.
+    """
+    now: float = monotonic()
+
+    def get_sort_key(backend: _OpBackend) -> tuple[bool, bool, float]:
+        statistics: _OpBackendStatistics | None = _OP_BACKEND_STATISTICS.get(
+            backend
+        )
+        if statistics is None:
+            return (False, True, 0)
+        if statistics.latency is None:
+            return (statistics.retry_after > now, True, 0)
+        return (
+            statistics.retry_after > now,
+            False,
+            statistics.latency * (1 + 4 * statistics.error_rate),
+        )
+
+    with _OP_BACKEND_STATISTICS_LOCK:
+        return sorted(backends, key=get_sort_key)
+
+
+def _record_onepassword_backend_result(
+    backend: _OpBackend, latency: float, *, error: bool
+) -> None:
+    """
+    Update the statistics for a back end following a lookup.
+    """
+    with _OP_BACKEND_STATISTICS_LOCK:
+        statistics: _OpBackendStatistics = _OP_BACKEND_STATISTICS.setdefault(
+            backend, _OpBackendStatistics()
+        )
+        statistics.error_rate += _OP_BACKEND_ALPHA * (
+            float(error) - statistics.error_rate
+        )
+        if error:
+            statistics.failures += 1
+            statistics.retry_after = monotonic() + min(
+                _OP_BACKEND_COOLDOWN * 2 ** (statistics.failures - 1),
+                _OP_BACKEND_MAXIMUM_COOLDOWN,
+            )
+            return
+        statistics.failures = 0
+        statistics.retry_after = 0
+        statistics.latency = (
+            latency
+            if statistics.latency is None
+            else statistics.latency
+            + _OP_BACKEND_ALPHA * (latency - statistics.latency)
+        )
+
+
+def _is_onepassword_backend_failure(error: BaseException) -> bool:
+    """
+    Determine whether an error indicates that a back end is unhealthy (it
+    could not be reached or authenticated with, was rate-limited, or failed
+    with a server error), as opposed to the secret being read not existing
+    (or the reference being malformed), which does not reflect on the back
+    end.
+    """
+    cause: BaseException
+    for cause in _iter_error_chain(error):
+        if isinstance(
+            cause,
+            (
+                OSError,
+                TransportError,
+                TimeoutExpired,
+                InterfaceNotInstalledError,
+                RateLimitExceededException,
+            ),
+        ):
+            return True
+        status: Any = getattr(cause, "status_code", None) or getattr(
+            getattr(cause, "response", None), "status_code", None
+        )
+        if isinstance(status, int):
+            return (status in (401, 403, 429)) or (status >= 500)  # noqa: PLR2004
+        text: Any = (
+            cause.stderr or cause.output
+            if isinstance(cause, CalledProcessError)
+            else str(cause)
+        )
+        if isinstance(text, bytes):
+            text = text.decode(errors="replace")
+        if text and _OP_BACKEND_FAILURE_PATTERN.search(text):
+            return True
+    return False
+
+
+def _read_onepassword_backend_secret(
+    backend: _OpBackend, resource: str, account: str | None
+) -> str:
+    if backend.name == "cli":
+        return _op_read(resource, account)
+    if backend.token is None:  # pragma: no cover
+        raise ValueError(backend)
+    if backend.host:  # pragma: no cover
+        return _resolve_connect_resource(backend.token, backend.host, resource)
+    return asyncio_run(_async_resolve_resource(backend.token, resource))
+
+
+async def _async_read_onepassword_backend_secret(
+    backend: _OpBackend, resource: str, account: str | None
+) -> str:
+    if backend.name == "cli":
+        return await _async_op_read(resource, account)
+    if backend.token is None:  # pragma: no cover
+        raise ValueError(backend)
+    if backend.host:  # pragma: no cover
+        return await _async_resolve_connect_resource(
+            backend.token, backend.host, resource
+        )
+    return await _async_resolve_resource(backend.token, resource)
+
+
+def _read_onepassword_secret_adaptively(
+    resource: str,
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> str | None:
+    """
+    Read a secret using the best available back end, failing over to the
+    others. If no back ends are available, `None` is returned.
+    """
+    error: Exception | None = None
+    backend: _OpBackend
+    for backend in _rank_onepassword_backends(
+        _get_onepassword_backends(token, host)
+    ):
+        start: float = monotonic()
+        try:
+            value: str = _read_onepassword_backend_secret(
+                backend, resource, account
+            )
+        except Exception as backend_error:
+            if not _is_onepassword_backend_failure(backend_error):
+                # The back end is healthy, but the secret cannot be read
+                raise
+            _record_onepassword_backend_result(
+                backend, monotonic() - start, error=True
+            )
+            error = backend_error
+        else:
+            _record_onepassword_backend_result(
+                backend, monotonic() - start, error=False
+            )
+            return value
+    if error is not None:
+        raise error
+    return None
+
+
+async def _async_read_onepassword_secret_adaptively(
+    resource: str,
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> str | None:
+    """
+    Asynchronously read a secret using the best available back end, failing
+    over to the others. If no back ends are available, `None` is returned.
+    """
+    error: Exception | None = None
+    backend: _OpBackend
+    for backend in _rank_onepassword_backends(
+        _get_onepassword_backends(token, host)
+    ):
+        start: float = monotonic()
+        try:
+            value: str = await _async_read_onepassword_backend_secret(
+                backend, resource, account
+            )
+        except Exception as backend_error:
+            if not _is_onepassword_backend_failure(backend_error):
+                # The back end is healthy, but the secret cannot be read
+                raise
+            _record_onepassword_backend_result(
+                backend, monotonic() - start, error=True
+            )
+            error = backend_error
+        else:
+            _record_onepassword_backend_result(
+                backend, monotonic() - start, error=False
+            )
+            return value
+    if error is not None:
+        raise error
+    return None
+
+
+async def _async_resolve_onepassword_secret(
+    resource: str,
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> str:
+    value: str | None = _get_op_vault_secret(resource, account, token, host)
+    if value is not None:
+        return value
+    if _OP_ADAPTIVE_BACKENDS[0]:
+        value = await _async_read_onepassword_secret_adaptively(
+            resource, account, token, host
+        )
+        if value is not None:
+            return value
+    if token:  # pragma: no cover
+        if host:
+            return await _async_resolve_connect_resource(token, host, resource)
+        return await _async_resolve_resource(token, resource)
+    return await _async_op_read(resource, account)
+
+
+async def async_read_onepassword_secret(
+    resource: str,
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> str:
+    """
+    Asynchronously read a secret from 1Password using either the
+    `onepassword-sdk` or `onepasswordconnectsdk` libraries, or the `op`
+    executable (1password CLI), depending on the provided arguments and
+    environment variables.
+
+    Parameters:
+        resource: A 1Password secret resource path. For example:
+            "op://Vault Name/Client Secret Item Name/credential"
+        account: A 1Password account URL. For example, individuals and families
+            will use "my.1password.com", while teams and businesses will use
+            a custom subdomain. This is only necessary when using
+            the 1Password CLI where multiple accounts are configured.
+        token: A 1Password or 1Password connect service account token.
+        host: A 1Password Connect host URL. This is required when using
+            self-hosted 1Password Connect.
+
+    Returns:
+        The resolved secret value.
+
+    Resolved secrets are cached according to `ONEPASSWORD_CACHE_POLICIES`
+    (see `set_onepassword_cache_policy`). By default, one-time passwords are
+    never cached, and all other secrets are cached indefinitely.
+    """
+    account, token, host = _resolve_auth_arguments(account, token, host)
+    key: tuple[str, str | None, str | None, str | None] = (
+        resource,
+        account,
+        token,
+        host,
+    )
+    cached: str | None = _get_cached_onepassword_secret(key)
+    if cached is not None:
+        return cached
+    # Concurrent reads of the same secret share a single lookup
+    pending_lookups: dict[Hashable, Any] = get_event_loop_objects()
+    pending_key: tuple[str, Hashable] = ("async_read_onepassword_secret", key)
+    pending: asyncio.Future[str] | None = pending_lookups.get(pending_key)
+    if pending is None:
+        pending = pending_lookups[pending_key] = asyncio.ensure_future(
+            _async_resolve_onepassword_secret(*key)
+        )
+        pending.add_done_callback(
+            lambda _: pending_lookups.pop(pending_key, None)
+        )
+    value: str = await asyncio.shield(pending)
+    _set_cached_onepassword_secret(key, resource, value)
+    return value
+
+
+def _read_onepassword_secret(
+    resource: str,
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> str:
+    """
+    Read a secret, or retrieve it from the cache. Cached secrets are keyed
+    by authentication arguments resolved from the environment, so that
+    caching is invalidated by environment variable changes.
+    """
+    account, token, host = _resolve_auth_arguments(account, token, host)
+    key: tuple[str, str | None, str | None, str | None] = (
+        resource,
+        account,
+        token,
+        host,
+    )
+    cached: str | None = _get_cached_onepassword_secret(key)
+    if cached is not None:
+        return cached
+    value: str | None = _get_op_vault_secret(resource, account, token, host)
+    if (value is None) and _OP_ADAPTIVE_BACKENDS[0]:
+        value = _read_onepassword_secret_adaptively(
+            resource, account, token, host
+        )
+    if value is None:
+        if token:  # pragma: no cover
+            value = (
+                _resolve_connect_resource(token, host, resource)
+                if host
+                else asyncio_run(_async_resolve_resource(token, resource))
+            )
+        else:
+            value = _op_read(resource, account)
+    _set_cached_onepassword_secret(key, resource, value)
+    return value
+
+
+def get_onepassword_secret(
+    resource: str,
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> str:
+    """
+    Read a secret from 1Password using either the `onepassword-sdk` or
+    `onepasswordconnectsdk` libraries, or the `op` executable (1password CLI),
+    depending on the provided arguments and environment variables.
+
+    Parameters:
+        resource: A 1Password secret resource path. For example:
+            "op://Vault Name/Client Secret Item Name/credential"
+        account: A 1Password account URL. For example, individuals and families
+            will use "my.1password.com", while teams and businesses will use
+            a custom subdomain. This is only necessary when using
+            the 1Password CLI where multiple accounts are configured.
+        token: A 1Password or 1Password connect service account token.
+        host: A 1Password Connect host URL. This is required when using
+            self-hosted 1Password Connect.
+
+    Returns:
+        The resolved secret value.
+
+    Resolved secrets are cached according to `ONEPASSWORD_CACHE_POLICIES`
+    (see `set_onepassword_cache_policy`). By default, one-time passwords are
+    never cached, and all other secrets are cached indefinitely.
+    """
+    return _read_onepassword_secret(
+        resource, account=account, token=token, host=host
+    )
+
+
+def _get_unresolved_op_resources(
+    resources: Iterable[str],
+    account: str | None,
+    token: str | None = None,
+    host: str | None = None,
+) -> tuple[str, ...]:
+    resource: str
+    _evict_op_secrets()
+    return tuple(
+        dict.fromkeys(
+            resource
+            for resource in resources
+            if ((account, resource) not in _OP_SECRETS)
+            and (
+                _get_cached_onepassword_secret(
+                    (resource, account, token, host)
+                )
+                is None
+            )
+            and (_get_op_vault_secret(resource, account, token, host) is None)
+            # Secrets which are never cached are read individually, when
+            # needed
+            and (_get_onepassword_cache_ttl(resource) != 0)
+        )
+    )
+
+
+def _prefetch_onepassword_secrets(
+    resources: Iterable[str],
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> None:
+    """
+    When secrets will be read using the 1Password CLI, resolve all of those
+    not already resolved using a single `op inject` command. If this fails
+    (for example, because one of the references is invalid), nothing is
+    resolved, and errors surface when each secret is read individually.
+    """
+    account, token, host = _resolve_auth_arguments(account, token, host)
+    if token:  # pragma: no cover
+        return
+    unresolved: tuple[str, ...] = _get_unresolved_op_resources(
+        resources, account, token, host
+    )
+    if len(unresolved) > 1:
+        with suppress(FileNotFoundError, CalledProcessError):
+            resource: str
+            value: str
+            for resource, value in _op_inject(unresolved, account).items():
+                _set_op_secret(account, resource, value)
+
+
+async def _async_prefetch_onepassword_secrets(
+    resources: Iterable[str],
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> None:
+    """
+    Asynchronously prefetch secrets which will be read using the 1Password
+    CLI. See `_prefetch_onepassword_secrets`.
+    """
+    account, token, host = _resolve_auth_arguments(account, token, host)
+    if token:  # pragma: no cover
+        return
+    unresolved: tuple[str, ...] = _get_unresolved_op_resources(
+        resources, account, token, host
+    )
+    if len(unresolved) > 1:
+        with suppress(FileNotFoundError, CalledProcessError):
+            resource: str
+            value: str
+            for resource, value in (
+                await _async_op_inject(unresolved, account)
+            ).items():
+                _set_op_secret(account, resource, value)
+
+
+def get_onepassword_secrets(
+    resources: Iterable[str],
     account: str | None = None,
     token: str | None = None,
     host: str | None = None,
-) -> str:
+) -> dict[str, str]:
     """
-    Read a secret from 1Password using either the `onepassword-sdk` or
-    `onepasswordconnectsdk` libraries, or the `op` executable (1password CLI),
-    depending on the provided arguments and environment variables.
+    Read multiple secrets from 1Password. When using the `op` executable
+    (1password CLI), all secrets are resolved using a single `op inject`
+    command, rather than one `op read` command per secret.
 
     Parameters:
-        resource: A 1Password secret resource path. For example:
+        resources: 1Password secret resource paths. For example:
             "op://Vault Name/Client Secret Item Name/credential"
         account: A 1Password account URL. For example, individuals and families
             will use "my.1password.com", while teams and businesses will use
@@ -393,13 +2240,780 @@ def get_onepassword_secret(
             self-hosted 1Password Connect.
 
     Returns:
-        The resolved secret value.
+        A dictionary mapping each resource path to its resolved secret value.
     """
-    return _read_onepassword_secret(
-        resource, account=account, token=token, host=host, **os.environ
+    resources = tuple(dict.fromkeys(resources))
+    _prefetch_onepassword_secrets(
+        resources, account=account, token=token, host=host
+    )
+    resource: str
+    return {
+        resource: get_onepassword_secret(
+            resource, account=account, token=token, host=host
+        )
+        for resource in resources
+    }
+
+
+async def async_get_onepassword_secrets(
+    resources: Iterable[str],
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> dict[str, str]:
+    """
+    Asynchronously read multiple secrets from 1Password. When using the
+    `op` executable (1password CLI), all secrets are resolved using a single
+    `op inject` command, otherwise secrets are resolved concurrently.
+
+    Parameters:
+        resources: 1Password secret resource paths. For example:
+            "op://Vault Name/Client Secret Item Name/credential"
+        account: A 1Password account URL. For example, individuals and families
+            will use "my.1password.com", while teams and businesses will use
+            a custom subdomain. This is only necessary when using
+            the 1Password CLI where multiple accounts are configured.
+        token: A 1Password or 1Password connect service account token.
+        host: A 1Password Connect host URL. This is required when using
+            self-hosted 1Password Connect.
+
+    Returns:
+        A dictionary mapping each resource path to its resolved secret value.
+    """
+    resources = tuple(dict.fromkeys(resources))
+    await _async_prefetch_onepassword_secrets(
+        resources, account=account, token=token, host=host
+    )
+    resource: str
+    return dict(
+        zip(
+            resources,
+            await asyncio.gather(
+                *(
+                    async_read_onepassword_secret(
+                        resource, account=account, token=token, host=host
+                    )
+                    for resource in resources
+                )
+            ),
+            strict=True,
+        )
+    )
+
+
+def _get_op_vault_key(
+    vault: str,
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> tuple[str | None, str | None, str | None, str]:
+    """
+    Get the key under which a prefetched vault is stored, given the (resolved)
+    authentication arguments it was, or is to be, read using. Tokens are
+    represented by a fingerprint.
+    """
+    return (
+        account,
+        hashlib.sha256(token.encode()).hexdigest() if token else None,
+        host,
+        vault,
+    )
+
+
+def _get_op_vault_secret(
+    resource: str,
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> str | None:
+    """
+    Look up a secret in the vaults prefetched using the same (resolved)
+    authentication arguments, returning `None` if it is not found, or has
+    been held for longer than the applicable cache policy allows. References
+    with query parameters (for example, "?attribute=otp") are never resolved
+    from prefetched vaults.
+    """
+    if (not _OP_VAULTS) or ("?" in resource):
+        return None
+    vault: str
+    item: str
+    field: str
+    vault, item, field = _parse_resource(resource)
+    retrieved: float
+    items: dict[str, dict[str, tuple[str, str | None]]]
+    retrieved, items = _OP_VAULTS.get(
+        _get_op_vault_key(vault, account, token, host), (0, {})
+    )
+    value_type: tuple[str, str | None] | None = items.get(item, {}).get(field)
+    if value_type is None:
+        return None
+    value: str
+    field_type: str | None
+    value, field_type = value_type
+    if field_type:
+        _OP_FIELD_TYPES[resource] = field_type
+    ttl: float | None = _get_onepassword_cache_ttl(resource, field_type)
+    if (ttl is not None) and (monotonic() - retrieved >= ttl):
+        return None
+    return value
+
+
+def _index_op_item_fields(
+    fields: Iterable[tuple[str, str, str | None, str | None, str | None, Any]],
+) -> dict[str, tuple[str, str | None]]:
+    """
+    Map field IDs and labels (with and without section IDs or labels) to
+    field values and types, given tuples of field ID, field label, section
+    ID, section label, value, and type.
+    """
+
+    def iter_keys_values() -> Iterable[tuple[str, tuple[str, str | None]]]:
+        field_id: str
+        label: str
+        section_id: str | None
+        section_label: str | None
+        value: str | None
+        field_type: Any
+        for (
+            field_id,
+            label,
+            section_id,
+            section_label,
+            value,
+            field_type,
+        ) in fields:
+            if value is None:
+                continue
+            value_type: tuple[str, str | None] = (
+                value,
+                _normalize_field_type(field_type),
+            )
+            yield field_id, value_type
+            if label:
+                yield label, value_type
+            if section_id:
+                yield f"{section_id}/{field_id}", value_type
+            if section_label and label:
+                yield f"{section_label}/{label}", value_type
+
+    return _get_unambiguous_mapping(iter_keys_values())
+
+
+def _set_op_vault(
+    vault_id: str,
+    vault_name: str,
+    items: Iterable[tuple[str, str, dict[str, tuple[str, str | None]]]],
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> None:
+    """
+    Index a prefetched vault, given tuples of item ID, item title, and
+    fields (see `_index_op_item_fields`), and the (resolved) authentication
+    arguments it was read using.
+    """
+    item_id: str
+    title: str
+    fields: dict[str, tuple[str, str | None]]
+    key: str
+    vault: tuple[float, dict[str, dict[str, tuple[str, str | None]]]] = (
+        monotonic(),
+        _get_unambiguous_mapping(
+            (key, fields)
+            for item_id, title, fields in items
+            for key in (item_id, title)
+        ),
+    )
+    _OP_VAULTS[_get_op_vault_key(vault_id, account, token, host)] = vault
+    _OP_VAULTS[_get_op_vault_key(vault_name, account, token, host)] = vault
+
+
+def _find_id_name(
+    vault: str, vaults: Iterable[tuple[str, str]]
+) -> tuple[str, str]:
+    """
+    Find the ID and name (or title) of a vault or item, given its ID or
+    name, amongst tuples of ID and name.
+    """
+    id_: str
+    name: str
+    for id_, name in vaults:
+        if vault in (id_, name):
+            return id_, name
+    raise KeyError(vault)
+
+
+def _parse_op_item_get_output(
+    output: str,
+) -> Iterable[tuple[str, str, str, str, dict[str, tuple[str, str | None]]]]:
+    """
+    Parse the concatenated JSON objects output by `op item get` for multiple
+    items, yielding tuples of vault ID, vault name, item ID, item title, and
+    fields.
+    """
+    decoder: json.JSONDecoder = json.JSONDecoder()
+    output = output.strip()
+    index: int = 0
+    item: dict[str, Any]
+    field: dict[str, Any]
+    while index < len(output):
+        item, index = decoder.raw_decode(output, index)
+        while output[index : index + 1].isspace():
+            index += 1
+        yield (
+            item.get("vault", {}).get("id", ""),
+            item.get("vault", {}).get("name", ""),
+            item["id"],
+            item.get("title", ""),
+            _index_op_item_fields(
+                (
+                    field["id"],
+                    field.get("label", ""),
+                    field.get("section", {}).get("id"),
+                    field.get("section", {}).get("label"),
+                    field.get("value"),
+                    field.get("type"),
+                )
+                for field in item.get("fields", ())
+            ),
+        )
+
+
+def _set_op_cli_vault(
+    vault: str, output: str, account: str | None = None
+) -> None:
+    """
+    Index a prefetched vault, given the output of `op item get` for all of
+    its items, and the account it was read from.
+    """
+    items: tuple[
+        tuple[str, str, str, str, dict[str, tuple[str, str | None]]], ...
+    ] = tuple(_parse_op_item_get_output(output))
+    vault_id: str
+    vault_name: str
+    vault_id, vault_name = next(
+        (item[:2] for item in items if item[0] and item[1]), (vault, vault)
+    )
+    _set_op_vault(
+        vault_id, vault_name, (item[2:] for item in items), account=account
+    )
+
+
+async def _async_prefetch_sdk_vault(
+    token: str, vault: str, account: str | None = None
+) -> None:  # pragma: no cover
+    """
+    Prefetch a vault using the `onepassword-sdk` library, retrieving all of
+    its items in a single request.
+    """
+    client: Client = await _async_get_client(token)
+    vault_id: str
+    vault_name: str
+    vault_id, vault_name = _find_id_name(
+        vault,
+        (
+            (overview.id, overview.title)
+            for overview in await _async_call_rate_limited(
+                token, client.vaults.list
+            )
+        ),
+    )
+    item_ids: list[str] = [
+        overview.id
+        for overview in await _async_call_rate_limited(
+            token, client.items.list, vault_id
+        )
+    ]
+    items: list[Any] = []
+    if item_ids:
+        response: ItemsGetAllResponse = await _async_call_rate_limited(
+            token, client.items.get_all, vault_id, item_ids
+        )
+        items = [
+            item_response.content
+            for item_response in response.individual_responses
+            if item_response.content is not None
+        ]
+    _set_op_vault(
+        vault_id,
+        vault_name,
+        (
+            (
+                item.id,
+                item.title,
+                _index_op_item_fields(
+                    (
+                        field.id,
+                        field.title,
+                        field.section_id,
+                        {
+                            section.id: section.title
+                            for section in item.sections
+                        }.get(field.section_id),
+                        field.value,
+                        field.field_type,
+                    )
+                    for field in item.fields
+                ),
+            )
+            for item in items
+        ),
+        account=account,
+        token=token,
+    )
+
+
+async def _async_prefetch_connect_vault(
+    token: str, host: str, vault: str, account: str | None = None
+) -> None:
+    """
+    Prefetch a vault using the `onepasswordconnectsdk` library, retrieving
+    its items concurrently.
+    """
+    client: AsyncClient = _get_async_connect_client(token, host)
+    vaults: list[Vault] = await _async_call_rate_limited(
+        token, client.get_vaults
+    )
+    _CONNECT_IDS[(host, token)] = _index_connect_ids(vaults)
+    vault_id: str
+    vault_name: str
+    vault_id, vault_name = _find_id_name(
+        vault, ((vault_.id, vault_.name) for vault_ in vaults)
+    )
+    summaries: list[SummaryItem] = await _async_call_rate_limited(
+        token, client.get_items, vault_id
+    )
+    _CONNECT_IDS[(host, token, vault_id)] = _index_connect_ids(summaries)
+    items: list[Item] = await asyncio.gather(
+        *(
+            _async_call_rate_limited(
+                token, client.get_item_by_id, summary.id, vault_id
+            )
+            for summary in summaries
+        )
+    )
+    item: Item
+    for item in items:
+        _set_connect_item(host, token, item)
+    _set_op_vault(
+        vault_id,
+        vault_name,
+        (
+            (
+                item.id,
+                item.title,
+                _index_op_item_fields(
+                    (
+                        field.id,
+                        field.label,
+                        field.section.id if field.section else None,
+                        {
+                            section.id: section.label
+                            for section in item.sections or ()
+                        }.get(field.section.id if field.section else None),
+                        field.value,
+                        field.type,
+                    )
+                    for field in item.fields or ()
+                ),
+            )
+            for item in items
+        ),
+        account=account,
+        token=token,
+        host=host,
+    )
+
+
+def _get_op_item_list_args(vault: str) -> tuple[str, ...]:
+    return ("item", "list", "--vault", vault, "--format", "json")
+
+
+def prefetch_onepassword_vault(
+    vault: str,
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> None:
+    """
+    Read every item in a 1Password vault into memory, so that any secret
+    reference to a field in the vault (for example,
+    "op://Vault Name/Item Name/field") is subsequently resolved by
+    `read_onepassword_secret`, `async_read_onepassword_secret`, and
+    `apply_onepassword_arguments` without further requests. References
+    with query parameters (such as "?attribute=otp") are still resolved
+    by 1Password.
+
+    Items are retrieved in a single request when using the `onepassword-sdk`
+    library or the `op` executable (1password CLI), or concurrently when
+    using the `onepasswordconnectsdk` library.
+
+    Parameters:
+        vault: A 1Password vault name or ID.
+        account: A 1Password account URL. For example, individuals and families
+            will use "my.1password.com", while teams and businesses will use
+            a custom subdomain. This is only necessary when using
+            the 1Password CLI where multiple accounts are configured.
+        token: A 1Password or 1Password connect service account token.
+        host: A 1Password Connect host URL. This is required when using
+            self-hosted 1Password Connect.
+    """
+    account, token, host = _resolve_auth_arguments(account, token, host)
+    if token:  # pragma: no cover
+        asyncio_run(
+            _async_prefetch_connect_vault(token, host, vault, account)
+            if host
+            else _async_prefetch_sdk_vault(token, vault, account)
+        )
+        return
+    _set_op_cli_vault(
+        vault,
+        _check_op_output(
+            "item",
+            "get",
+            "-",
+            "--format",
+            "json",
+            account=account,
+            input=_check_op_output(
+                *_get_op_item_list_args(vault), account=account
+            ),
+        ),
+        account=account,
+    )
+
+
+async def async_prefetch_onepassword_vault(
+    vault: str,
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> None:
+    """
+    Asynchronously read every item in a 1Password vault into memory. See
+    `prefetch_onepassword_vault`.
+
+    Parameters:
+        vault: A 1Password vault name or ID.
+        account: A 1Password account URL. For example, individuals and families
+            will use "my.1password.com", while teams and businesses will use
+            a custom subdomain. This is only necessary when using
+            the 1Password CLI where multiple accounts are configured.
+        token: A 1Password or 1Password connect service account token.
+        host: A 1Password Connect host URL. This is required when using
+            self-hosted 1Password Connect.
+    """
+    account, token, host = _resolve_auth_arguments(account, token, host)
+    if token:  # pragma: no cover
+        if host:
+            await _async_prefetch_connect_vault(token, host, vault, account)
+        else:
+            await _async_prefetch_sdk_vault(token, vault, account)
+        return
+    _set_op_cli_vault(
+        vault,
+        await _async_check_op_output(
+            "item",
+            "get",
+            "-",
+            "--format",
+            "json",
+            account=account,
+            input=await _async_check_op_output(
+                *_get_op_item_list_args(vault), account=account
+            ),
+        ),
+        account=account,
+    )
+
+
+_OP_DOCUMENT_CHUNK_SIZE: int = 64 * 1024
+
+
+@contextmanager
+def _open_onepassword_document_destination(
+    destination: str | os.PathLike[str] | BinaryIO | None,
+) -> Iterator[BinaryIO]:
+    """
+    Open the file to which a document should be written: a private file
+    which replaces the file at `destination` only once the document has
+    been written in full, `destination` itself if it is an open file, or
+    an anonymous file (rewound once the document has been written) if
+    `destination` is `None`.
+    """
+    if isinstance(destination, (str, os.PathLike)):
+        with open_private_file(Path(destination)) as file:
+            yield file
+    elif destination is None:
+        file = create_anonymous_file("decorative-secrets-document")
+        try:
+            yield file
+        except BaseException:
+            file.close()
+            raise
+        file.seek(0)
+    else:
+        yield destination
+
+
+def _get_onepassword_document_result(
+    destination: str | os.PathLike[str] | BinaryIO | None, file: BinaryIO
+) -> Path | BinaryIO:
+    return (
+        Path(destination)
+        if isinstance(destination, (str, os.PathLike))
+        else file
+    )
+
+
+async def _async_read_sdk_document(
+    token: str, resource: str, file: BinaryIO
+) -> None:  # pragma: no cover
+    """
+    Read a document or file attachment using the `onepassword-sdk`
+    library. The SDK returns file contents in full, so these are written
+    to `file` without being decoded or otherwise copied.
+    """
+    client: Client = await _async_get_client(token)
+    vault: str
+    item: str
+    name: str
+    vault, item, name = _parse_resource(resource)
+    vault_id: str = _find_id_name(
+        vault,
+        (
+            (overview.id, overview.title)
+            for overview in await _async_call_rate_limited(
+                token, client.vaults.list
+            )
+        ),
+    )[0]
+    item_id: str = _find_id_name(
+        item,
+        (
+            (overview.id, overview.title)
+            for overview in await _async_call_rate_limited(
+                token, client.items.list, vault_id
+            )
+        ),
+    )[0]
+    item_: Any = await _async_call_rate_limited(
+        token, client.items.get, vault_id, item_id
+    )
+    attributes: Any
+    for attributes in (
+        *(item_file.attributes for item_file in item_.files or ()),
+        *((item_.document,) if item_.document else ()),
+    ):
+        if name in (attributes.id, attributes.name):
+            file.write(
+                await _async_call_rate_limited(
+                    token,
+                    client.items.files.read,
+                    vault_id,
+                    item_id,
+                    attributes,
+                )
+            )
+            return
+    raise KeyError(resource)
+
+
+async def _async_stream_connect_document(
+    token: str, host: str, resource: str, file: BinaryIO
+) -> None:
+    """
+    Stream a file attachment from 1Password Connect to `file`, in chunks.
+    """
+    client: AsyncClient = _get_async_connect_client(token, host)
+    vault: str
+    item: str
+    name: str
+    vault, item, name = _parse_resource(resource)
+    item_: Item = await _async_get_connect_item(
+        client, token, host, vault, item
+    )
+    files: list[File] = await _async_call_rate_limited(
+        token, client.get_files, item_.id, item_.vault.id
+    )
+    content_path: str | None = next(
+        (
+            file_.content_path
+            for file_ in files
+            if name in (file_.id, file_.name)
+        ),
+        None,
+    )
+    if content_path is None:
+        raise KeyError(resource)
+    position: int | None = file.tell() if file.seekable() else None
+
+    async def stream() -> None:
+        _rewind(file, position)
+        response: Response
+        async with client.session.stream("GET", content_path) as response:
+            if response.is_error:
+                message: str = (
+                    "Unable to retrieve file. Received "
+                    f"{response.status_code} for {content_path}"
+                )
+                raise FailedToRetrieveItemException(message)
+            chunk: bytes
+            async for chunk in response.aiter_bytes(_OP_DOCUMENT_CHUNK_SIZE):
+                file.write(chunk)
+
+    await _async_call_rate_limited(token, stream)
+
+
+async def _async_read_onepassword_document(
+    resource: str,
+    file: BinaryIO,
+    account: str | None,
+    token: str | None,
+    host: str | None,
+) -> None:
+    if token:  # pragma: no cover
+        if host:
+            await _async_stream_connect_document(token, host, resource, file)
+        else:
+            await _async_read_sdk_document(token, resource, file)
+        return
+    await _async_stream_op_output(
+        "read", "--no-newline", resource, file=file, account=account
     )
 
 
+@overload
+def read_onepassword_document(
+    resource: str,
+    destination: str | os.PathLike[str],
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> Path: ...
+
+
+@overload
+def read_onepassword_document(
+    resource: str,
+    destination: BinaryIO | None = None,
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> BinaryIO: ...
+
+
+def read_onepassword_document(
+    resource: str,
+    destination: str | os.PathLike[str] | BinaryIO | None = None,
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> Path | BinaryIO:
+    """
+    Read a 1Password document, or a file attached to an item, writing its
+    contents, unaltered, to a file. Unlike `get_onepassword_secret`, the
+    contents are never decoded as text or held in memory in full (except
+    when using the `onepassword-sdk` library, which does not support
+    streaming), making this suitable for certificates, keystores, and other
+    large or binary files.
+
+    Parameters:
+        resource: A 1Password secret resource reference, for example:
+            "op://Vault Name/Item Name/certificate.pem".
+        destination: A file path, to which the document is written
+            (atomically, and readable only by the current user), an open
+            binary file, to which the document is written from its
+            current position, or `None` (the default), in which case the
+            document is written to an anonymous in-memory file (on Linux,
+            otherwise a temporary file) which is discarded when closed.
+        account: A 1Password account URL. For example, individuals and families
+            will use "my.1password.com", while teams and businesses will use
+            a custom subdomain. This is only necessary when using
+            the 1Password CLI where multiple accounts are configured.
+        token: A 1Password or 1Password connect service account token.
+        host: A 1Password Connect host URL. This is required when using
+            self-hosted 1Password Connect.
+
+    Returns:
+        The destination path, if `destination` is a path, otherwise the
+        file to which the document was written. Anonymous files are
+        returned positioned at the start of the document.
+    """
+    account, token, host = _resolve_auth_arguments(account, token, host)
+    file: BinaryIO
+    with _open_onepassword_document_destination(destination) as file:
+        if token:  # pragma: no cover
+            asyncio_run(
+                _async_read_onepassword_document(
+                    resource, file, account, token, host
+                )
+            )
+        else:
+            _stream_op_output(
+                "read", "--no-newline", resource, file=file, account=account
+            )
+    return _get_onepassword_document_result(destination, file)
+
+
+@overload
+async def async_read_onepassword_document(
+    resource: str,
+    destination: str | os.PathLike[str],
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> Path: ...
+
+
+@overload
+async def async_read_onepassword_document(
+    resource: str,
+    destination: BinaryIO | None = None,
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> BinaryIO: ...
+
+
+async def async_read_onepassword_document(
+    resource: str,
+    destination: str | os.PathLike[str] | BinaryIO | None = None,
+    account: str | None = None,
+    token: str | None = None,
+    host: str | None = None,
+) -> Path | BinaryIO:
+    """
+    Asynchronously read a 1Password document, or a file attached to an
+    item, writing its contents, unaltered, to a file. See
+    `read_onepassword_document`.
+
+    Parameters:
+        resource: A 1Password secret resource reference, for example:
+            "op://Vault Name/Item Name/certificate.pem".
+        destination: A file path, an open binary file, or `None` (the
+            default) for an anonymous file.
+        account: A 1Password account URL. For example, individuals and families
+            will use "my.1password.com", while teams and businesses will use
+            a custom subdomain. This is only necessary when using
+            the 1Password CLI where multiple accounts are configured.
+        token: A 1Password or 1Password connect service account token.
+        host: A 1Password Connect host URL. This is required when using
+            self-hosted 1Password Connect.
+
+    Returns:
+        The destination path, if `destination` is a path, otherwise the
+        file to which the document was written.
+    """
+    account, token, host = _resolve_auth_arguments(account, token, host)
+    file: BinaryIO
+    with _open_onepassword_document_destination(destination) as file:
+        await _async_read_onepassword_document(
+            resource, file, account, token, host
+        )
+    return _get_onepassword_document_result(destination, file)
+
+
 # For backward compatibility
 read_onepassword_secret = get_onepassword_secret  # type: ignore[assignment]
 
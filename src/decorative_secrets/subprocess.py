@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import shutil
+from contextlib import suppress
+from io import UnsupportedOperation
 from subprocess import (
+    DEVNULL,
     PIPE,
     CalledProcessError,
     CompletedProcess,
+    Popen,
     run,
 )
 from subprocess import (
@@ -15,6 +22,11 @@ from typing import TYPE_CHECKING, Literal, overload
 if TYPE_CHECKING:
     from collections.abc import Iterable, Mapping
     from pathlib import Path
+    from typing import BinaryIO
+
+# The size of chunks in which `check_stream` and `async_check_stream` copy
+# output, when it cannot be written to a file descriptor directly
+_CHUNK_SIZE: int = 64 * 1024
 
 
 def get_default_shell() -> str | None:
@@ -214,3 +226,194 @@ def check_call(
         shell=shell,
         echo=echo,
     )
+
+
+@overload
+async def async_check_output(
+    args: tuple[str, ...],
+    *,
+    text: Literal[True] = True,
+    cwd: str | Path | None = None,
+    input: str | bytes | None = None,
+    env: Mapping[str, str] | None = None,
+) -> str: ...
+
+
+@overload
+async def async_check_output(
+    args: tuple[str, ...],
+    *,
+    text: Literal[False] = False,
+    cwd: str | Path | None = None,
+    input: str | bytes | None = None,
+    env: Mapping[str, str] | None = None,
+) -> bytes: ...
+
+
+async def async_check_output(
+    args: tuple[str, ...],
+    *,
+    text: bool = True,
+    cwd: str | Path | None = None,
+    input: str | bytes | None = None,  # noqa: A002
+    env: Mapping[str, str] | None = None,
+) -> str | bytes:
+    """
+    This function is an asynchronous counterpart to `check_output`, running
+    the command using `asyncio.create_subprocess_exec` so that the event
+    loop is not blocked while waiting for the command to complete. Stderr
+    is captured (not printed), and attached to any `CalledProcessError`
+    raised.
+
+    Parameters:
+        args: The command to run
+        text: Whether to return output as text (default: `True`). If
+            `False`, returns the output as `bytes`.
+        cwd: The working directory to run the command in
+        input: Input to send to the command
+        env: Environment variables to set for the command
+    """
+    if isinstance(input, str):
+        input = input.encode("utf-8")  # noqa: A001
+    process: asyncio.subprocess.Process = await asyncio.create_subprocess_exec(
+        *args,
+        stdin=PIPE if input is not None else DEVNULL,
+        stdout=PIPE,
+        stderr=PIPE,
+        cwd=cwd or None,
+        env=env,
+    )
+    stdout: bytes
+    stderr: bytes
+    try:
+        stdout, stderr = await process.communicate(input)
+    except asyncio.CancelledError:
+        # Don't leave an orphaned process running if the caller gives up
+        with suppress(ProcessLookupError):
+            process.kill()
+        await process.wait()
+        raise
+    if process.returncode:
+        raise CalledProcessError(
+            process.returncode, args, output=stdout, stderr=stderr
+        )
+    if text:
+        return stdout.decode("utf-8", errors="ignore").rstrip()
+    return stdout.rstrip()
+
+
+def _get_fileno(file: BinaryIO) -> int | None:
+    """
+    Get the file descriptor for `file`, after flushing any buffered writes,
+    or `None` if it does not have one (for example, an `io.BytesIO` object).
+    """
+    try:
+        file.flush()
+        return file.fileno()
+    except (AttributeError, OSError, UnsupportedOperation):
+        return None
+
+
+def _sync_file_position(file: BinaryIO, fileno: int | None) -> None:
+    """
+    Move `file` to the offset of its file descriptor, after a command has
+    written to the descriptor directly, since buffered files may not
+    otherwise know that the offset has changed.
+    """
+    if (fileno is not None) and file.seekable():
+        file.seek(os.lseek(fileno, 0, os.SEEK_CUR))
+
+
+def check_stream(
+    args: tuple[str, ...],
+    file: BinaryIO,
+    *,
+    cwd: str | Path | None = None,
+    env: Mapping[str, str] | None = None,
+) -> None:
+    """
+    This function runs a command and writes its output, unaltered, to a
+    binary file. Where `file` has a file descriptor, it is passed to the
+    command as its stdout, so output is never held in memory, otherwise
+    output is copied in chunks. Stderr is captured (not printed), and
+    attached to any `CalledProcessError` raised.
+
+    Parameters:
+        args: The command to run
+        file: A binary file to which the command's output will be written
+        cwd: The working directory to run the command in
+        env: Environment variables to set for the command
+    """
+    fileno: int | None = _get_fileno(file)
+    with TemporaryFile() as stderr:
+        process: Popen
+        with Popen(
+            args,
+            stdin=DEVNULL,
+            stdout=PIPE if fileno is None else fileno,
+            stderr=stderr,
+            cwd=cwd or None,
+            env=env,
+        ) as process:
+            if process.stdout is not None:
+                shutil.copyfileobj(process.stdout, file, _CHUNK_SIZE)
+        _sync_file_position(file, fileno)
+        if process.returncode:
+            stderr.seek(0)
+            raise CalledProcessError(
+                process.returncode, args, stderr=stderr.read()
+            )
+
+
+async def async_check_stream(
+    args: tuple[str, ...],
+    file: BinaryIO,
+    *,
+    cwd: str | Path | None = None,
+    env: Mapping[str, str] | None = None,
+) -> None:
+    """
+    This function is an asynchronous counterpart to `check_stream`.
+
+    Parameters:
+        args: The command to run
+        file: A binary file to which the command's output will be written
+        cwd: The working directory to run the command in
+        env: Environment variables to set for the command
+    """
+    fileno: int | None = _get_fileno(file)
+    process: asyncio.subprocess.Process = await asyncio.create_subprocess_exec(
+        *args,
+        stdin=DEVNULL,
+        stdout=PIPE if fileno is None else fileno,
+        stderr=PIPE,
+        cwd=cwd or None,
+        env=env,
+    )
+
+    async def copy() -> None:
+        if process.stdout is None:
+            return
+        chunk: bytes = await process.stdout.read(_CHUNK_SIZE)
+        while chunk:
+            file.write(chunk)
+            chunk = await process.stdout.read(_CHUNK_SIZE)
+
+    stderr: bytes
+    try:
+        stderr = (
+            await asyncio.gather(
+                process.stderr.read() if process.stderr else asyncio.sleep(0),
+                copy(),
+            )
+        )[0] or b""
+        await process.wait()
+    except asyncio.CancelledError:
+        # Don't leave an orphaned process running if the caller gives up
+        with suppress(ProcessLookupError):
+            process.kill()
+        await process.wait()
+        raise
+    _sync_file_position(file, fileno)
+    if process.returncode:
+        raise CalledProcessError(process.returncode, args, stderr=stderr)
@@ -0,0 +1,142 @@
+"""
+Helpers for benchmarking secret resolution under thread and asyncio
+concurrency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from math import ceil
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+# The number of calls made by each benchmark, which can be increased (using
+# the `BENCHMARK_CALLS` environment variable) for more stable measurements
+BENCHMARK_CALLS: int = int(os.getenv("BENCHMARK_CALLS", "100"))
+
+
+def get_percentile(values: Sequence[float], percent: float) -> float:
+    """
+    Get the nearest-rank percentile of `values`.
+    """
+    ordered: list[float] = sorted(values)
+    return ordered[max(ceil(len(ordered) * percent / 100) - 1, 0)]
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """
+    Parameters:
+        name: The name of the benchmark.
+        concurrency: The number of threads or tasks making calls.
+        seconds: The total elapsed time.
+        latencies: The time taken by each call, in seconds.
+        errors: The number of calls which raised an exception.
+    """
+
+    name: str
+    concurrency: int
+    seconds: float
+    latencies: tuple[float, ...]
+    errors: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """
+        The number of calls completed per second.
+        """
+        return len(self.latencies) / self.seconds if self.seconds else 0
+
+    @property
+    def p50(self) -> float:
+        return get_percentile(self.latencies, 50)
+
+    @property
+    def p99(self) -> float:
+        return get_percentile(self.latencies, 99)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {len(self.latencies)} calls, "
+            f"concurrency {self.concurrency}, "
+            f"{self.throughput:.1f} calls/s, "
+            f"p50 {self.p50 * 1000:.2f} ms, "
+            f"p99 {self.p99 * 1000:.2f} ms, "
+            f"{self.errors} errors"
+        )
+
+
+def benchmark_threads(
+    name: str,
+    function: Callable[[], Any],
+    calls: int = BENCHMARK_CALLS,
+    concurrency: int = 1,
+) -> BenchmarkResult:
+    """
+    Call `function` a number of times, using a pool of `concurrency`
+    threads, and print the result.
+    """
+
+    def call() -> tuple[float, bool]:
+        start: float = perf_counter()
+        try:
+            function()
+        except Exception:  # noqa: BLE001
+            return perf_counter() - start, False
+        return perf_counter() - start, True
+
+    start: float = perf_counter()
+    outcomes: list[tuple[float, bool]]
+    with ThreadPoolExecutor(concurrency) as executor:
+        outcomes = list(executor.map(lambda _: call(), range(calls)))
+    result: BenchmarkResult = BenchmarkResult(
+        name,
+        concurrency,
+        perf_counter() - start,
+        tuple(latency for latency, _ in outcomes),
+        sum(not succeeded for _, succeeded in outcomes),
+    )
+    print(result)  # noqa: T201
+    return result
+
+
+async def benchmark_tasks(
+    name: str,
+    function: Callable[[], Awaitable[Any]],
+    calls: int = BENCHMARK_CALLS,
+    concurrency: int = 1,
+) -> BenchmarkResult:
+    """
+    Await `function` a number of times, with no more than `concurrency`
+    calls in progress at once, and print the result.
+    """
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+
+    async def call() -> tuple[float, bool]:
+        async with semaphore:
+            start: float = perf_counter()
+            try:
+                await function()
+            except Exception:  # noqa: BLE001
+                return perf_counter() - start, False
+            return perf_counter() - start, True
+
+    start: float = perf_counter()
+    outcomes: list[tuple[float, bool]] = await asyncio.gather(
+        *(call() for _ in range(calls))
+    )
+    result: BenchmarkResult = BenchmarkResult(
+        name,
+        concurrency,
+        perf_counter() - start,
+        tuple(latency for latency, _ in outcomes),
+        sum(not succeeded for _, succeeded in outcomes),
+    )
+    print(result)  # noqa: T201
+    return result
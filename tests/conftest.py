@@ -1,9 +1,17 @@
+from __future__ import annotations
+
+import json
 import os
+from typing import TYPE_CHECKING
 
 import pytest
 
-from decorative_secrets import utilities
+from decorative_secrets import databricks, onepassword, utilities
 from decorative_secrets.onepassword import read_onepassword_secret
+from tests.fake_cli import FakeCLI, FakeCommandResponse, prepend_path
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 DEFAULT_OP_VAULT: str = "decorative-secrets-test"
 
@@ -55,3 +63,119 @@ def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
 
     monkeypatch.setattr(utilities, "sleep", lambda *_, **__: None)
     monkeypatch.setattr(utilities.asyncio, "sleep", _async_sleep)
+
+
+FAKE_DATABRICKS_HOST: str = "https://fake.cloud.databricks.com"
+
+
+@pytest.fixture
+def fake_op(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> FakeCLI:
+    """
+    Put a fake `op` executable on `PATH`, configured with one account, and
+    requiring a session to read secrets (which are read from
+    `fake_op.secrets`), with 1Password state isolated from other tests.
+    """
+    directory: Path = tmp_path / "bin"
+    fake: FakeCLI = FakeCLI(
+        directory,
+        "op",
+        {
+            "--version": FakeCommandResponse("2.30.0\n"),
+            "account list": FakeCommandResponse(
+                "URL                   EMAIL              USER ID\n"
+                "fake.1password.com    user@example.com   ABCDEFGHIJ\n"
+            ),
+            "signin": FakeCommandResponse(
+                'export OP_SESSION_ABCDEFGHIJ="fake-session-token"\n'
+            ),
+        },
+        requires_session=True,
+    )
+    monkeypatch.setenv("PATH", prepend_path(directory, os.environ))
+    name: str
+    for name in (
+        "OP_SERVICE_ACCOUNT_TOKEN",
+        "OP_CONNECT_TOKEN",
+        "OP_CONNECT_HOST",
+        "OP_ACCOUNT",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    for name in (
+        "_WHICH",
+        "_OP_SESSIONS",
+        "_OP_SECRETS",
+        "_OP_VALUES",
+        "_OP_VAULTS",
+        "_OP_FIELD_TYPES",
+    ):
+        monkeypatch.setattr(onepassword, name, {})
+    sessions_path: Path = tmp_path / "onepassword-sessions.json"
+    monkeypatch.setattr(
+        onepassword, "_get_op_sessions_path", lambda: sessions_path
+    )
+    return fake
+
+
+@pytest.fixture
+def fake_databricks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> FakeCLI:
+    """
+    Put a fake `databricks` executable on `PATH`, configured with one
+    authenticated profile (for `FAKE_DATABRICKS_HOST`), with cached CLI
+    output cleared, and the configuration file and token cache in a
+    temporary home directory.
+    """
+    directory: Path = tmp_path / "bin"
+    fake: FakeCLI = FakeCLI(
+        directory,
+        "databricks",
+        {
+            "--version": FakeCommandResponse("Databricks CLI v0.250.0\n"),
+            "auth profiles": FakeCommandResponse(
+                json.dumps(
+                    {
+                        "profiles": [
+                            {
+                                "name": "DEFAULT",
+                                "host": FAKE_DATABRICKS_HOST,
+                                "auth_type": "databricks-cli",
+                                "valid": True,
+                            }
+                        ]
+                    }
+                )
+            ),
+            "auth describe": FakeCommandResponse(
+                json.dumps(
+                    {
+                        "status": "success",
+                        "username": "user@example.com",
+                        "details": {
+                            "host": FAKE_DATABRICKS_HOST,
+                            "profile": "DEFAULT",
+                            "auth_type": "databricks-cli",
+                        },
+                    }
+                )
+            ),
+            "auth login": FakeCommandResponse(),
+            "bundle summary": FakeCommandResponse(
+                json.dumps(
+                    {
+                        "bundle": {"target": "dev"},
+                        "workspace": {"host": FAKE_DATABRICKS_HOST},
+                    }
+                )
+            ),
+        },
+    )
+    monkeypatch.setenv("PATH", prepend_path(directory, os.environ))
+    # Isolate the configuration file and CLI token cache
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv(
+        "DATABRICKS_CONFIG_FILE", str(tmp_path / ".databrickscfg")
+    )
+    monkeypatch.setattr(databricks, "_DATABRICKS_AUTH_CACHE", {})
+    databricks._databricks_auth_login.cache_clear()  # noqa: SLF001
+    return fake
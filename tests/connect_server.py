@@ -0,0 +1,335 @@
+"""
+A local stand-in for a 1Password Connect server, serving vaults and items
+from fixtures, with configurable latency and error injection.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from collections import Counter
+from hashlib import sha256
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from random import Random
+from time import sleep
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlparse
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+_FILTER_PATTERN: re.Pattern = re.compile(r'^(?:name|title) eq "(.*)"$')
+
+
+def get_connect_id(*names: str) -> str:
+    """
+    Get a deterministic, 26-character 1Password Connect ID for a vault,
+    item, field, or file, given its name and the names of its parents.
+    """
+    return sha256("/".join(names).encode("utf-8")).hexdigest()[:26]
+
+
+class ConnectServer:
+    """
+    A 1Password Connect stand-in, serving vaults and items (and
+    the files attached to them) over HTTP from a background thread.
+
+    Parameters:
+        vaults: A mapping of vault names to mappings of item titles to
+            mappings of field labels to values. `bytes` values are served as
+            file attachments, and `str` values as fields.
+        token: The bearer token which requests must be authenticated with.
+        latency: The number of seconds to wait before responding to each
+            request, or a function returning the number of seconds.
+        error_rate: The proportion of requests (from 0 to 1) which fail with
+            `error_status`.
+        error_status: The HTTP status returned for injected errors.
+        retry_after: The number of seconds sent in a `Retry-After` header
+            with injected errors, if any.
+        seed: A seed for the random number generator used to inject errors.
+    """
+
+    def __init__(
+        self,
+        vaults: Mapping[str, Mapping[str, Mapping[str, str | bytes]]],
+        token: str = "connect-token",
+        latency: float | Callable[[], float] = 0,
+        error_rate: float = 0,
+        error_status: int = 500,
+        retry_after: float | None = None,
+        seed: int = 0,
+    ) -> None:
+        self.token: str = token
+        self.latency: float | Callable[[], float] = latency
+        self.error_rate: float = error_rate
+        self.error_status: int = error_status
+        self.retry_after: float | None = retry_after
+        self.requests: Counter[str] = Counter()
+        self._random: Random = Random(seed)
+        self._lock: threading.Lock = threading.Lock()
+        self._vaults: dict[str, dict[str, Any]] = {}
+        self._items: dict[tuple[str, str], dict[str, Any]] = {}
+        self._files: dict[tuple[str, str, str], bytes] = {}
+        vault_name: str
+        items: Mapping[str, Mapping[str, str | bytes]]
+        for vault_name, items in vaults.items():
+            vault_id: str = get_connect_id(vault_name)
+            self._vaults[vault_id] = {"id": vault_id, "name": vault_name}
+            title: str
+            fields: Mapping[str, str | bytes]
+            for title, fields in items.items():
+                self._set_item(vault_name, title, fields)
+        self._server: ThreadingHTTPServer = ThreadingHTTPServer(
+            ("127.0.0.1", 0), self._get_request_handler()
+        )
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        return "http://{}:{}".format(*self._server.server_address[:2])
+
+    def _set_item(
+        self,
+        vault_name: str,
+        title: str,
+        fields: Mapping[str, str | bytes],
+        version: int = 1,
+    ) -> None:
+        vault_id: str = get_connect_id(vault_name)
+        item_id: str = get_connect_id(vault_name, title)
+        item_fields: list[dict[str, Any]] = []
+        item_files: list[dict[str, Any]] = []
+        label: str
+        value: str | bytes
+        for label, value in fields.items():
+            field_id: str = get_connect_id(vault_name, title, label)
+            if isinstance(value, bytes):
+                self._files[(vault_id, item_id, field_id)] = value
+                item_files.append(
+                    {
+                        "id": field_id,
+                        "name": label,
+                        "size": len(value),
+                        "content_path": (
+                            f"/v1/vaults/{vault_id}/items/{item_id}/files/"
+                            f"{field_id}/content"
+                        ),
+                    }
+                )
+            else:
+                item_fields.append(
+                    {
+                        "id": field_id,
+                        "label": label,
+                        "type": "CONCEALED",
+                        "value": value,
+                    }
+                )
+        self._items[(vault_id, item_id)] = {
+            "id": item_id,
+            "title": title,
+            "vault": {"id": vault_id},
+            "category": "LOGIN",
+            "version": version,
+            "fields": item_fields,
+            "files": item_files,
+        }
+
+    def update_item(
+        self, vault_name: str, title: str, fields: Mapping[str, str | bytes]
+    ) -> None:
+        """
+        Replace the fields of an item, incrementing its version.
+        """
+        with self._lock:
+            version: int = self._items[
+                (get_connect_id(vault_name), get_connect_id(vault_name, title))
+            ]["version"]
+            self._set_item(vault_name, title, fields, version + 1)
+
+    def _get_summary(self, item: dict[str, Any]) -> dict[str, Any]:
+        return {key: item[key] for key in ("id", "title", "vault", "version")}
+
+    def _route(  # noqa: C901, PLR0911
+        self, path: str, query: dict[str, list[str]]
+    ) -> tuple[str, int, Any]:
+        """
+        Get the route name, HTTP status, and response body (JSON-serializable
+        data, or `bytes`) for a request.
+        """
+        parts: list[str] = path.strip("/").split("/")
+        match: re.Match | None = _FILTER_PATTERN.match(
+            query.get("filter", [""])[0]
+        )
+        name: str | None = match.group(1) if match else None
+        if parts[:2] != ["v1", "vaults"]:
+            return "unknown", 404, {"status": 404, "message": "Not found"}
+        with self._lock:
+            if len(parts) == 2:  # noqa: PLR2004
+                return (
+                    "vaults",
+                    200,
+                    [
+                        vault
+                        for vault in self._vaults.values()
+                        if name in (None, vault["name"])
+                    ],
+                )
+            vault_id: str = parts[2]
+            if vault_id not in self._vaults:
+                return "vault", 404, {"status": 404, "message": "No vault"}
+            if len(parts) == 3:  # noqa: PLR2004
+                return "vault", 200, self._vaults[vault_id]
+            if len(parts) == 4:  # noqa: PLR2004
+                return (
+                    "items",
+                    200,
+                    [
+                        self._get_summary(item)
+                        for (item_vault_id, _), item in self._items.items()
+                        if (item_vault_id == vault_id)
+                        and (name in (None, item["title"]))
+                    ],
+                )
+            item: dict[str, Any] | None = self._items.get((vault_id, parts[4]))
+            if item is None:
+                return "item", 404, {"status": 404, "message": "No item"}
+            if len(parts) == 5:  # noqa: PLR2004
+                return "item", 200, item
+            if len(parts) == 6:  # noqa: PLR2004
+                return "files", 200, item["files"]
+            content: bytes | None = self._files.get(
+                (vault_id, item["id"], parts[6])
+            )
+            if content is None:
+                return "file", 404, {"status": 404, "message": "No file"}
+            if len(parts) == 7:  # noqa: PLR2004
+                return (
+                    "file",
+                    200,
+                    next(
+                        file
+                        for file in item["files"]
+                        if file["id"] == parts[6]
+                    ),
+                )
+            return "content", 200, content
+
+    def _get_request_handler(self) -> type[BaseHTTPRequestHandler]:
+        server: ConnectServer = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and bodies are written separately, so Nagle's algorithm
+            # would otherwise delay responses on persistent connections
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def _respond(
+                self,
+                status: int,
+                body: Any,
+                headers: Mapping[str, str] | None = None,
+            ) -> None:
+                data: bytes = (
+                    body
+                    if isinstance(body, bytes)
+                    else json.dumps(body).encode("utf-8")
+                )
+                self.send_response(status)
+                self.send_header(
+                    "Content-Type",
+                    "application/octet-stream"
+                    if isinstance(body, bytes)
+                    else "application/json",
+                )
+                self.send_header("Content-Length", str(len(data)))
+                name: str
+                value: str
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:  # noqa: N802
+                latency: float = (
+                    server.latency()
+                    if callable(server.latency)
+                    else server.latency
+                )
+                if latency:
+                    sleep(latency)
+                route: str
+                status: int
+                body: Any
+                headers: dict[str, str] = {}
+                if self.headers.get("Authorization") != (
+                    f"Bearer {server.token}"
+                ):
+                    route, status, body = (
+                        "unauthorized",
+                        401,
+                        {"status": 401, "message": "Invalid token"},
+                    )
+                else:
+                    with server._lock:  # noqa: SLF001
+                        failed: bool = (
+                            server._random.random()  # noqa: SLF001
+                            < server.error_rate
+                        )
+                    if failed:
+                        route, status, body = (
+                            "error",
+                            server.error_status,
+                            {
+                                "status": server.error_status,
+                                "message": "Injected error",
+                            },
+                        )
+                        if server.retry_after is not None:
+                            headers["Retry-After"] = str(server.retry_after)
+                    else:
+                        parse_result = urlparse(self.path)
+                        route, status, body = server._route(  # noqa: SLF001
+                            parse_result.path, parse_qs(parse_result.query)
+                        )
+                with server._lock:  # noqa: SLF001
+                    server.requests[route] += 1
+                self._respond(status, body, headers)
+
+        return RequestHandler
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            name="connect-server",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
@@ -0,0 +1,356 @@
+"""
+A local stand-in for the Databricks workspace API endpoints used by
+`databricks-sdk` to discover host metadata, to retrieve secrets (getting
+secrets, and listing scopes and secrets), and to authenticate (using a
+personal access token, or OAuth machine-to-machine credentials), serving
+secrets from fixtures, with configurable latency and error injection.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from random import Random
+from time import sleep
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlparse
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+
+class DatabricksServer:
+    """
+    A Databricks workspace API stand-in, serving secrets over HTTP from a
+    background thread.
+
+    Requests to the secrets API must be authenticated using either `token`
+    (as a personal access token), or an access token issued by the OAuth
+    token endpoint for `client_id` and `client_secret`.
+
+    Parameters:
+        scopes: A mapping of secret scope names to mappings of secret keys
+            to values.
+        token: A personal access token.
+        client_id: An OAuth client ID.
+        client_secret: An OAuth client secret.
+        token_lifetime: The number of seconds for which issued OAuth access
+            tokens are valid.
+        workspace_id: The workspace ID, served as host metadata.
+        latency: The number of seconds to wait before responding to each
+            request, or a function returning the number of seconds.
+        error_rate: The proportion of requests (from 0 to 1) to the secrets
+            API and token endpoint which fail with one of `error_statuses`.
+        error_statuses: The HTTP statuses returned for injected errors,
+            chosen at random. Responses with a status of 429 or 503 include
+            a `Retry-After` header of 0 seconds.
+        seed: A seed for the random number generator used to inject errors.
+    """
+
+    def __init__(
+        self,
+        scopes: Mapping[str, Mapping[str, str]],
+        token: str = "databricks-token",
+        client_id: str = "client-id",
+        client_secret: str = "client-secret",  # noqa: S107
+        token_lifetime: int = 3600,
+        workspace_id: str = "1234567890",
+        latency: float | Callable[[], float] = 0,
+        error_rate: float = 0,
+        error_statuses: Sequence[int] = (429, 503),
+        seed: int = 0,
+    ) -> None:
+        self.scopes: dict[str, dict[str, str]] = {
+            scope: dict(secrets) for scope, secrets in scopes.items()
+        }
+        self.token: str = token
+        self.client_id: str = client_id
+        self.client_secret: str = client_secret
+        self.token_lifetime: int = token_lifetime
+        self.workspace_id: str = workspace_id
+        self.latency: float | Callable[[], float] = latency
+        self.error_rate: float = error_rate
+        self.error_statuses: Sequence[int] = error_statuses
+        self.requests: Counter[str] = Counter()
+        self._random: Random = Random(seed)
+        self._lock: threading.Lock = threading.Lock()
+        self._access_tokens: set[str] = set()
+        self._server: ThreadingHTTPServer = ThreadingHTTPServer(
+            ("127.0.0.1", 0), self._get_request_handler()
+        )
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        return "http://{}:{}".format(*self._server.server_address[:2])
+
+    def _is_authorized(self, authorization: str | None) -> bool:
+        if not (authorization and authorization.startswith("Bearer ")):
+            return False
+        token: str = authorization[len("Bearer ") :]
+        with self._lock:
+            return (token == self.token) or (token in self._access_tokens)
+
+    def _issue_access_token(
+        self, authorization: str | None, body: dict[str, list[str]]
+    ) -> tuple[str, int, Any]:
+        """
+        Issue an OAuth access token for client credentials, passed using
+        HTTP basic authentication.
+        """
+        credentials: str = base64.b64encode(
+            f"{self.client_id}:{self.client_secret}".encode()
+        ).decode()
+        if (body.get("grant_type") != ["client_credentials"]) or (
+            authorization != f"Basic {credentials}"
+        ):
+            return (
+                "token",
+                401,
+                {
+                    "error": "invalid_client",
+                    "error_description": "Client authentication failed",
+                },
+            )
+        with self._lock:
+            access_token: str = f"oauth-token-{len(self._access_tokens)}"
+            self._access_tokens.add(access_token)
+        return (
+            "token",
+            200,
+            {
+                "access_token": access_token,
+                "token_type": "Bearer",
+                "expires_in": self.token_lifetime,
+                "scope": "all-apis",
+            },
+        )
+
+    def _route(
+        self, path: str, query: dict[str, list[str]]
+    ) -> tuple[str, int, Any]:
+        """
+        Get the route name, HTTP status, and response body for a request to
+        the secrets API.
+        """
+        scope: str = query.get("scope", [""])[0]
+        with self._lock:
+            if path == "/api/2.0/secrets/scopes/list":
+                return (
+                    "scopes",
+                    200,
+                    {
+                        "scopes": [
+                            {"name": name, "backend_type": "DATABRICKS"}
+                            for name in self.scopes
+                        ]
+                    },
+                )
+            secrets: dict[str, str] | None = self.scopes.get(scope)
+            if path == "/api/2.0/secrets/list":
+                if secrets is None:
+                    return (
+                        "list",
+                        404,
+                        {
+                            "error_code": "RESOURCE_DOES_NOT_EXIST",
+                            "message": f"Scope {scope} does not exist!",
+                        },
+                    )
+                return (
+                    "list",
+                    200,
+                    {
+                        "secrets": [
+                            {"key": key, "last_updated_timestamp": 0}
+                            for key in secrets
+                        ]
+                    },
+                )
+            if path == "/api/2.0/secrets/get":
+                key: str = query.get("key", [""])[0]
+                if (secrets is None) or (key not in secrets):
+                    return (
+                        "get",
+                        404,
+                        {
+                            "error_code": "RESOURCE_DOES_NOT_EXIST",
+                            "message": (
+                                f"Failed to get secret {key} for scope "
+                                f"{scope}."
+                            ),
+                        },
+                    )
+                return (
+                    "get",
+                    200,
+                    {
+                        "key": key,
+                        "value": base64.b64encode(
+                            secrets[key].encode()
+                        ).decode(),
+                    },
+                )
+        return (
+            "unknown",
+            404,
+            {"error_code": "ENDPOINT_NOT_FOUND", "message": "Not found"},
+        )
+
+    def _inject_error(self) -> tuple[str, int, Any] | None:
+        """
+        Get an injected error response, at random (with probability
+        `error_rate`).
+        """
+        with self._lock:
+            if self._random.random() >= self.error_rate:
+                return None
+            status: int = self._random.choice(self.error_statuses)
+        return (
+            "error",
+            status,
+            {
+                "error_code": (
+                    "TOO_MANY_REQUESTS"
+                    if status == 429  # noqa: PLR2004
+                    else "TEMPORARILY_UNAVAILABLE"
+                ),
+                "message": "Injected error",
+            },
+        )
+
+    def _dispatch(
+        self, url: str, authorization: str | None, data: bytes
+    ) -> tuple[str, int, Any]:
+        """
+        Get the route name, HTTP status, and response body for a request.
+        """
+        parse_result = urlparse(url)
+        path: str = parse_result.path
+        if path == "/.well-known/databricks-config":
+            return (
+                "host-metadata",
+                200,
+                {
+                    "oidc_endpoint": f"{self.url}/oidc",
+                    "workspace_id": self.workspace_id,
+                },
+            )
+        if path == "/oidc/.well-known/oauth-authorization-server":
+            return (
+                "oidc",
+                200,
+                {
+                    "authorization_endpoint": f"{self.url}/oidc/v1/authorize",
+                    "token_endpoint": f"{self.url}/oidc/v1/token",
+                },
+            )
+        if not (path.startswith("/api/") or path == "/oidc/v1/token"):
+            return (
+                "unknown",
+                404,
+                {"error_code": "ENDPOINT_NOT_FOUND", "message": "Not found"},
+            )
+        error: tuple[str, int, Any] | None = self._inject_error()
+        if error:
+            return error
+        if path == "/oidc/v1/token":
+            return self._issue_access_token(
+                authorization, parse_qs(data.decode())
+            )
+        if not self._is_authorized(authorization):
+            return (
+                "unauthorized",
+                401,
+                {
+                    "error_code": "UNAUTHENTICATED",
+                    "message": "Invalid access token.",
+                },
+            )
+        return self._route(path, parse_qs(parse_result.query))
+
+    def _get_request_handler(self) -> type[BaseHTTPRequestHandler]:
+        server: DatabricksServer = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and bodies are written separately, so Nagle's algorithm
+            # would otherwise delay responses on persistent connections
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def _respond(self, status: int, body: Any) -> None:
+                data: bytes = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                if status in (429, 503):
+                    self.send_header("Retry-After", "0")
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _handle(self) -> None:
+                latency: float = (
+                    server.latency()
+                    if callable(server.latency)
+                    else server.latency
+                )
+                if latency:
+                    sleep(latency)
+                length: int = int(self.headers.get("Content-Length") or 0)
+                route: str
+                status: int
+                body: Any
+                route, status, body = server._dispatch(  # noqa: SLF001
+                    self.path,
+                    self.headers.get("Authorization"),
+                    self.rfile.read(length) if length else b"",
+                )
+                with server._lock:  # noqa: SLF001
+                    server.requests[route] += 1
+                self._respond(status, body)
+
+            def do_GET(self) -> None:  # noqa: N802
+                self._handle()
+
+            def do_POST(self) -> None:  # noqa: N802
+                self._handle()
+
+        return RequestHandler
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            name="databricks-server",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
@@ -0,0 +1,249 @@
+"""
+Scriptable stand-ins for the `op` (1Password) and `databricks` command line
+interfaces, installed as executables so that they can be put on `PATH` and
+run as subprocesses, with configurable startup latency, outputs and
+failures. Every invocation is logged, so that tests and benchmarks can
+count the processes spawned.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+import sys
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+# The fake executable: it loads its configuration from "<name>.json" in its
+# own directory, logs its arguments to "calls.jsonl", and then responds as
+# configured for the longest command whose words appear, in order, in its
+# arguments. The `op` executable additionally implements `read` and `inject`
+# for the secrets in its configuration, and fails with a session error if
+# `requires_session` is set and no session is passed to it.
+_SCRIPT: str = """\
+#!{executable}
+import json
+import os
+import re
+import sys
+import time
+
+name = os.path.basename(sys.argv[0])
+directory = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(directory, name + ".json")) as file:
+    config = json.load(file)
+arguments = sys.argv[1:]
+with open(os.path.join(directory, "calls.jsonl"), "a") as file:
+    file.write(json.dumps([name, *arguments]) + "\\n")
+time.sleep(config["latency"])
+
+
+def matches(words):
+    index = 0
+    for argument in arguments:
+        if index < len(words) and argument == words[index]:
+            index += 1
+    return index == len(words)
+
+
+def respond(stdout="", stderr="", returncode=0, latency=0):
+    time.sleep(latency)
+    sys.stdout.write(stdout)
+    sys.stderr.write(stderr)
+    sys.exit(returncode)
+
+
+command = max(
+    (
+        command
+        for command in config["commands"]
+        if matches(command.split())
+    ),
+    key=lambda command: len(command.split()),
+    default=None,
+)
+if command is not None:
+    respond(**config["commands"][command])
+if name == "op" and arguments and arguments[0] in ("read", "inject"):
+    if config["requires_session"] and not (
+        "--session" in arguments
+        or any(key.startswith("OP_SESSION_") for key in os.environ)
+    ):
+        respond(
+            stderr="[ERROR] You are not currently signed in.\\n",
+            returncode=1,
+        )
+    secrets = config["secrets"]
+    if arguments[0] == "read":
+        reference = arguments[-1]
+        if reference not in secrets:
+            respond(
+                stderr=f"[ERROR] could not read secret {{reference}}\\n",
+                returncode=1,
+            )
+        respond(
+            secrets[reference]
+            + ("" if "--no-newline" in arguments else "\\n")
+        )
+    template = sys.stdin.read()
+    references = re.findall(r"{{{{ *(.*?) *}}}}", template)
+    missing = [
+        reference for reference in references if reference not in secrets
+    ]
+    if missing:
+        respond(
+            stderr=f"[ERROR] could not read secret {{missing[0]}}\\n",
+            returncode=1,
+        )
+    respond(
+        re.sub(
+            r"{{{{ *(.*?) *}}}}",
+            lambda match: secrets[match.group(1)],
+            template,
+        )
+    )
+respond(stderr=f"Error: unknown command {{arguments}}\\n", returncode=1)
+"""
+
+
+@dataclass(frozen=True)
+class FakeCommandResponse:
+    """
+    Parameters:
+        stdout: Text written to stdout.
+        stderr: Text written to stderr.
+        returncode: The exit status.
+        latency: The number of seconds to wait before responding (in
+            addition to the startup latency).
+    """
+
+    stdout: str = ""
+    stderr: str = ""
+    returncode: int = 0
+    latency: float = 0
+
+
+class FakeCLI:
+    """
+    A fake command line interface executable.
+
+    Parameters:
+        directory: The directory in which to install the executable. This
+            should be put on `PATH`.
+        name: The name of the executable, for example "op" or
+            "databricks".
+        commands: A mapping of commands (space-separated words which must
+            appear, in order, in the arguments) to responses.
+        latency: The number of seconds each invocation takes to start.
+        secrets: A mapping of secret references to values, read by
+            `op read` and `op inject`.
+        requires_session: If `True`, `op read` and `op inject` fail unless
+            a session is passed in an `OP_SESSION_*` environment variable
+            or using `--session`.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        name: str,
+        commands: Mapping[str, FakeCommandResponse] | None = None,
+        latency: float = 0,
+        secrets: Mapping[str, str] | None = None,
+        *,
+        requires_session: bool = False,
+    ) -> None:
+        self.directory: Path = directory
+        self.name: str = name
+        self.commands: dict[str, FakeCommandResponse] = dict(commands or {})
+        self.latency: float = latency
+        self.secrets: dict[str, str] = dict(secrets or {})
+        self.requires_session: bool = requires_session
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(_SCRIPT.format(executable=sys.executable))
+        self.path.chmod(
+            self.path.stat().st_mode
+            | stat.S_IXUSR
+            | stat.S_IXGRP
+            | stat.S_IXOTH
+        )
+        self.save()
+
+    @property
+    def path(self) -> Path:
+        return self.directory / self.name
+
+    @property
+    def _calls_path(self) -> Path:
+        return self.directory / "calls.jsonl"
+
+    def save(self) -> None:
+        """
+        Write the configuration read by the executable. This must be called
+        after modifying `commands`, `latency`, `secrets`, or
+        `requires_session`.
+        """
+        (self.directory / f"{self.name}.json").write_text(
+            json.dumps(
+                {
+                    "commands": {
+                        command: asdict(response)
+                        for command, response in self.commands.items()
+                    },
+                    "latency": self.latency,
+                    "secrets": self.secrets,
+                    "requires_session": self.requires_session,
+                }
+            )
+        )
+
+    def set_command(
+        self,
+        command: str,
+        stdout: str = "",
+        stderr: str = "",
+        returncode: int = 0,
+        latency: float = 0,
+    ) -> None:
+        """
+        Set the response to a command.
+        """
+        self.commands[command] = FakeCommandResponse(
+            stdout, stderr, returncode, latency
+        )
+        self.save()
+
+    @property
+    def calls(self) -> tuple[tuple[str, ...], ...]:
+        """
+        The arguments of each invocation of this executable.
+        """
+        try:
+            lines: list[str] = self._calls_path.read_text().splitlines()
+        except FileNotFoundError:
+            return ()
+        return tuple(
+            tuple(call[1:])
+            for call in map(json.loads, lines)
+            if call[0] == self.name
+        )
+
+    def clear_calls(self) -> None:
+        """
+        Clear the log of invocations (of all executables in the directory).
+        """
+        if self._calls_path.exists():
+            self._calls_path.unlink()
+
+
+def prepend_path(directory: Path, environ: Mapping[str, str]) -> str:
+    """
+    Get the value of `PATH` with `directory` prepended.
+    """
+    return os.pathsep.join(
+        (str(directory), *filter(None, (environ.get("PATH"),)))
+    )
@@ -0,0 +1,168 @@
+"""
+A fault-injection harness, wrapping secret providers (callbacks passed to
+`apply_callback_arguments`) to inject latency, intermittent exceptions and
+hangs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+from dataclasses import dataclass, field
+from functools import wraps
+from random import Random
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+# Bound at import, so that injected latency is unaffected by tests which
+# patch `asyncio.sleep` to skip retry backoff
+_async_sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+
+
+class InjectedError(ConnectionError):
+    """
+    An error raised by a provider with injected faults.
+    """
+
+
+def constant_latency(seconds: float) -> Callable[[Random], float]:
+    """
+    A latency distribution which always takes `seconds`.
+    """
+    return lambda random: seconds
+
+
+def uniform_latency(
+    minimum: float, maximum: float
+) -> Callable[[Random], float]:
+    """
+    A latency distribution uniform between `minimum` and `maximum` seconds.
+    """
+    return lambda random: random.uniform(minimum, maximum)
+
+
+def lognormal_latency(p50: float, p99: float) -> Callable[[Random], float]:
+    """
+    A long-tailed (log-normal) latency distribution with the given median
+    and 99th percentile, in seconds.
+    """
+    # The 99th percentile of a standard normal distribution
+    z99: float = 2.3263
+    sigma: float = math.log(p99 / p50) / z99
+    return lambda random: random.lognormvariate(math.log(p50), sigma)
+
+
+@dataclass
+class FaultInjector:
+    """
+    Injects faults into providers wrapped using `wrap` or `wrap_async`.
+    Each call first waits for a latency sampled from `latency`, and then
+    either hangs (with probability `hang_rate`), raises `error` (with
+    probability `error_rate`), or calls the provider.
+
+    Parameters:
+        latency: A function sampling a latency, in seconds, using the
+            injector's random number generator.
+        error_rate: The probability (from 0 to 1) of raising `error`.
+        error: The type of exception raised.
+        hang_rate: The probability (from 0 to 1) of hanging.
+        hang_seconds: How long a hanging call waits before raising `error`.
+        seed: A seed for the random number generator.
+    """
+
+    latency: Callable[[Random], float] = field(
+        default_factory=lambda: constant_latency(0)
+    )
+    error_rate: float = 0
+    error: type[Exception] = InjectedError
+    hang_rate: float = 0
+    hang_seconds: float = 60
+    seed: int = 0
+    calls: int = 0
+    errors: int = 0
+    hangs: int = 0
+    _random: Random = field(init=False, repr=False)
+    _lock: threading.Lock = field(
+        init=False, repr=False, default_factory=threading.Lock
+    )
+    _released: threading.Event = field(
+        init=False, repr=False, default_factory=threading.Event
+    )
+
+    def __post_init__(self) -> None:
+        self._random = Random(self.seed)
+
+    def _sample(self) -> tuple[float, str | None]:
+        """
+        Sample the latency, and fault (if any), for a call.
+        """
+        with self._lock:
+            self.calls += 1
+            latency: float = self.latency(self._random)
+            outcome: float = self._random.random()
+            if outcome < self.hang_rate:
+                self.hangs += 1
+                return latency, "hang"
+            if outcome < self.hang_rate + self.error_rate:
+                self.errors += 1
+                return latency, "error"
+        return latency, None
+
+    def release(self) -> None:
+        """
+        Release any hanging synchronous calls (which then raise `error`),
+        and stop further calls from hanging. This should be called once a
+        benchmark is complete, so that threads abandoned by `timeout` do not
+        outlive it.
+        """
+        self._released.set()
+
+    def wrap(self, provider: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap a synchronous provider.
+        """
+
+        @wraps(provider)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            latency: float
+            fault: str | None
+            latency, fault = self._sample()
+            if self._released.wait(latency):
+                fault = fault and "error"
+            if (fault == "hang") and not self._released.wait(
+                self.hang_seconds
+            ):
+                fault = "error"
+            if fault:
+                message: str = f"Injected {fault}"
+                raise self.error(message)
+            return provider(*args, **kwargs)
+
+        return wrapper
+
+    def wrap_async(
+        self, provider: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        """
+        Wrap an asynchronous provider. Hanging calls can be cancelled.
+        """
+
+        @wraps(provider)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            latency: float
+            fault: str | None
+            latency, fault = self._sample()
+            await _async_sleep(latency)
+            if fault == "hang":
+                await _async_sleep(
+                    0 if self._released.is_set() else self.hang_seconds
+                )
+            if fault:
+                message: str = f"Injected {fault}"
+                raise self.error(message)
+            return await provider(*args, **kwargs)
+
+        return wrapper
@@ -1,22 +1,37 @@
 from __future__ import annotations
 
 import asyncio
+import stat
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from inspect import Signature, signature
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
 from decorative_secrets._utilities import (
+    RateLimiter,
+    _BackgroundEventLoop,
+    async_lock,
     asyncio_run,
+    get_background_event_loop,
+    get_cache_directory,
     get_errors,
+    get_event_loop_objects,
     get_function_signature_applicable_args_kwargs,
     get_running_loop,
     get_signature_parameter_names_defaults,
     merge_function_signature_args_kwargs,
     unwrap_function,
+    write_private_file,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 def test_merge_function_signature_args_kwargs() -> None:
     """
@@ -157,8 +172,8 @@ def test_asyncio_run_without_running_loop() -> None:
 
 def test_asyncio_run_within_running_loop() -> None:
     """
-    When called from within a running loop, `asyncio_run` applies
-    `nest_asyncio` so the nested coroutine can still run to completion.
+    When called from within a running loop, `asyncio_run` still runs the
+    nested coroutine to completion.
     """
 
     async def inner() -> str:
@@ -170,6 +185,118 @@ def test_asyncio_run_within_running_loop() -> None:
     assert asyncio.run(outer()) == "nested"
 
 
+def test_asyncio_run_reuses_background_event_loop() -> None:
+    """
+    `asyncio_run` runs every coroutine on the same background event loop,
+    in another thread, so objects bound to the loop survive between calls.
+    """
+
+    async def get_state() -> tuple[asyncio.AbstractEventLoop, object, str]:
+        objects = get_event_loop_objects()
+        return (
+            asyncio.get_running_loop(),
+            objects.setdefault("client", object()),
+            threading.current_thread().name,
+        )
+
+    loop, client, thread_name = asyncio_run(get_state())
+    assert loop is get_background_event_loop()
+    assert thread_name != threading.current_thread().name
+    assert asyncio_run(get_state()) == (loop, client, thread_name)
+
+
+def test_asyncio_run_on_background_event_loop() -> None:
+    """
+    A coroutine already running on the background event loop can itself
+    call (synchronous code which calls) `asyncio_run` without deadlocking.
+    """
+
+    async def inner() -> str:
+        return "re-entrant"
+
+    async def outer() -> str:
+        return asyncio_run(inner())
+
+    assert asyncio_run(outer()) == "re-entrant"
+
+
+def test_background_event_loop_stop_and_reset() -> None:
+    """
+    A stopped background event loop is closed, with outstanding tasks
+    cancelled, and a new loop is started when next needed, as it is after
+    a fork.
+    """
+    background_event_loop: _BackgroundEventLoop = _BackgroundEventLoop()
+    cancelled: threading.Event = threading.Event()
+
+    async def wait_forever() -> None:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def start() -> asyncio.AbstractEventLoop:
+        asyncio.ensure_future(wait_forever())  # noqa: RUF006
+        await asyncio.sleep(0)
+        return asyncio.get_running_loop()
+
+    loop: asyncio.AbstractEventLoop = background_event_loop.run(start())
+    background_event_loop.stop()
+    assert cancelled.is_set()
+    assert loop.is_closed()
+    assert background_event_loop.run(start()) is not loop
+    loop = background_event_loop.get_loop()
+    background_event_loop.reset_after_fork()
+    assert background_event_loop.get_loop() is not loop
+    background_event_loop.stop()
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def test_rate_limiter() -> None:
+    """
+    `RateLimiter` allows a burst of requests, then queues further requests
+    (in threads and tasks alike) at the configured rate.
+    """
+    rate_limiter: RateLimiter = RateLimiter(100, burst=2)
+    start: float = time.monotonic()
+    rate_limiter.acquire()
+    rate_limiter.acquire()
+    assert time.monotonic() - start < 0.01
+    depths: list[int] = []
+
+    async def acquire() -> None:
+        await asyncio.sleep(0)
+        depths.append(rate_limiter.queue_depth)
+        await rate_limiter.async_acquire()
+
+    async def main() -> None:
+        await asyncio.gather(acquire(), acquire(), acquire())
+
+    asyncio.run(main())
+    assert time.monotonic() - start >= 0.025
+    assert max(depths) >= 1
+    assert rate_limiter.queue_depth == 0
+
+
+def test_rate_limiter_throttle_recover() -> None:
+    """
+    `throttle` halves the rate (no further than the minimum) and pauses
+    requests, while `recover` restores the rate gradually.
+    """
+    rate_limiter: RateLimiter = RateLimiter(100, burst=10, minimum_rate=40)
+    rate_limiter.throttle(retry_after=0.05)
+    assert rate_limiter.rate == 50
+    start: float = time.monotonic()
+    rate_limiter.acquire()
+    assert time.monotonic() - start >= 0.04
+    rate_limiter.throttle()
+    assert rate_limiter.rate == 40
+    rate_limiter.recover()
+    rate_limiter.recover()
+    assert rate_limiter.rate == 100
+
+
 def test_unwrap_function() -> None:
     """
     `unwrap_function` returns the original function beneath any
@@ -226,5 +353,132 @@ def test_get_errors_distinct_per_function() -> None:
     assert "a" not in get_errors(second)
 
 
+@pytest.mark.skipif(
+    sys.platform.startswith(("darwin", "win")),
+    reason="`XDG_CACHE_HOME` is only respected on Linux",
+)
+def test_get_cache_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    The cache directory is created beneath `XDG_CACHE_HOME`, accessible only
+    to the current user.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    path: Path = get_cache_directory()
+    assert path == tmp_path / "decorative-secrets"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o700
+
+
+def test_write_private_file(tmp_path: Path) -> None:
+    """
+    `write_private_file` replaces a file's contents, leaving it readable
+    only by the current user, and no temporary files behind.
+    """
+    path: Path = tmp_path / "private.json"
+    write_private_file(path, "{}")
+    write_private_file(path, b"[]")
+    assert path.read_text() == "[]"
+    assert list(tmp_path.iterdir()) == [path]
+    if not sys.platform.startswith("win"):
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+def test_async_lock() -> None:
+    """
+    `async_lock` serializes tasks against each other, and against threads
+    holding the same lock, without blocking the event loop.
+    """
+    lock: threading.Lock = threading.Lock()
+    order: list[str] = []
+
+    async def hold(name: str) -> None:
+        async with async_lock(lock):
+            order.append(f"{name} acquired")
+            await asyncio.sleep(0.05)
+            order.append(f"{name} released")
+
+    async def tick() -> None:
+        # This only runs while the lock is contended if the loop is free
+        await asyncio.sleep(0.01)
+        order.append("tick")
+
+    async def main() -> None:
+        lock.acquire()
+        threading.Timer(0.1, lock.release).start()
+        await asyncio.gather(hold("first"), hold("second"), tick())
+
+    asyncio.run(main())
+    assert order[0] == "tick"
+    assert order[1:] == [
+        order[1],
+        order[1].replace("acquired", "released"),
+        order[3],
+        order[3].replace("acquired", "released"),
+    ]
+    assert not lock.locked()
+
+
+def test_async_lock_cancelled_while_waiting() -> None:
+    """
+    A task cancelled while waiting on `async_lock` does not leave the lock
+    held once it is released by the thread holding it.
+    """
+    lock: threading.Lock = threading.Lock()
+
+    async def main() -> None:
+        lock.acquire()
+
+        async def wait() -> None:
+            async with async_lock(lock):
+                pass  # pragma: no cover
+
+        task: asyncio.Task = asyncio.ensure_future(wait())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        lock.release()
+        await asyncio.sleep(0.1)
+
+    asyncio.run(main())
+    assert not lock.locked()
+
+
+def test_async_lock_executor_not_used() -> None:
+    """
+    Many tasks waiting on `async_lock`, for a lock held by a thread, do not
+    occupy the event loop's default executor.
+    """
+    lock: threading.Lock = threading.Lock()
+    acquired: list[int] = []
+
+    async def wait(index: int) -> None:
+        async with async_lock(lock):
+            acquired.append(index)
+
+    async def main() -> None:
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=1)
+        )
+        lock.acquire()
+        tasks: list[asyncio.Task] = [
+            asyncio.ensure_future(wait(index)) for index in range(32)
+        ]
+        await asyncio.sleep(0.01)
+        # The executor is free for other work while the tasks wait
+        assert (
+            await asyncio.wait_for(asyncio.to_thread(lambda: "free"), 1)
+            == "free"
+        )
+        assert not acquired
+        lock.release()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    assert sorted(acquired) == list(range(32))
+    assert not lock.locked()
+
+
 if __name__ == "__main__":
     pytest.main(["-s", "-vv", __file__])
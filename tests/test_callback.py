@@ -204,5 +204,160 @@ def test_callback_uses_async_callback_for_coroutine_annotation() -> None:
     assert asyncio.run(result) == 6
 
 
+def test_async_function_awaits_async_callback() -> None:
+    """
+    Arguments of asynchronous functions are resolved by awaiting the
+    asynchronous callback (concurrently, for multiple parameters), rather
+    than by calling the synchronous callback on the event loop.
+    """
+    calls: list[str] = []
+
+    def callback(value: int) -> int:
+        calls.append("sync")
+        return value * 2
+
+    async def async_callback(value: int) -> int:
+        calls.append("async")
+        await asyncio.sleep(0.05)
+        return value * 2
+
+    @apply_callback_arguments(
+        callback, async_callback, x="x_lookup_arg", y="y_lookup_arg"
+    )
+    async def return_values(
+        x: int,
+        y: int,
+        x_lookup_arg: int | None = None,  # noqa: ARG001
+        y_lookup_arg: int | None = None,  # noqa: ARG001
+    ) -> tuple[int, int]:
+        return x, y
+
+    async def get_values() -> tuple[tuple[int, int], float]:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        start: float = loop.time()
+        values: tuple[int, int] = await return_values(
+            x_lookup_arg=1, y_lookup_arg=2
+        )
+        return values, loop.time() - start
+
+    values: tuple[int, int]
+    seconds: float
+    values, seconds = asyncio.run(get_values())
+    assert values == (2, 4)
+    assert calls == ["async", "async"]
+    assert seconds < 0.1
+
+    async def fail(value: int) -> int:  # noqa: ARG001
+        await asyncio.sleep(0)
+        message = "boom"
+        raise ValueError(message)
+
+    @apply_callback_arguments(fail, x="x_lookup_arg")
+    async def return_value(
+        x: int,
+        x_lookup_arg: int | None = None,  # noqa: ARG001
+    ) -> int:
+        return x
+
+    with pytest.raises(ArgumentsResolutionError, match="boom"):
+        asyncio.run(return_value(x_lookup_arg=3))
+
+
+def test_async_function_errors_aggregated() -> None:
+    """
+    Errors from lookups performed concurrently, for an asynchronous
+    function, are reported together, in the order parameters are mapped
+    (not the order lookups complete), and errors from a decorator are
+    discarded when a subsequent decorator resolves the parameter.
+    """
+
+    async def async_callback(value: str) -> str:
+        # Lookups for parameters mapped first complete last
+        await asyncio.sleep({"x": 0.03, "y": 0.02, "z": 0.01}[value[0]])
+        if value.endswith("fail"):
+            message: str = f"{value} failed"
+            raise ValueError(message)
+        return value
+
+    @apply_callback_arguments(async_callback, y="y_outer")
+    @apply_callback_arguments(
+        async_callback, x="x_lookup", y="y_lookup", z="z_lookup"
+    )
+    async def return_values(
+        x: str,
+        y: str,
+        z: str,
+        x_lookup: str | None = None,  # noqa: ARG001
+        y_lookup: str | None = None,  # noqa: ARG001
+        z_lookup: str | None = None,  # noqa: ARG001
+        y_outer: str | None = None,  # noqa: ARG001
+    ) -> tuple[str, str, str]:
+        return x, y, z
+
+    assert asyncio.run(
+        return_values(
+            x_lookup="x", y_lookup="y", z_lookup="z", y_outer="y-fail"
+        )
+    ) == ("x", "y", "z")
+    with pytest.raises(ArgumentsResolutionError) as exc_info:
+        asyncio.run(
+            return_values(
+                x_lookup="x-fail",
+                y_lookup="y",
+                z_lookup="z-fail",
+                y_outer="y-fail",
+            )
+        )
+    message: str = str(exc_info.value)
+    assert "y-fail failed" not in message
+    assert message.index("x-fail failed") < message.index("z-fail failed")
+    assert message.index("`x`") < message.index("`z`")
+
+
+def test_async_function_concurrent_calls_errors_isolated() -> None:
+    """
+    Errors encountered by concurrent calls to an asynchronous function, with
+    stacked decorators, are only reported for the call which encountered
+    them.
+    """
+
+    async def outer_callback(value: str) -> str:
+        await asyncio.sleep(0.01)
+        message: str = f"outer {value} failed"
+        raise ValueError(message)
+
+    async def inner_callback(value: str) -> str:
+        await asyncio.sleep(0.02)
+        if value == "fail":
+            message: str = f"inner {value} failed"
+            raise ValueError(message)
+        return value
+
+    @apply_callback_arguments(outer_callback, x="x_outer")
+    @apply_callback_arguments(inner_callback, x="x_inner")
+    async def return_value(
+        x: str,
+        x_outer: str | None = None,  # noqa: ARG001
+        x_inner: str | None = None,  # noqa: ARG001
+    ) -> str:
+        return x
+
+    async def get_values() -> list[str | BaseException]:
+        return await asyncio.gather(
+            return_value(x_outer="first", x_inner="fail"),
+            return_value(x_outer="second", x_inner="value"),
+            return_exceptions=True,
+        )
+
+    error: str | BaseException
+    value: str | BaseException
+    error, value = asyncio.run(get_values())
+    assert value == "value"
+    assert isinstance(error, ArgumentsResolutionError)
+    assert "outer first failed" in str(error)
+    assert "inner fail failed" in str(error)
+    assert "outer second failed" not in str(error)
+
+
 if __name__ == "__main__":
     pytest.main(["-s", "-vv", __file__])
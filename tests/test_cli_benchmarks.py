@@ -0,0 +1,338 @@
+"""
+Tests and benchmarks of secret resolution using the `op` and `databricks`
+command line interfaces, run against fake executables which count the
+processes spawned.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+import pytest
+
+from decorative_secrets import databricks, onepassword
+from decorative_secrets.databricks import databricks_auth_login
+from decorative_secrets.onepassword import (
+    async_read_onepassword_secret,
+    get_onepassword_secrets,
+    read_onepassword_secret,
+)
+from tests.benchmark import (
+    BENCHMARK_CALLS,
+    BenchmarkResult,
+    benchmark_tasks,
+    benchmark_threads,
+)
+from tests.conftest import FAKE_DATABRICKS_HOST
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tests.fake_cli import FakeCLI
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Fake executables are Python scripts run using a shebang",
+)
+
+ACCOUNT: str = "fake.1password.com"
+# Each call spawns one or more processes, so fewer calls are made than in
+# other benchmarks
+CLI_CALLS: int = min(BENCHMARK_CALLS, 20)
+COLD_CALLS: int = min(BENCHMARK_CALLS, 10)
+# The startup latency of the fake executables, in seconds
+STARTUP_LATENCY: float = 0.01
+
+
+def _reset_op_state() -> None:
+    """
+    Discard located executables, sessions, and cached secrets, so that the
+    next read is cold.
+    """
+    onepassword._WHICH.clear()  # noqa: SLF001
+    onepassword._OP_SESSIONS.clear()  # noqa: SLF001
+    onepassword._OP_VALUES.clear()  # noqa: SLF001
+    onepassword._get_op_sessions_path().unlink(  # noqa: SLF001
+        missing_ok=True
+    )
+
+
+def test_op_read(fake_op: FakeCLI) -> None:
+    """
+    Verify that reading a secret using the CLI signs in once, that
+    subsequent reads reuse the session, and that cached secrets are read
+    without spawning a process.
+    """
+    fake_op.secrets = {
+        "op://Vault/Item/password": "password",
+        "op://Vault/Item/username": "username",
+    }
+    fake_op.save()
+    assert (
+        read_onepassword_secret("op://Vault/Item/password", account=ACCOUNT)
+        == "password"
+    )
+    assert [call[0] for call in fake_op.calls] == [
+        "--version",
+        "signin",
+        "read",
+    ]
+    fake_op.clear_calls()
+    assert (
+        asyncio.run(
+            async_read_onepassword_secret(
+                "op://Vault/Item/username", account=ACCOUNT
+            )
+        )
+        == "username"
+    )
+    assert (
+        read_onepassword_secret("op://Vault/Item/password", account=ACCOUNT)
+        == "password"
+    )
+    assert [call[0] for call in fake_op.calls] == ["read"]
+
+
+def test_op_inject(fake_op: FakeCLI) -> None:
+    """
+    Verify that many secrets are read using a single `op inject` process.
+    """
+    resources: tuple[str, ...] = tuple(
+        f"op://Vault/Item {index}/password" for index in range(10)
+    )
+    fake_op.secrets = {
+        resource: f"password-{index}"
+        for index, resource in enumerate(resources)
+    }
+    fake_op.save()
+    assert get_onepassword_secrets(resources, account=ACCOUNT) == (
+        fake_op.secrets
+    )
+    assert [call[0] for call in fake_op.calls] == [
+        "--version",
+        "signin",
+        "inject",
+    ]
+
+
+def test_op_session_expired(fake_op: FakeCLI) -> None:
+    """
+    Verify that a read rejected due to an expired session signs in again,
+    and is retried once.
+    """
+    fake_op.secrets = {"op://Vault/Item/password": "password"}
+    fake_op.save()
+    onepassword._OP_SESSIONS[ACCOUNT] = onepassword._OpSession(  # noqa: SLF001
+        name=None, token="expired-token", expires=float("inf")
+    )
+    fake_op.requires_session = False
+    fake_op.set_command(
+        "read --session expired-token",
+        stderr="[ERROR] session expired, sign in to create a new session\n",
+        returncode=1,
+    )
+    assert (
+        read_onepassword_secret("op://Vault/Item/password", account=ACCOUNT)
+        == "password"
+    )
+    assert [call[0] for call in fake_op.calls] == [
+        "--version",
+        "read",
+        "signin",
+        "read",
+    ]
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+def test_benchmark_op_read(fake_op: FakeCLI, concurrency: int) -> None:
+    """
+    Measure `read_onepassword_secret`, using the CLI, when cold (locating
+    the CLI and signing in), warm (signed in), and cached, and count the
+    processes spawned by each.
+    """
+    fake_op.latency = STARTUP_LATENCY
+    fake_op.secrets = {"op://Vault/Item/password": "password"}
+    fake_op.save()
+
+    def read() -> str:
+        return read_onepassword_secret(
+            "op://Vault/Item/password", account=ACCOUNT
+        )
+
+    def read_cold() -> str:
+        _reset_op_state()
+        return read()
+
+    result: BenchmarkResult = benchmark_threads(
+        "read_onepassword_secret (CLI, cold)", read_cold, calls=COLD_CALLS
+    )
+    assert not result.errors
+    assert len(fake_op.calls) == 3 * COLD_CALLS
+    # Warm: signed in, but with secrets not cached
+    onepassword.set_onepassword_cache_policy("op://Vault/*", ttl=0)
+    onepassword._OP_VALUES.clear()  # noqa: SLF001
+    try:
+        fake_op.clear_calls()
+        result = benchmark_threads(
+            "read_onepassword_secret (CLI, warm)",
+            read,
+            calls=CLI_CALLS,
+            concurrency=concurrency,
+        )
+        assert not result.errors
+        assert len(fake_op.calls) == CLI_CALLS
+    finally:
+        onepassword.ONEPASSWORD_CACHE_POLICIES.pop(0)
+    read()
+    fake_op.clear_calls()
+    result = benchmark_threads(
+        "read_onepassword_secret (CLI, cached)", read, concurrency=concurrency
+    )
+    assert not result.errors
+    assert not fake_op.calls
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+def test_benchmark_async_op_read(fake_op: FakeCLI, concurrency: int) -> None:
+    """
+    Measure `async_read_onepassword_secret`, using the CLI, when warm, from
+    concurrent tasks, and count the processes spawned.
+    """
+    fake_op.latency = STARTUP_LATENCY
+    fake_op.secrets = {"op://Vault/Item/password": "password"}
+    fake_op.save()
+    onepassword.set_onepassword_cache_policy("op://Vault/*", ttl=0)
+    try:
+        asyncio.run(
+            async_read_onepassword_secret(
+                "op://Vault/Item/password", account=ACCOUNT
+            )
+        )
+        fake_op.clear_calls()
+        result: BenchmarkResult = asyncio.run(
+            benchmark_tasks(
+                "async_read_onepassword_secret (CLI, warm)",
+                lambda: async_read_onepassword_secret(
+                    "op://Vault/Item/password", account=ACCOUNT
+                ),
+                calls=CLI_CALLS,
+                concurrency=concurrency,
+            )
+        )
+    finally:
+        onepassword.ONEPASSWORD_CACHE_POLICIES.pop(0)
+    assert not result.errors
+    # Concurrent reads of the same secret share a process
+    assert 0 < len(fake_op.calls) <= CLI_CALLS
+
+
+def test_databricks_auth_cache(
+    fake_databricks: FakeCLI, tmp_path: Path
+) -> None:
+    """
+    Verify that Databricks CLI auth metadata is cached until the
+    configuration file or token cache is modified, and that no process is
+    spawned to confirm that a host with an unexpired cached token is logged
+    in.
+    """
+
+    def login() -> tuple[str, ...]:
+        fake_databricks.clear_calls()
+        databricks_auth_login(host=FAKE_DATABRICKS_HOST)
+        return tuple(" ".join(call[:2]) for call in fake_databricks.calls)
+
+    assert "auth describe" in login()
+    assert not login()
+    (tmp_path / ".databrickscfg").write_text(
+        f"[DEFAULT]\nhost = {FAKE_DATABRICKS_HOST}\n"
+    )
+    assert "auth describe" in login()
+    # Profiles are read from the configuration file, not the CLI
+    assert not any(
+        call[:2] == ("auth", "profiles") for call in fake_databricks.calls
+    )
+    describe: tuple[str, ...] = fake_databricks.calls[-1]
+    assert describe[describe.index("--profile") + 1] == "DEFAULT"
+    assert not login()
+    token_cache: Path = tmp_path / ".databricks" / "token-cache.json"
+    token_cache.parent.mkdir()
+    expiry: datetime = datetime.now(timezone.utc) + timedelta(hours=1)
+    token_cache.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "tokens": {
+                    f"{FAKE_DATABRICKS_HOST}/": {
+                        "access_token": "access-token",
+                        "token_type": "Bearer",
+                        "refresh_token": "refresh-token",
+                        # With nanosecond precision, as written by the CLI
+                        "expiry": expiry.strftime("%Y-%m-%dT%H:%M:%S.%f123Z"),
+                    }
+                },
+            }
+        )
+    )
+    databricks._DATABRICKS_AUTH_CACHE.clear()  # noqa: SLF001
+    assert not login()
+    # Hosts with no scheme match the cached token
+    fake_databricks.clear_calls()
+    databricks_auth_login(
+        host=FAKE_DATABRICKS_HOST.removeprefix("https://").upper()
+    )
+    assert not fake_databricks.calls
+    token_cache.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "tokens": {
+                    FAKE_DATABRICKS_HOST: {
+                        "access_token": "access-token",
+                        "expiry": "2020-01-01T00:00:00+00:00",
+                    }
+                },
+            }
+        )
+    )
+    assert "auth describe" in login()
+
+
+def test_benchmark_databricks_auth_login(fake_databricks: FakeCLI) -> None:
+    """
+    Measure `databricks_auth_login`, using the CLI, when cold (with CLI
+    output uncached) and warm, and count the processes spawned by each.
+    """
+    fake_databricks.latency = STARTUP_LATENCY
+    fake_databricks.save()
+
+    def login() -> None:
+        databricks_auth_login(host=FAKE_DATABRICKS_HOST)
+
+    def login_cold() -> None:
+        databricks._DATABRICKS_AUTH_CACHE.clear()  # noqa: SLF001
+        login()
+
+    result: BenchmarkResult = benchmark_threads(
+        "databricks_auth_login (cold)", login_cold, calls=COLD_CALLS
+    )
+    assert not result.errors
+    cold_calls: int = len(fake_databricks.calls)
+    fake_databricks.clear_calls()
+    result = benchmark_threads(
+        "databricks_auth_login (warm)", login, calls=COLD_CALLS
+    )
+    assert not result.errors
+    warm_calls: int = len(fake_databricks.calls)
+    print(  # noqa: T201
+        "databricks_auth_login processes per call: "
+        f"{cold_calls / COLD_CALLS:.1f} (cold), "
+        f"{warm_calls / COLD_CALLS:.1f} (warm)"
+    )
+    assert not any(
+        call[:2] == ("auth", "login") for call in fake_databricks.calls
+    )
+    assert warm_calls < cold_calls
@@ -1,24 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+import logging
 import os
-from typing import TYPE_CHECKING
+import pickle
+import signal
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 import pytest
+from cryptography.fernet import Fernet
+from databricks.sdk.config import Config
+from databricks.sdk.credentials_provider import (
+    OAuthCredentialsProvider,
+    OauthCredentialsStrategy,
+)
+from databricks.sdk.dbutils import SecretMetadata
 from databricks.sdk.errors.platform import ResourceDoesNotExist
+from databricks.sdk.oauth import Token
 from pyspark import cloudpickle
 
+from decorative_secrets import databricks
 from decorative_secrets.databricks import (
+    DatabricksSecretsBundle,
     _install_databricks_cli,
     _install_sh_databricks_cli,
     apply_databricks_secrets_arguments,
+    async_get_databricks_secret,
     get_databricks_secret,
+    get_databricks_secrets,
+    get_databricks_secrets_bundle,
     get_databricks_workspace_client,
 )
+from tests.conftest import FAKE_DATABRICKS_HOST
+from tests.databricks_server import DatabricksServer
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Iterator, Mapping
+    from pathlib import Path
 
     from databricks.sdk import WorkspaceClient
     from databricks.sdk.service.iam import User
 
+    from tests.fake_cli import FakeCLI
+
+
+@pytest.fixture(name="workspace_host")
+def get_workspace_host() -> Iterator[str]:
+    """
+    Serve a stand-in workspace host, so that workspace clients (which probe
+    their host for metadata) can be constructed without network access.
+    """
+    with DatabricksServer({}) as server:
+        yield server.url
+
+
+@pytest.fixture(name="workspace_clients")
+def get_workspace_clients(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Isolate the workspace client pool from other tests.
+    """
+    monkeypatch.setattr(databricks, "_WORKSPACE_CLIENTS", OrderedDict())
+    monkeypatch.setattr(databricks, "_WORKSPACE_CLIENT_LOCKS", {})
+
 
 def test_install_sh_databricks_cli() -> None:
     """
@@ -101,6 +149,633 @@ def test_apply_databricks_secret_arguments(
         os.environ.update(env)
 
 
+def test_async_get_databricks_secret(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Verify that asynchronous lookups of Databricks secrets are performed in
+    worker threads, so that the event loop is not blocked, that concurrent
+    lookups of the same secret share a retrieval, and that
+    `apply_databricks_secrets_arguments` uses them for asynchronous
+    functions.
+    """
+    threads: list[str] = []
+
+    def get_secret(scope: str, key: str, **kwargs: Any) -> str:  # noqa: ARG001
+        threads.append(threading.current_thread().name)
+        time.sleep(0.05)
+        return f"{scope}/{key}"
+
+    monkeypatch.setattr(databricks, "_get_secret", get_secret)
+
+    @apply_databricks_secrets_arguments(
+        my_secret="my_secret_databricks_secret",
+    )
+    async def get_my_secret(
+        my_secret: str,
+        my_secret_databricks_secret: str | None = None,  # noqa: ARG001
+    ) -> str:
+        return my_secret
+
+    async def get_secrets() -> tuple[list[str], int]:
+        ticks: int = 0
+        done: asyncio.Event = asyncio.Event()
+
+        async def tick() -> None:
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker: asyncio.Task = asyncio.create_task(tick())
+        values: list[str] = await asyncio.gather(
+            *(async_get_databricks_secret("scope", "key") for _ in range(4)),
+            *(
+                async_get_databricks_secret("scope", f"key-{index}")
+                for index in range(4)
+            ),
+            get_my_secret(my_secret_databricks_secret=("scope", "other")),
+        )
+        done.set()
+        await ticker
+        return values, ticks
+
+    values: list[str]
+    ticks: int
+    values, ticks = asyncio.run(get_secrets())
+    assert values == [
+        *(["scope/key"] * 4),
+        *(f"scope/key-{index}" for index in range(4)),
+        "scope/other",
+    ]
+    assert len(threads) == 6
+    assert all(
+        name.startswith("decorative-secrets-databricks") for name in threads
+    )
+    # The event loop kept running while secrets were retrieved
+    assert ticks > 5
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires `os.fork`")
+def test_async_get_databricks_secret_after_fork(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Verify that asynchronous lookups of Databricks secrets are performed in
+    a process forked after lookups were performed in its parent (the
+    parent's worker threads not existing in the child).
+    """
+
+    def get_secret(scope: str, key: str, **kwargs: Any) -> str:  # noqa: ARG001
+        return f"{scope}/{key}"
+
+    monkeypatch.setattr(databricks, "_get_secret", get_secret)
+    assert (
+        asyncio.run(async_get_databricks_secret("scope", "parent"))
+        == "scope/parent"
+    )
+    pid: int = os.fork()
+    if pid == 0:  # pragma: no cover
+        status: int = 1
+        try:
+            # Time out, rather than hang, if the lookup is never performed
+            signal.alarm(10)
+            if (
+                asyncio.run(async_get_databricks_secret("scope", "child"))
+                == "scope/child"
+            ):
+                status = 0
+        finally:
+            os._exit(status)
+    assert os.waitpid(pid, 0)[1] == 0
+
+
+@pytest.mark.usefixtures("fake_databricks", "workspace_clients")
+def test_get_databricks_workspace_client_profile(
+    workspace_host: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Verify that clients for an explicit profile ignore the host and
+    credentials in `DATABRICKS_*` environment variables, and that they can
+    be constructed concurrently without modifying `os.environ`.
+    """
+    config_file: Path = tmp_path / ".databrickscfg"
+    config_file.write_text(
+        "".join(
+            f"[profile-{index}]\n"
+            f"host = {workspace_host}\n"
+            f"token = profile-{index}-token\n"
+            for index in range(4)
+        )
+    )
+    monkeypatch.setenv("DATABRICKS_HOST", "https://env.cloud.databricks.com")
+    monkeypatch.setenv("DATABRICKS_TOKEN", "env-token")
+    # Credentials for another authentication type in the environment must
+    # not conflict with those of the profile
+    monkeypatch.setenv("DATABRICKS_CLIENT_ID", "env-client-id")
+    monkeypatch.setenv("DATABRICKS_CLIENT_SECRET", "env-client-secret")
+    # Settings unrelated to authentication, which the profile does not
+    # specify, are read from the environment
+    monkeypatch.setenv("DATABRICKS_CLUSTER_ID", "env-cluster-id")
+    done: threading.Event = threading.Event()
+    observed: set[str | None] = set()
+
+    def watch() -> None:
+        while not done.is_set():
+            observed.add(os.environ.get("DATABRICKS_HOST"))
+
+    watcher: threading.Thread = threading.Thread(target=watch)
+    watcher.start()
+    try:
+        with ThreadPoolExecutor(4) as executor:
+            clients: list[WorkspaceClient] = list(
+                executor.map(
+                    lambda index: get_databricks_workspace_client(
+                        profile=f"profile-{index}",
+                        config_file=str(config_file),
+                    ),
+                    range(4),
+                )
+            )
+    finally:
+        done.set()
+        watcher.join()
+    assert observed == {"https://env.cloud.databricks.com"}
+    index: int
+    client: WorkspaceClient
+    for index, client in enumerate(clients):
+        assert client.config.host == workspace_host
+        assert client.config.token == f"profile-{index}-token"
+        assert client.config.profile == f"profile-{index}"
+        assert client.config.auth_type == "pat"
+        assert client.config.cluster_id == "env-cluster-id"
+    with pytest.raises(ValueError, match="missing"):
+        get_databricks_workspace_client(
+            profile="missing", config_file=str(config_file)
+        )
+
+
+def test_databricks_config_profiles(
+    fake_databricks: FakeCLI, tmp_path: Path
+) -> None:
+    """
+    Verify that profiles are read from the configuration file without
+    spawning the CLI, and that hosts are mapped to the first matching
+    profile.
+    """
+    config_file: Path = tmp_path / ".databrickscfg"
+    config_file.write_text(
+        "[DEFAULT]\n"
+        "host = https://default.cloud.databricks.com/\n"
+        "\n"
+        "[pat]\n"
+        "host = adb-1234.5.azuredatabricks.net\n"
+        "token = %(not-interpolated)s\n"
+        "\n"
+        "[m2m]\n"
+        "host = https://M2M.gcp.databricks.com\n"
+        "client_id = client-id\n"
+        "client_secret = client-secret\n"
+        "\n"
+        "[duplicate]\n"
+        "host = https://m2m.gcp.databricks.com/\n"
+        "auth_type = databricks-cli\n"
+        "\n"
+        "[no-host]\n"
+        "account_id = account-id\n"
+    )
+    assert databricks._databricks_auth_profiles() == {  # noqa: SLF001
+        "profiles": [
+            {
+                "name": "DEFAULT",
+                "host": "https://default.cloud.databricks.com",
+                "cloud": "aws",
+                "auth_type": "databricks-cli",
+            },
+            {
+                "name": "pat",
+                "host": "https://adb-1234.5.azuredatabricks.net",
+                "cloud": "azure",
+                "auth_type": "pat",
+            },
+            {
+                "name": "m2m",
+                "host": "https://M2M.gcp.databricks.com",
+                "cloud": "gcp",
+                "auth_type": "oauth-m2m",
+            },
+            {
+                "name": "duplicate",
+                "host": "https://m2m.gcp.databricks.com",
+                "cloud": "gcp",
+                "auth_type": "databricks-cli",
+            },
+            {"name": "no-host"},
+        ]
+    }
+    get_host_profile: Callable[[str], str | None] = (
+        databricks._get_host_profile  # noqa: SLF001
+    )
+    assert get_host_profile("https://default.cloud.databricks.com") == (
+        "DEFAULT"
+    )
+    assert get_host_profile("https://adb-1234.5.azuredatabricks.net/") == "pat"
+    assert get_host_profile("m2m.gcp.databricks.com") == "m2m"
+    assert get_host_profile("https://unknown.cloud.databricks.com") is None
+    assert not fake_databricks.calls
+    # Files which cannot be parsed are read using the CLI
+    config_file.write_text("host = https://default.cloud.databricks.com\n")
+    assert get_host_profile(FAKE_DATABRICKS_HOST) == "DEFAULT"
+    assert [call[:2] for call in fake_databricks.calls] == [
+        ("--version",),
+        ("auth", "profiles"),
+    ]
+
+
+@pytest.mark.usefixtures("workspace_clients")
+def test_get_databricks_workspace_client_pool(
+    workspace_host: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Verify that workspace clients are pooled by normalized configuration
+    (constructed once, even when requested concurrently), that the pool is
+    bounded, and that pooled clients are replaced once expired.
+    """
+    monkeypatch.delenv("DATABRICKS_HOST", raising=False)
+    monkeypatch.setattr(databricks, "_WORKSPACE_CLIENT_POOL_SIZE", 2)
+    with ThreadPoolExecutor(8) as executor:
+        clients: list[WorkspaceClient] = list(
+            executor.map(
+                lambda index: get_databricks_workspace_client(
+                    host=f"{workspace_host}/" if index % 2 else workspace_host,
+                    token="token",
+                ),
+                range(8),
+            )
+        )
+    assert all(client is clients[0] for client in clients)
+    assert len(databricks._WORKSPACE_CLIENTS) == 1  # noqa: SLF001
+    other: WorkspaceClient = get_databricks_workspace_client(
+        host=workspace_host, token="other-token"
+    )
+    assert other is not clients[0]
+    get_databricks_workspace_client(host=workspace_host, token="third-token")
+    assert len(databricks._WORKSPACE_CLIENTS) == 2  # noqa: SLF001
+    # The least recently used client was evicted
+    assert (
+        get_databricks_workspace_client(host=workspace_host, token="token")
+        is not clients[0]
+    )
+    monkeypatch.setattr(databricks, "_WORKSPACE_CLIENT_LIFETIME", 0)
+    assert get_databricks_workspace_client(
+        host=workspace_host, token="third-token"
+    ) is not get_databricks_workspace_client(
+        host=workspace_host, token="third-token"
+    )
+
+
+@pytest.mark.usefixtures("fake_databricks", "workspace_clients")
+def test_refresh_workspace_client(
+    workspace_host: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Verify that a pooled client's OAuth token is refreshed in the
+    background, before it expires, by replacing the pooled client.
+    """
+    monkeypatch.setattr(databricks, "_WORKSPACE_CLIENT_REFRESH_MARGIN", 1.5)
+    monkeypatch.setattr(databricks, "_WORKSPACE_CLIENT_REFRESH_JITTER", 0)
+    tokens: list[Token] = []
+    lock: threading.Lock = threading.Lock()
+
+    def fetch_token() -> Token:
+        with lock:
+            # The first token expires almost immediately
+            token: Token = Token(
+                f"token-{len(tokens)}",
+                "Bearer",
+                expiry=datetime.now()  # noqa: DTZ005
+                + timedelta(seconds=2 if not tokens else 3600),
+            )
+            tokens.append(token)
+            return token
+
+    def get_credentials_provider(config: Config) -> OAuthCredentialsProvider:  # noqa: ARG001
+        token: Token | None = None
+
+        def get_token() -> Token:
+            nonlocal token
+            if token is None:
+                token = fetch_token()
+            return token
+
+        return OAuthCredentialsProvider(
+            lambda: {"Authorization": f"Bearer {get_token().access_token}"},
+            get_token,
+        )
+
+    credentials_strategy: OauthCredentialsStrategy = OauthCredentialsStrategy(
+        "fake-oauth", get_credentials_provider
+    )
+
+    def get_client() -> WorkspaceClient:
+        return get_databricks_workspace_client(
+            host=workspace_host, credentials_strategy=credentials_strategy
+        )
+
+    client: WorkspaceClient = get_client()
+    deadline: float = time.monotonic() + 10
+    while (get_client() is client) and (time.monotonic() < deadline):
+        time.sleep(0.05)
+    refreshed: WorkspaceClient = get_client()
+    assert refreshed is not client
+    # The replacement's token was fetched before it was pooled
+    assert len(tokens) == 2
+    assert refreshed.config.oauth_token() is tokens[1]
+    assert client.config.oauth_token() is tokens[0]
+
+
+@pytest.mark.usefixtures("workspace_clients")
+def test_pickle_pooled_workspace_client(
+    workspace_host: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Verify that pooled clients are pickled as a handle, without fetching a
+    token, which resolves to one client per process, that credentials
+    passed as arguments are retained (so that a process with no
+    `DATABRICKS_*` environment variables does not log in), and that
+    credentials loaded from a profile are not.
+    """
+
+    def oauth_token(self: Config) -> Token:  # noqa: ARG001
+        raise AssertionError
+
+    def databricks_auth_login(**_: Any) -> None:
+        raise AssertionError
+
+    config_file: Path = tmp_path / ".databrickscfg"
+    config_file.write_text(
+        f"[profile]\nhost = {workspace_host}\ntoken = profile-token\n"
+    )
+    client: WorkspaceClient = get_databricks_workspace_client(
+        host=workspace_host, token="token"
+    )
+    profile_client: WorkspaceClient = get_databricks_workspace_client(
+        profile="profile", config_file=str(config_file)
+    )
+    monkeypatch.setattr(Config, "oauth_token", oauth_token)
+    monkeypatch.setattr(
+        databricks, "databricks_auth_login", databricks_auth_login
+    )
+    pickled_client: bytes = pickle.dumps(client)
+    pickled_profile_client: bytes = pickle.dumps(profile_client)
+    assert b"profile-token" not in pickled_profile_client
+    # Unpickling in the same process resolves to the pooled client
+    assert pickle.loads(pickled_client) is client  # noqa: S301
+    assert pickle.loads(pickled_profile_client) is profile_client  # noqa: S301
+    # Unpickling in another process (with an empty pool, and no
+    # `DATABRICKS_*` environment variables) constructs one client, which is
+    # reused
+    monkeypatch.setattr(databricks, "_WORKSPACE_CLIENTS", OrderedDict())
+    name: str
+    for name in tuple(os.environ):
+        if name.startswith("DATABRICKS_"):
+            monkeypatch.delenv(name)
+    unpickled_client: WorkspaceClient = pickle.loads(pickled_client)  # noqa: S301
+    assert unpickled_client is not client
+    assert unpickled_client.config.host == workspace_host
+    assert unpickled_client.config.token == "token"
+    assert pickle.loads(pickled_client) is unpickled_client  # noqa: S301
+    assert pickle.loads(pickle.dumps(unpickled_client)) is unpickled_client  # noqa: S301
+    # Credentials for a profile are loaded by the unpickling process
+    unpickled_profile_client: WorkspaceClient = pickle.loads(  # noqa: S301
+        pickled_profile_client
+    )
+    assert unpickled_profile_client is not profile_client
+    assert unpickled_profile_client.config.token == "profile-token"
+
+
+def test_get_databricks_secrets(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Verify that secrets are retrieved from a scope concurrently, with the
+    scope's keys listed if not provided, that errors are returned per key,
+    and that retrieved secrets are cached.
+    """
+    secrets: dict[str, str] = {
+        f"key-{index}": f"value-{index}" for index in range(10)
+    }
+    calls: list[str] = []
+
+    class FakeSecrets:
+        def list(self, scope: str) -> list[SecretMetadata]:  # noqa: ARG002
+            return [SecretMetadata(key) for key in (*secrets, "missing")]
+
+        def get(self, scope: str, key: str) -> str:  # noqa: ARG002
+            calls.append(key)
+            time.sleep(0.05)
+            if key not in secrets:
+                raise ResourceDoesNotExist(key)
+            return secrets[key]
+
+    class FakeDbUtils:
+        secrets: FakeSecrets = FakeSecrets()
+
+    dbutils_calls: list[dict[str, Any]] = []
+
+    def get_dbutils(**kwargs: Any) -> FakeDbUtils:
+        dbutils_calls.append(kwargs)
+        return FakeDbUtils()
+
+    monkeypatch.setattr(databricks, "get_dbutils", get_dbutils)
+    databricks._get_secret.cache_clear()  # noqa: SLF001
+    try:
+        start: float = time.perf_counter()
+        values: dict[str, str | Exception] = get_databricks_secrets(
+            "scope", host="https://example.cloud.databricks.com"
+        )
+        # Secrets were retrieved concurrently
+        assert time.perf_counter() - start < 0.05 * len(secrets) / 2
+        assert isinstance(values.pop("missing"), ResourceDoesNotExist)
+        assert values == secrets
+        assert all(
+            kwargs["host"] == "https://example.cloud.databricks.com"
+            for kwargs in dbutils_calls
+        )
+        calls.clear()
+        assert get_databricks_secrets(
+            "scope",
+            ("key-0", "key-1"),
+            host="https://example.cloud.databricks.com",
+        ) == {"key-0": "value-0", "key-1": "value-1"}
+        assert (
+            get_databricks_secret(
+                "scope", "key-2", host="https://example.cloud.databricks.com"
+            )
+            == "value-2"
+        )
+        assert not calls
+    finally:
+        databricks._get_secret.cache_clear()  # noqa: SLF001
+
+
+def test_databricks_secrets_bundle(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Verify that secrets resolved once are installed, from an unpickled
+    bundle, into a worker's secret cache on first lookup, so that lookups
+    made by workers do not call Databricks.
+    """
+    secrets: dict[tuple[str, str], str] = {
+        ("scope", "key-0"): "value-0",
+        ("scope", "key-1"): "value-1",
+        ("other", "key-0"): "other-value-0",
+    }
+    calls: list[tuple[str, str]] = []
+
+    class FakeSecrets:
+        def get(self, scope: str, key: str) -> str:
+            calls.append((scope, key))
+            return secrets[(scope, key)]
+
+    class FakeDbUtils:
+        secrets: FakeSecrets = FakeSecrets()
+
+    clients: list[FakeDbUtils] = []
+
+    def get_dbutils(**_: Any) -> FakeDbUtils:
+        clients.append(FakeDbUtils())
+        return clients[-1]
+
+    monkeypatch.setattr(databricks, "get_dbutils", get_dbutils)
+    monkeypatch.setenv(
+        "DECORATIVE_SECRETS_BUNDLE_KEY", Fernet.generate_key().decode()
+    )
+    databricks._get_secret.cache_clear()  # noqa: SLF001
+    try:
+        bundle: DatabricksSecretsBundle = get_databricks_secrets_bundle(
+            secrets, host="https://example.cloud.databricks.com"
+        )
+        assert sorted(calls) == sorted(secrets)
+        assert b"value-0" not in bundle.ciphertext
+        pickled_bundle: bytes = pickle.dumps(bundle)
+        # Simulate a worker process, with cold caches
+        calls.clear()
+        clients.clear()
+        databricks._get_secret.cache_clear()  # noqa: SLF001
+        name: str
+        for name in (
+            "_DATABRICKS_BUNDLED_SECRETS",
+            "_DATABRICKS_PENDING_BUNDLES",
+        ):
+            monkeypatch.setattr(databricks, name, {})
+        monkeypatch.setattr(databricks, "_DATABRICKS_INSTALLED_BUNDLES", set())
+        assert pickle.loads(pickled_bundle) == bundle  # noqa: S301
+        assert databricks._DATABRICKS_PENDING_BUNDLES  # noqa: SLF001
+        assert get_databricks_secret("scope", "key-0") == "value-0"
+        assert not databricks._DATABRICKS_PENDING_BUNDLES  # noqa: SLF001
+        assert (
+            asyncio.run(
+                async_get_databricks_secret(
+                    "other",
+                    "key-0",
+                    host="https://example.cloud.databricks.com/",
+                )
+            )
+            == "other-value-0"
+        )
+        # Bulk lookups of bundled secrets construct no client
+        assert get_databricks_secrets("scope", ["key-1", "key-0"]) == {
+            "key-1": "value-1",
+            "key-0": "value-0",
+        }
+        assert not calls
+        assert not clients
+        # ...and only keys which are not bundled are retrieved
+        results: dict[str, str | Exception] = get_databricks_secrets(
+            "scope", ["missing", "key-0"]
+        )
+        assert list(results) == ["missing", "key-0"]
+        assert isinstance(results["missing"], KeyError)
+        assert results["key-0"] == "value-0"
+        assert calls == [("scope", "missing")]
+        calls.clear()
+        # Secrets are not used for lookups from another host
+        assert (
+            get_databricks_secret(
+                "scope", "key-1", host="https://another.cloud.databricks.com"
+            )
+            == "value-1"
+        )
+        assert calls == [("scope", "key-1")]
+    finally:
+        databricks._get_secret.cache_clear()  # noqa: SLF001
+    monkeypatch.delenv("DECORATIVE_SECRETS_BUNDLE_KEY")
+    with pytest.raises(ValueError, match="DECORATIVE_SECRETS_BUNDLE_KEY"):
+        get_databricks_secrets_bundle(secrets)
+
+
+def test_databricks_secrets_bundle_unavailable(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """
+    Verify that a bundle unpickled without (or with the wrong) key is
+    discarded, with a warning, and that secrets (including those which are
+    not bundled) are then retrieved from Databricks.
+    """
+    secrets: dict[tuple[str, str], str] = {
+        ("scope", "bundled"): "bundled-value",
+        ("scope", "unbundled"): "unbundled-value",
+    }
+    calls: list[tuple[str, str]] = []
+
+    class FakeSecrets:
+        def get(self, scope: str, key: str) -> str:
+            calls.append((scope, key))
+            return secrets[(scope, key)]
+
+    class FakeDbUtils:
+        secrets: FakeSecrets = FakeSecrets()
+
+    monkeypatch.setattr(databricks, "get_dbutils", lambda **_: FakeDbUtils())
+    name: str
+    for name in ("_DATABRICKS_BUNDLED_SECRETS", "_DATABRICKS_PENDING_BUNDLES"):
+        monkeypatch.setattr(databricks, name, {})
+    monkeypatch.setattr(databricks, "_DATABRICKS_INSTALLED_BUNDLES", set())
+    databricks._get_secret.cache_clear()  # noqa: SLF001
+    try:
+        pickled_bundle: bytes = pickle.dumps(
+            get_databricks_secrets_bundle(
+                [("scope", "bundled")],
+                encryption_key=Fernet.generate_key(),
+            )
+        )
+        calls.clear()
+        databricks._get_secret.cache_clear()  # noqa: SLF001
+        key: str | None
+        for key in (None, Fernet.generate_key().decode()):
+            if key is None:
+                monkeypatch.delenv(
+                    "DECORATIVE_SECRETS_BUNDLE_KEY", raising=False
+                )
+            else:
+                monkeypatch.setenv("DECORATIVE_SECRETS_BUNDLE_KEY", key)
+            pickle.loads(pickled_bundle)  # noqa: S301
+            with caplog.at_level(logging.WARNING):
+                assert (
+                    get_databricks_secret("scope", "unbundled")
+                    == "unbundled-value"
+                )
+            assert "bundle" in caplog.text
+            caplog.clear()
+            assert not databricks._DATABRICKS_PENDING_BUNDLES  # noqa: SLF001
+            # The discarded bundle is not installed again
+            assert get_databricks_secret("scope", "bundled") == "bundled-value"
+            assert not caplog.text
+            assert calls == [("scope", "unbundled"), ("scope", "bundled")]
+            calls.clear()
+            databricks._get_secret.cache_clear()  # noqa: SLF001
+    finally:
+        databricks._get_secret.cache_clear()  # noqa: SLF001
+
+
 def test_pickle_workspace_client() -> None:
     client: WorkspaceClient = get_databricks_workspace_client()
     me: User = client.current_user.me()
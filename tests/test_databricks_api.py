@@ -0,0 +1,316 @@
+"""
+Tests and benchmarks of Databricks secret resolution, and workspace client
+creation, run against a local stand-in for the Databricks workspace API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from itertools import count
+from typing import TYPE_CHECKING
+
+import pytest
+from databricks.sdk import retries as sdk_retries
+from databricks.sdk.errors import DatabricksError, NotFound
+
+from decorative_secrets import databricks
+from decorative_secrets.databricks import (
+    DatabricksWorkspaceClientArguments,
+    apply_databricks_secrets_arguments,
+    async_get_databricks_secret,
+    get_databricks_secret,
+    get_databricks_secrets,
+    get_databricks_workspace_client,
+)
+from tests.benchmark import (
+    BENCHMARK_CALLS,
+    BenchmarkResult,
+    benchmark_tasks,
+    benchmark_threads,
+)
+from tests.databricks_server import DatabricksServer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from databricks.sdk import WorkspaceClient
+
+SCOPES: dict[str, dict[str, str]] = {
+    "scope": {
+        f"key-{index}": f"value-{index}"
+        for index in range(max(BENCHMARK_CALLS, 10))
+    },
+    "other": {"username": "other-username", "password": "other-password"},
+}
+
+
+@pytest.fixture(name="databricks_server")
+def get_databricks_server(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[DatabricksServer]:
+    """
+    Serve `SCOPES` from a Databricks workspace API stand-in, with
+    `DATABRICKS_*` environment variables removed, the workspace client pool
+    and secret cache isolated from other tests, and without the SDK's
+    randomized backoff between retries.
+    """
+    name: str
+    for name in databricks._WORKSPACE_CLIENT_ENVIRONMENT_VARIABLES:  # noqa: SLF001
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(databricks, "_WORKSPACE_CLIENTS", OrderedDict())
+    monkeypatch.setattr(databricks, "_WORKSPACE_CLIENT_LOCKS", {})
+    monkeypatch.setattr(sdk_retries, "random", lambda: 0)
+    databricks._get_secret.cache_clear()  # noqa: SLF001
+    try:
+        with DatabricksServer(SCOPES) as server:
+            yield server
+    finally:
+        databricks._get_secret.cache_clear()  # noqa: SLF001
+
+
+def test_get_databricks_secret(databricks_server: DatabricksServer) -> None:
+    """
+    Verify that secrets are retrieved using a personal access token, and
+    cached.
+    """
+    host: str = databricks_server.url
+    token: str = databricks_server.token
+    assert (
+        get_databricks_secret("scope", "key-0", host=host, token=token)
+        == "value-0"
+    )
+    assert (
+        get_databricks_secret("scope", "key-0", host=host, token=token)
+        == "value-0"
+    )
+    assert (
+        asyncio.run(
+            async_get_databricks_secret(
+                "other", "password", host=host, token=token
+            )
+        )
+        == "other-password"
+    )
+    assert databricks_server.requests["get"] == 2  # noqa: PLR2004
+    with pytest.raises(NotFound):
+        get_databricks_secret("scope", "missing", host=host, token=token)
+    with pytest.raises(DatabricksError):
+        get_databricks_secret("scope", "key-1", host=host, token="invalid")
+    assert databricks_server.requests["unauthorized"] == 1
+
+
+def test_get_databricks_secret_oauth(
+    databricks_server: DatabricksServer,
+) -> None:
+    """
+    Verify that secrets are retrieved using OAuth machine-to-machine
+    credentials, with one access token issued for the pooled client.
+    """
+    secrets: dict[str, str | Exception] = get_databricks_secrets(
+        "other",
+        host=databricks_server.url,
+        client_id=databricks_server.client_id,
+        client_secret=databricks_server.client_secret,
+    )
+    assert secrets == SCOPES["other"]
+    assert (
+        get_databricks_secret(
+            "scope",
+            "key-0",
+            host=databricks_server.url,
+            client_id=databricks_server.client_id,
+            client_secret=databricks_server.client_secret,
+        )
+        == "value-0"
+    )
+    assert databricks_server.requests["token"] == 1
+    assert databricks_server.requests["list"] == 1
+    assert databricks_server.requests["get"] == 3  # noqa: PLR2004
+
+
+def test_get_databricks_secret_retried(
+    databricks_server: DatabricksServer,
+) -> None:
+    """
+    Verify that requests rejected with 429 or 503 statuses are retried.
+    """
+    databricks_server.error_rate = 0.5
+    host: str = databricks_server.url
+    token: str = databricks_server.token
+    index: int
+    for index in range(10):
+        assert get_databricks_secret(
+            "scope", f"key-{index}", host=host, token=token
+        ) == (f"value-{index}")
+    assert databricks_server.requests["error"]
+    assert databricks_server.requests["get"] == 10  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+@pytest.mark.parametrize("cached", [True, False])
+def test_benchmark_get_databricks_secret(
+    databricks_server: DatabricksServer, concurrency: int, *, cached: bool
+) -> None:
+    """
+    Measure the throughput and latency of `get_databricks_secret`, from
+    threads, with secrets cached (the same secret is retrieved by every
+    call) and uncached (each call retrieves a different secret).
+    """
+    databricks_server.latency = 0.001
+    keys: Iterator[int] = count()
+    host: str = databricks_server.url
+    token: str = databricks_server.token
+    result: BenchmarkResult = benchmark_threads(
+        f"get_databricks_secret (cached={cached})",
+        lambda: get_databricks_secret(
+            "scope",
+            "key-0" if cached else f"key-{next(keys)}",
+            host=host,
+            token=token,
+        ),
+        concurrency=concurrency,
+    )
+    assert not result.errors
+    if cached:
+        # Concurrent calls for a secret which is not yet cached may each
+        # retrieve it
+        assert databricks_server.requests["get"] <= concurrency
+    else:
+        assert databricks_server.requests["get"] == BENCHMARK_CALLS
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+def test_benchmark_async_get_databricks_secret(
+    databricks_server: DatabricksServer, concurrency: int
+) -> None:
+    """
+    Measure the throughput and latency of `async_get_databricks_secret`,
+    from concurrent tasks, with secrets uncached.
+    """
+    databricks_server.latency = 0.001
+    keys: Iterator[int] = count()
+    host: str = databricks_server.url
+    token: str = databricks_server.token
+    result: BenchmarkResult = asyncio.run(
+        benchmark_tasks(
+            "async_get_databricks_secret",
+            lambda: async_get_databricks_secret(
+                "scope", f"key-{next(keys)}", host=host, token=token
+            ),
+            concurrency=concurrency,
+        )
+    )
+    assert not result.errors
+    assert databricks_server.requests["get"] == BENCHMARK_CALLS
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+def test_benchmark_apply_databricks_secrets_arguments(
+    databricks_server: DatabricksServer, concurrency: int
+) -> None:
+    """
+    Measure resolving arguments using `apply_databricks_secrets_arguments`,
+    from threads, with each call resolving a different (uncached) secret.
+    """
+    databricks_server.latency = 0.001
+    keys: Iterator[int] = count()
+
+    @apply_databricks_secrets_arguments(
+        DatabricksWorkspaceClientArguments(
+            host=databricks_server.url, token=databricks_server.token
+        ),
+        password="password_databricks_secret",
+    )
+    def get_password(
+        password: str | None = None,
+        password_databricks_secret: tuple[str, str] | None = None,  # noqa: ARG001
+    ) -> str | None:
+        return password
+
+    result: BenchmarkResult = benchmark_threads(
+        "apply_databricks_secrets_arguments",
+        lambda: get_password(
+            password_databricks_secret=("scope", f"key-{next(keys)}")
+        ),
+        concurrency=concurrency,
+    )
+    assert not result.errors
+
+
+@pytest.mark.parametrize("error_rate", [0.1, 0.3])
+def test_benchmark_get_databricks_secret_errors(
+    databricks_server: DatabricksServer, error_rate: float
+) -> None:
+    """
+    Measure `get_databricks_secret`, from threads, with a proportion of
+    requests rejected with 429 or 503 statuses (and retried).
+    """
+    databricks_server.latency = 0.001
+    databricks_server.error_rate = error_rate
+    keys: Iterator[int] = count()
+    host: str = databricks_server.url
+    token: str = databricks_server.token
+    result: BenchmarkResult = benchmark_threads(
+        f"get_databricks_secret ({error_rate:.0%} errors)",
+        lambda: get_databricks_secret(
+            "scope", f"key-{next(keys)}", host=host, token=token
+        ),
+        concurrency=8,
+    )
+    assert not result.errors
+    assert databricks_server.requests["error"]
+
+
+@pytest.mark.parametrize("auth_type", ["pat", "oauth-m2m"])
+def test_benchmark_get_databricks_workspace_client(
+    databricks_server: DatabricksServer, auth_type: str
+) -> None:
+    """
+    Measure creating a workspace client and retrieving a secret with it,
+    when cold (with the client pool cleared before each call), and when the
+    client is pooled.
+    """
+    databricks_server.latency = 0.001
+    get_client: Callable[[], WorkspaceClient] = (
+        (
+            lambda: get_databricks_workspace_client(
+                host=databricks_server.url, token=databricks_server.token
+            )
+        )
+        if auth_type == "pat"
+        else (
+            lambda: get_databricks_workspace_client(
+                host=databricks_server.url,
+                client_id=databricks_server.client_id,
+                client_secret=databricks_server.client_secret,
+            )
+        )
+    )
+
+    def get_secret() -> bytes:
+        return get_client().dbutils.secrets.getBytes("scope", "key-0")
+
+    def get_secret_cold() -> bytes:
+        databricks._WORKSPACE_CLIENTS.clear()  # noqa: SLF001
+        return get_secret()
+
+    calls: int = min(BENCHMARK_CALLS, 20)
+    result: BenchmarkResult = benchmark_threads(
+        f"get_databricks_workspace_client ({auth_type}, cold)",
+        get_secret_cold,
+        calls=calls,
+    )
+    assert not result.errors
+    if auth_type == "oauth-m2m":
+        assert databricks_server.requests["token"] == calls
+    databricks_server.requests.clear()
+    result = benchmark_threads(
+        f"get_databricks_workspace_client ({auth_type}, pooled)",
+        get_secret,
+        calls=calls,
+    )
+    assert not result.errors
+    # One client (authenticated once) is pooled and reused
+    assert databricks_server.requests["token"] <= 1
+    assert databricks_server.requests["get"] == calls
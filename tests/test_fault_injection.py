@@ -0,0 +1,230 @@
+"""
+Tests and benchmarks of retry, timeout and fallback behavior for secret
+providers passed to `apply_callback_arguments`, with latency, intermittent
+errors and hangs injected.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from decorative_secrets.callback import apply_callback_arguments
+from decorative_secrets.utilities import retry, timeout
+from tests.benchmark import (
+    BENCHMARK_CALLS,
+    BenchmarkResult,
+    benchmark_tasks,
+    benchmark_threads,
+)
+from tests.faults import (
+    FaultInjector,
+    InjectedError,
+    constant_latency,
+    lognormal_latency,
+    uniform_latency,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+# Injected latency, with a long tail
+LATENCY: Callable = lognormal_latency(0.001, 0.005)
+# The timeout applied to providers which may hang, in seconds
+TIMEOUT: float = 0.05
+
+
+def get_secret(name: str) -> str:
+    return f"{name}-secret"
+
+
+async def async_get_secret(name: str) -> str:
+    await asyncio.sleep(0)
+    return f"{name}-secret"
+
+
+@pytest.fixture(name="injectors")
+def get_injectors() -> Iterator[list[FaultInjector]]:
+    """
+    Collect fault injectors, and release their hanging calls on teardown.
+    """
+    injectors: list[FaultInjector] = []
+    yield injectors
+    injector: FaultInjector
+    for injector in injectors:
+        injector.release()
+
+
+def test_fault_injector() -> None:
+    """
+    Verify that faults are injected at the configured rates, and that
+    hanging calls raise once released.
+    """
+    injector: FaultInjector = FaultInjector(
+        uniform_latency(0, 0.001), error_rate=0.2, hang_rate=0.1
+    )
+    injector.release()
+    provider: Callable[[str], str] = injector.wrap(get_secret)
+    failures: int = 0
+    for _ in range(1000):
+        try:
+            assert provider("name") == "name-secret"
+        except InjectedError:
+            failures += 1
+    assert injector.calls == 1000
+    assert failures == injector.errors + injector.hangs
+    assert 150 < injector.errors < 250
+    assert 50 < injector.hangs < 150
+    # Hanging asynchronous calls are cancelled by `timeout`
+    injector = FaultInjector(constant_latency(0), hang_rate=1)
+    with pytest.raises(TimeoutError):
+        asyncio.run(
+            timeout(TIMEOUT)(injector.wrap_async(async_get_secret))("name")
+        )
+    assert injector.hangs == 1
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+@pytest.mark.usefixtures("no_backoff")
+def test_benchmark_retry(concurrency: int) -> None:
+    """
+    Measure resolving an argument from a provider which intermittently
+    raises, and is retried.
+    """
+    injector: FaultInjector = FaultInjector(LATENCY, error_rate=0.3)
+
+    @apply_callback_arguments(
+        retry((InjectedError,), number_of_attempts=4)(
+            injector.wrap(get_secret)
+        ),
+        password="password_name",
+    )
+    def get_password(
+        password: str | None = None,
+        password_name: str | None = None,  # noqa: ARG001
+    ) -> str | None:
+        return password
+
+    result: BenchmarkResult = benchmark_threads(
+        "apply_callback_arguments (retry, 30% errors)",
+        lambda: get_password(password_name="password"),
+        concurrency=concurrency,
+    )
+    # Calls only fail if every attempt fails
+    assert injector.calls > BENCHMARK_CALLS
+    assert result.errors <= BENCHMARK_CALLS * 0.05
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+def test_benchmark_timeout(
+    injectors: list[FaultInjector], concurrency: int
+) -> None:
+    """
+    Measure resolving an argument from a provider which intermittently
+    hangs, bounded by a timeout.
+    """
+    injector: FaultInjector = FaultInjector(LATENCY, hang_rate=0.1)
+    injectors.append(injector)
+
+    @apply_callback_arguments(
+        timeout(TIMEOUT)(injector.wrap(get_secret)),
+        password="password_name",
+    )
+    def get_password(
+        password: str,
+        password_name: str | None = None,  # noqa: ARG001
+    ) -> str:
+        return password
+
+    result: BenchmarkResult = benchmark_threads(
+        "apply_callback_arguments (timeout, 10% hangs)",
+        lambda: get_password(password_name="password"),
+        concurrency=concurrency,
+    )
+    assert result.errors == injector.hangs
+    # No call waits much longer than the timeout
+    assert result.p99 < TIMEOUT * 10
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+@pytest.mark.usefixtures("no_backoff")
+def test_benchmark_fallback(
+    injectors: list[FaultInjector], concurrency: int
+) -> None:
+    """
+    Measure resolving an argument from a primary provider which
+    intermittently raises or hangs (retried, and bounded by a timeout),
+    falling back to a reliable provider, using stacked
+    `apply_callback_arguments` decorators.
+    """
+    primary: FaultInjector = FaultInjector(
+        LATENCY, error_rate=0.2, hang_rate=0.05
+    )
+    fallback: FaultInjector = FaultInjector(LATENCY, seed=1)
+    injectors.append(primary)
+
+    @apply_callback_arguments(
+        timeout(TIMEOUT * 2)(
+            retry((InjectedError,), number_of_attempts=2)(
+                primary.wrap(get_secret)
+            )
+        ),
+        password="password_primary",
+    )
+    @apply_callback_arguments(
+        fallback.wrap(get_secret), password="password_fallback"
+    )
+    def get_password(
+        password: str,
+        password_primary: str | None = None,  # noqa: ARG001
+        password_fallback: str | None = None,  # noqa: ARG001
+    ) -> str:
+        return password
+
+    result: BenchmarkResult = benchmark_threads(
+        "apply_callback_arguments (fallback)",
+        lambda: get_password(
+            password_primary="primary", password_fallback="fallback"
+        ),
+        concurrency=concurrency,
+    )
+    assert not result.errors
+    assert fallback.calls
+    assert result.p99 < TIMEOUT * 20
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+@pytest.mark.usefixtures("no_backoff")
+def test_benchmark_async_timeout(concurrency: int) -> None:
+    """
+    Measure resolving arguments of an asynchronous function from an
+    asynchronous provider which intermittently hangs or raises, retried and
+    bounded by a timeout, from concurrent tasks.
+    """
+    injector: FaultInjector = FaultInjector(
+        LATENCY, error_rate=0.1, hang_rate=0.05
+    )
+
+    @apply_callback_arguments(
+        retry((InjectedError, TimeoutError), number_of_attempts=2)(
+            timeout(TIMEOUT)(injector.wrap_async(async_get_secret))
+        ),
+        password="password_name",
+    )
+    async def get_password(
+        password: str,
+        password_name: str | None = None,  # noqa: ARG001
+    ) -> str:
+        return password
+
+    result: BenchmarkResult = asyncio.run(
+        benchmark_tasks(
+            "apply_callback_arguments (async, retry and timeout)",
+            lambda: get_password(password_name="password"),
+            concurrency=concurrency,
+        )
+    )
+    assert injector.calls > BENCHMARK_CALLS
+    assert result.errors <= BENCHMARK_CALLS * 0.05
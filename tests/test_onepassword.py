@@ -1,22 +1,70 @@
 import asyncio
+import json
 import os
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+from functools import partial
+from io import BytesIO
+from pathlib import Path
+from subprocess import CalledProcessError
+from threading import Barrier
+from time import sleep, time
 
 import pytest
+from onepassword.errors import (  # type: ignore[import-untyped]
+    RateLimitExceededException,
+)
+from onepasswordconnectsdk.client import (  # type: ignore[import-untyped]
+    Item,
+    ItemVault,
+    SummaryItem,
+    Vault,
+)
+from onepasswordconnectsdk.errors import (  # type: ignore[import-untyped]
+    FailedToRetrieveItemException,
+)
 
+from decorative_secrets import onepassword
 from decorative_secrets.environment import apply_environment_arguments
 from decorative_secrets.errors import (
     ArgumentsResolutionError,
     OnePasswordCommandLineInterfaceNotInstalledError,
 )
 from decorative_secrets.onepassword import (
+    ApplyOnepasswordArgumentsOptions,
+    _async_call_rate_limited,
+    _async_get_connect_item,
+    _call_rate_limited,
+    _get_connect_item,
+    _get_op_args_env,
+    _get_op_session,
+    _get_op_vault_secret,
+    _get_unresolved_op_resources,
     _install_op,
+    _is_onepassword_backend_failure,
+    _load_op_sessions,
+    _op_read,
+    _OpSession,
+    _parse_op_signin_output,
     _parse_resource,
+    _pop_op_secret,
     _resolve_auth_arguments,
+    _set_op_secret,
+    _set_op_vault,
     apply_onepassword_arguments,
+    async_read_onepassword_document,
     async_read_onepassword_secret,
+    get_onepassword_backend_statistics,
+    get_onepassword_queue_depth,
+    get_onepassword_secrets,
+    op_signin,
+    prefetch_onepassword_vault,
+    read_onepassword_document,
     read_onepassword_secret,
+    set_adaptive_onepassword_backends,
+    set_onepassword_cache_policy,
     which_op,
 )
 from decorative_secrets.subprocess import check_output
@@ -262,5 +310,972 @@ def test_parse_resource() -> None:
     )
 
 
+@pytest.fixture
+def op_sessions_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """
+    Isolate persisted 1Password CLI sessions in a temporary directory, with
+    no sessions held in memory.
+    """
+    path: Path = tmp_path / "onepassword-sessions.json"
+    monkeypatch.setattr(onepassword, "_get_op_sessions_path", lambda: path)
+    monkeypatch.setattr(onepassword, "_OP_SESSIONS", {})
+    monkeypatch.setattr(onepassword, "_WHICH", {"op": "op"})
+    return path
+
+
+def test_parse_op_signin_output() -> None:
+    """
+    Test parsing session tokens from each shell format `op signin` emits.
+    """
+    assert _parse_op_signin_output(
+        'export OP_SESSION_ABC123="token-value"\n'
+        "# This command is meant to be used with your shell's eval function."
+    ) == ("OP_SESSION_ABC123", "token-value")
+    assert _parse_op_signin_output('$env:OP_SESSION_ABC123="token-value"') == (
+        "OP_SESSION_ABC123",
+        "token-value",
+    )
+    assert _parse_op_signin_output("SET OP_SESSION_ABC123=token-value") == (
+        "OP_SESSION_ABC123",
+        "token-value",
+    )
+    assert _parse_op_signin_output("token-value\n") == (None, "token-value")
+    # The desktop app integration issues no session token
+    assert _parse_op_signin_output("") == (None, None)
+
+
+def test_op_session_persistence(op_sessions_path: Path) -> None:
+    """
+    Verify that sessions are persisted privately, and shared with sibling
+    processes only until they expire.
+    """
+    calls: list[tuple[str, ...]] = []
+
+    def check_output(args: tuple[str, ...], **kwargs: object) -> str:  # noqa: ARG001
+        calls.append(args)
+        return 'export OP_SESSION_ABC123="token-value"'
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(onepassword, "check_output", check_output)
+        assert op_signin("nonsense.1password.com") == "op"
+        assert calls == [
+            ("op", "signin", "--account", "nonsense.1password.com")
+        ]
+        if not sys.platform.startswith("win"):
+            assert stat.S_IMODE(op_sessions_path.stat().st_mode) == 0o600
+        # A sibling process (with nothing in memory) reuses the session
+        onepassword._OP_SESSIONS.clear()
+        op_signin("nonsense.1password.com")
+        assert len(calls) == 1
+        session: _OpSession | None = _get_op_session("nonsense.1password.com")
+        assert session == _OpSession(
+            name="OP_SESSION_ABC123",
+            token="token-value",
+            expires=session.expires if session else 0,
+        )
+        # ...until it expires
+        onepassword._OP_SESSIONS.clear()
+        monkeypatch.setattr(onepassword, "time", lambda: time() + 3600)
+        assert _load_op_sessions() == {}
+        op_signin("nonsense.1password.com")
+        assert len(calls) == 2
+
+
+def test_op_read_reuses_session(op_sessions_path: Path) -> None:  # noqa: ARG001
+    """
+    Verify that `op read` receives the session token produced by sign-in,
+    and that a rejected session is discarded and replaced.
+    """
+    calls: list[tuple[tuple[str, ...], dict[str, str] | None]] = []
+    signed_in: list[str] = []
+
+    def check_output(
+        args: tuple[str, ...],
+        env: dict[str, str] | None = None,
+        **kwargs: object,  # noqa: ARG001
+    ) -> str:
+        if args[1] == "signin":
+            signed_in.append(args[-1])
+            return f'export OP_SESSION_ABC123="token-{len(signed_in)}"'
+        calls.append((args, env))
+        if env and env["OP_SESSION_ABC123"] == "token-1":
+            raise CalledProcessError(
+                1, args, stderr=b"[ERROR] session expired, sign in again"
+            )
+        return "secret-value"
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(onepassword, "check_output", check_output)
+        assert (
+            _op_read("op://Vault/Item/field", "nonsense.1password.com")
+            == "secret-value"
+        )
+    assert len(signed_in) == 2
+    assert [env and env["OP_SESSION_ABC123"] for _, env in calls] == [
+        "token-1",
+        "token-2",
+    ]
+    # Session tokens are passed using the environment, not arguments
+    assert calls[-1][0] == (
+        "op",
+        "read",
+        "--account",
+        "nonsense.1password.com",
+        "op://Vault/Item/field",
+    )
+
+
+def test_get_op_args_env_raw_session(op_sessions_path: Path) -> None:  # noqa: ARG001
+    """
+    Verify that a session token is passed using `--session` when the name of
+    its environment variable is unknown.
+    """
+    onepassword._OP_SESSIONS["nonsense.1password.com"] = _OpSession(
+        name=None, token="token-value", expires=time() + 60
+    )
+    assert _get_op_args_env(
+        "op",
+        "read",
+        "op://Vault/Item/field",
+        account="nonsense.1password.com",
+    ) == (
+        (
+            "op",
+            "read",
+            "--account",
+            "nonsense.1password.com",
+            "--session",
+            "token-value",
+            "op://Vault/Item/field",
+        ),
+        None,
+    )
+
+
+def test_op_signin_single_flight(op_sessions_path: Path) -> None:  # noqa: ARG001
+    """
+    Verify that concurrent callers encountering a cold cache trigger
+    exactly one sign-in, and share its session.
+    """
+    thread_count: int = 8
+    barrier: Barrier = Barrier(thread_count)
+    signed_in: list[str] = []
+
+    def check_output(args: tuple[str, ...], **kwargs: object) -> str:  # noqa: ARG001
+        signed_in.append(args[-1])
+        sleep(0.1)
+        return 'export OP_SESSION_ABC123="token-value"'
+
+    def signin() -> _OpSession | None:
+        barrier.wait()
+        op_signin("nonsense.1password.com")
+        return _get_op_session("nonsense.1password.com")
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(onepassword, "check_output", check_output)
+        with ThreadPoolExecutor(max_workers=thread_count) as executor:
+            sessions: set[_OpSession | None] = set(
+                executor.map(lambda _: signin(), range(thread_count))
+            )
+    assert signed_in == ["nonsense.1password.com"]
+    assert len(sessions) == 1
+    assert None not in sessions
+
+
+def _inject(template: str, values: dict[str, str]) -> str:
+    """
+    Mimic `op inject`, substituting values for secret references.
+    """
+    reference: str
+    value: str
+    for reference, value in values.items():
+        template = template.replace(f"{{{{ {reference} }}}}", value)
+    return template.rstrip()
+
+
+def test_get_onepassword_secrets_batches_cli_reads(
+    op_sessions_path: Path,  # noqa: ARG001
+) -> None:
+    """
+    Verify that multiple secrets are resolved using a single `op inject`
+    command, with multi-line values parsed intact.
+    """
+    values: dict[str, str] = {
+        "op://Vault/Batch Item/username": "user",
+        "op://Vault/Batch Item/credential": "multi\nline\n",
+        "op://Vault/Batch Item/hostname": "",
+    }
+    calls: list[tuple[str, ...]] = []
+
+    def check_output(
+        args: tuple[str, ...],
+        input: str | None = None,  # noqa: A002
+        **kwargs: object,  # noqa: ARG001
+    ) -> str:
+        calls.append(args)
+        if args[1] == "signin":
+            return ""
+        assert args[1] == "inject"
+        assert input is not None
+        return _inject(input, values)
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(onepassword, "check_output", check_output)
+        monkeypatch.setattr(onepassword, "_OP_SECRETS", {})
+        monkeypatch.delenv("OP_SERVICE_ACCOUNT_TOKEN", raising=False)
+        monkeypatch.delenv("OP_CONNECT_TOKEN", raising=False)
+        assert (
+            get_onepassword_secrets(
+                values.keys(), account="nonsense.1password.com"
+            )
+            == values
+        )
+    assert [args[1] for args in calls] == ["signin", "inject"]
+
+
+def test_batch_resolved_secrets_expire(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Verify that secrets resolved in a batch expire according to cache
+    policies (or, at the latest, after `_OP_SECRETS_TTL` seconds), and that
+    the least recently resolved are evicted beyond `_OP_SECRETS_SIZE`.
+    """
+    monkeypatch.setattr(onepassword, "_OP_SECRETS", {})
+    monkeypatch.setattr(onepassword, "_OP_SECRETS_SIZE", 2)
+    monkeypatch.setattr(
+        onepassword,
+        "ONEPASSWORD_CACHE_POLICIES",
+        list(onepassword.ONEPASSWORD_CACHE_POLICIES),
+    )
+    set_onepassword_cache_policy("op://Rotated/*", ttl=0.05)
+    _set_op_secret(None, "op://Rotated/Item/field", "rotated")
+    _set_op_secret(None, "op://Vault/Item/field", "value")
+    assert _pop_op_secret(None, "op://Vault/Item/field") == "value"
+    # Secrets are removed once read
+    assert _pop_op_secret(None, "op://Vault/Item/field") is None
+    sleep(0.1)
+    assert _pop_op_secret(None, "op://Rotated/Item/field") is None
+    # Expired secrets are evicted when any secret is read
+    _set_op_secret(None, "op://Rotated/Item/field", "rotated")
+    sleep(0.1)
+    assert _pop_op_secret(None, "op://Vault/Item/other") is None
+    assert not onepassword._OP_SECRETS  # noqa: SLF001
+    monkeypatch.setattr(onepassword, "_OP_SECRETS_TTL", 0.05)
+    _set_op_secret(None, "op://Vault/Item/field", "value")
+    sleep(0.1)
+    assert _pop_op_secret(None, "op://Vault/Item/field") is None
+    monkeypatch.setattr(onepassword, "_OP_SECRETS_TTL", 60)
+    index: int
+    for index in range(3):
+        _set_op_secret(None, f"op://Vault/Item/field-{index}", str(index))
+    assert _pop_op_secret(None, "op://Vault/Item/field-0") is None
+    assert _pop_op_secret(None, "op://Vault/Item/field-1") == "1"
+    assert _pop_op_secret(None, "op://Vault/Item/field-2") == "2"
+
+
+def test_apply_onepassword_arguments_prefetches(
+    op_sessions_path: Path,  # noqa: ARG001
+) -> None:
+    """
+    Verify that the `apply_onepassword_arguments` decorator resolves all of
+    a function's 1Password arguments in one batch, and falls back to
+    reading secrets individually when the batch fails.
+    """
+    values: dict[str, str] = {
+        "op://Vault/Prefetch Item/username": "user",
+        "op://Vault/Prefetch Item/credential": "password",
+        "op://Vault/Prefetch Item/hostname": "host",
+    }
+    commands: list[str] = []
+
+    def check_output(
+        args: tuple[str, ...],
+        input: str | None = None,  # noqa: A002
+        **kwargs: object,  # noqa: ARG001
+    ) -> str:
+        commands.append(args[1])
+        if args[1] == "inject":
+            assert input is not None
+            if "nonsense" in input:
+                raise CalledProcessError(1, args, stderr=b"[ERROR] not found")
+            return _inject(input, values)
+        if args[1] == "read":
+            if "nonsense" in args[-1]:
+                raise CalledProcessError(1, args, stderr=b"[ERROR] not found")
+            return values[args[-1]]
+        return ""
+
+    @apply_onepassword_arguments(
+        ApplyOnepasswordArgumentsOptions(account="nonsense.1password.com"),
+        username="username_onepassword",
+        password="password_onepassword",
+    )
+    def get_credentials(
+        username: str | None = None,
+        password: str | None = None,
+        username_onepassword: str | None = (
+            "op://Vault/Prefetch Item/username"
+        ),
+        password_onepassword: str | None = None,
+    ) -> tuple[str | None, str | None]:
+        return username, password
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(onepassword, "check_output", check_output)
+        monkeypatch.setattr(onepassword, "_OP_SECRETS", {})
+        monkeypatch.delenv("OP_SERVICE_ACCOUNT_TOKEN", raising=False)
+        monkeypatch.delenv("OP_CONNECT_TOKEN", raising=False)
+        assert get_credentials(
+            password_onepassword="op://Vault/Prefetch Item/credential"
+        ) == ("user", "password")
+        assert "read" not in commands
+        assert commands.count("inject") == 1
+        commands.clear()
+        assert get_credentials(
+            password="password",
+            password_onepassword="op://Vault/Prefetch Item/nonsense",
+        ) == ("user", "password")
+        # Only one lookup was needed, so nothing was prefetched
+        assert commands == []
+        assert get_credentials(
+            username_onepassword="op://Vault/Prefetch Item/nonsense",
+            password_onepassword="op://Vault/Prefetch Item/hostname",
+        ) == (None, "host")
+        assert commands.count("inject") == 1
+        assert commands.count("read") == 2
+
+
+def test_async_cli_reads_overlap(
+    op_sessions_path: Path,  # noqa: ARG001
+) -> None:
+    """
+    Verify that concurrent asynchronous reads using the CLI trigger exactly
+    one sign-in, and overlap rather than blocking the event loop.
+    """
+    commands: list[str] = []
+
+    async def async_check_output(
+        args: tuple[str, ...],
+        **kwargs: object,  # noqa: ARG001
+    ) -> str:
+        commands.append(args[1])
+        await asyncio.sleep(0.2)
+        if args[1] == "signin":
+            return 'export OP_SESSION_ABC123="token-value"'
+        return args[-1].rpartition("/")[-1]
+
+    async def read_concurrently() -> tuple[list[str], float]:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        start: float = loop.time()
+        values: list[str] = await asyncio.gather(
+            *(
+                async_read_onepassword_secret(
+                    f"op://Vault/Async Item/field-{index}",
+                    account="nonsense.1password.com",
+                )
+                for index in range(8)
+            )
+        )
+        return values, loop.time() - start
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            onepassword, "async_check_output", async_check_output
+        )
+        monkeypatch.delenv("OP_SERVICE_ACCOUNT_TOKEN", raising=False)
+        monkeypatch.delenv("OP_CONNECT_TOKEN", raising=False)
+        values, elapsed = asyncio.run(read_concurrently())
+    assert values == [f"field-{index}" for index in range(8)]
+    assert commands.count("signin") == 1
+    assert commands.count("read") == 8
+    # One sign-in followed by eight overlapping reads
+    assert elapsed < 1.0
+
+
+def test_call_rate_limited(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Verify that service account requests exceeding the client-side rate
+    limit are queued, and that requests refused due to a rate limit are
+    re-queued rather than failing.
+    """
+    monkeypatch.setattr(onepassword, "_RATE_LIMIT", 50)
+    monkeypatch.setattr(onepassword, "_RATE_LIMIT_BURST", 2)
+    monkeypatch.setattr(onepassword, "_RATE_LIMITERS", {})
+    monkeypatch.delenv("OP_CONNECT_TOKEN", raising=False)
+    calls: list[str] = []
+    depths: list[int] = []
+
+    def resolve(resource: str) -> str:
+        depths.append(get_onepassword_queue_depth("token"))
+        calls.append(resource)
+        if calls.count(resource) == 1 and resource.endswith("limited"):
+            message: str = "rate limit exceeded"
+            raise RateLimitExceededException(message)
+        return resource
+
+    async def async_resolve(resource: str) -> str:
+        await asyncio.sleep(0)
+        return resolve(resource)
+
+    start: float = time()
+    with ThreadPoolExecutor(4) as executor:
+        assert list(
+            executor.map(
+                partial(_call_rate_limited, "token", resolve),
+                ("a", "b", "c", "d"),
+            )
+        ) == ["a", "b", "c", "d"]
+    # Two requests were allowed immediately, and two were queued
+    assert time() - start >= 0.03
+    assert max(depths) >= 1
+    assert get_onepassword_queue_depth("token") == 0
+    assert (
+        asyncio.run(
+            _async_call_rate_limited("token", async_resolve, "limited")
+        )
+        == "limited"
+    )
+    assert calls.count("limited") == 2
+    assert onepassword._RATE_LIMITERS["token"].rate < 50  # noqa: SLF001
+    with pytest.raises(ValueError, match="other"):
+        _call_rate_limited("token", int, "other")
+
+
+class _ConnectClient:
+    """
+    A stand-in for a 1Password Connect client, recording requests.
+    """
+
+    vault_id: str = "v" * 26
+    item_id: str = "i" * 26
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, ...]] = []
+        self.version: int = 1
+
+    def get_vaults(self) -> list[Vault]:
+        self.requests.append(("get_vaults",))
+        return [
+            Vault(id=self.vault_id, name="Vault"),
+            Vault(id="a" * 26, name="Duplicate"),
+            Vault(id="b" * 26, name="Duplicate"),
+        ]
+
+    def get_items(self, vault_id: str) -> list[SummaryItem]:
+        self.requests.append(("get_items", vault_id))
+        return [
+            SummaryItem(id=self.item_id, title="Item", version=self.version)
+        ]
+
+    def get_item(self, item: str, vault: str) -> Item:
+        self.requests.append(("get_item", item, vault))
+        if item == "Stale":
+            message: str = "Not found"
+            raise FailedToRetrieveItemException(message, status_code=404)
+        return Item(id=item, vault=ItemVault(id=vault), version=self.version)
+
+
+class _AsyncConnectClient(_ConnectClient):
+    """
+    A stand-in for a 1Password Connect async client, recording requests.
+    """
+
+    async def get_vaults(self) -> list[Vault]:  # type: ignore[override]
+        return super().get_vaults()
+
+    async def get_items(  # type: ignore[override]
+        self, vault_id: str
+    ) -> list[SummaryItem]:
+        return super().get_items(vault_id)
+
+    async def get_item(  # type: ignore[override]
+        self, item: str, vault: str
+    ) -> Item:
+        return super().get_item(item, vault)
+
+
+def test_get_connect_item_uses_id_index(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Verify that 1Password Connect items are retrieved directly by ID, with
+    names resolved using indices which are built once and refreshed on a
+    miss.
+    """
+    connect_items: dict[tuple[str, ...], object] = {}
+    monkeypatch.setattr(onepassword, "_CONNECT_IDS", {})
+    monkeypatch.setattr(onepassword, "_CONNECT_ITEMS", connect_items)
+    monkeypatch.setattr(onepassword, "_RATE_LIMITERS", {})
+    client: _ConnectClient = _ConnectClient()
+    vault_id: str = client.vault_id
+    item_id: str = client.item_id
+    for _ in range(2):
+        # Bypass the item cache
+        connect_items.clear()
+        assert _get_connect_item(client, "t", "h", "Vault", "Item").id == (
+            item_id
+        )
+    assert client.requests == [
+        ("get_vaults",),
+        ("get_items", vault_id),
+        ("get_item", item_id, vault_id),
+        ("get_item", item_id, vault_id),
+    ]
+    # An unknown title triggers a refresh, then a lookup by name
+    client.requests.clear()
+    assert _get_connect_item(client, "t", "h", "Vault", "Other").id == "Other"
+    assert client.requests == [
+        ("get_items", vault_id),
+        ("get_item", "Other", vault_id),
+    ]
+    # Ambiguous vault names are left for Connect to resolve
+    client.requests.clear()
+    _get_connect_item(client, "t", "h", "Duplicate", item_id)
+    assert client.requests == [
+        ("get_vaults",),
+        ("get_item", item_id, "Duplicate"),
+    ]
+    # Async lookups share the indices
+    connect_items.clear()
+    async_client: _AsyncConnectClient = _AsyncConnectClient()
+    assert (
+        asyncio.run(
+            _async_get_connect_item(async_client, "t", "h", "Vault", "Item")
+        ).id
+        == item_id
+    )
+    assert async_client.requests == [("get_item", item_id, vault_id)]
+    with pytest.raises(FailedToRetrieveItemException):
+        _get_connect_item(client, "t", "h", "Vault", "Stale")
+
+
+def test_get_connect_item_revalidates(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Verify that cached 1Password Connect items are reused until their TTL
+    elapses, then revalidated using the versions listed for their vault,
+    and only retrieved again if they have changed.
+    """
+    monkeypatch.setattr(onepassword, "_CONNECT_IDS", {})
+    monkeypatch.setattr(onepassword, "_CONNECT_ITEMS", {})
+    monkeypatch.setattr(onepassword, "_RATE_LIMITERS", {})
+    monkeypatch.setattr(onepassword, "_CONNECT_ITEM_TTL", 0.05)
+    client: _ConnectClient = _ConnectClient()
+    vault_id: str = client.vault_id
+    item_id: str = client.item_id
+    _get_connect_item(client, "t", "h", vault_id, item_id)
+    _get_connect_item(client, "t", "h", vault_id, item_id)
+    assert client.requests == [("get_item", item_id, vault_id)]
+    # Unchanged items are revalidated without being retrieved
+    client.requests.clear()
+    sleep(0.05)
+    _get_connect_item(client, "t", "h", vault_id, item_id)
+    _get_connect_item(client, "t", "h", vault_id, item_id)
+    assert client.requests == [("get_items", vault_id)]
+    # Changed items are retrieved again
+    async_client: _AsyncConnectClient = _AsyncConnectClient()
+    async_client.version = 2
+    sleep(0.05)
+    assert (
+        asyncio.run(
+            _async_get_connect_item(async_client, "t", "h", vault_id, item_id)
+        ).version
+        == 2
+    )
+    assert async_client.requests == [
+        ("get_items", vault_id),
+        ("get_item", item_id, vault_id),
+    ]
+    client.requests.clear()
+    assert _get_connect_item(client, "t", "h", vault_id, item_id).version == 2
+    assert client.requests == []
+
+
+def test_prefetch_onepassword_vault(
+    op_sessions_path: Path,  # noqa: ARG001
+) -> None:
+    """
+    Verify that prefetching a vault with the CLI lists and retrieves all of
+    its items in two commands, after which fields are read from memory by
+    ID, label, or section, while ambiguous and parameterized references
+    are still read using the CLI.
+    """
+    items: list[dict[str, object]] = [
+        {
+            "id": "item1",
+            "title": "Prefetched Item",
+            "vault": {"id": "vault1", "name": "Prefetched Vault"},
+            "fields": [
+                {"id": "username", "label": "username", "value": "user"},
+                {
+                    "id": "abc",
+                    "label": "token",
+                    "section": {"id": "s1", "label": "API"},
+                    "value": "api-token",
+                },
+                {"id": "one", "label": "duplicate", "value": "1"},
+                {"id": "two", "label": "duplicate", "value": "2"},
+            ],
+        },
+        {
+            "id": "item2",
+            "title": "Other Item",
+            "vault": {"id": "vault1", "name": "Prefetched Vault"},
+            "fields": [{"id": "password", "label": "password"}],
+        },
+    ]
+    commands: list[str] = []
+
+    def check_output(
+        args: tuple[str, ...],
+        input: str | None = None,  # noqa: A002
+        **kwargs: object,  # noqa: ARG001
+    ) -> str:
+        command: str = " ".join(
+            argument for argument in args[1:5] if argument.isalpha()
+        )
+        commands.append(command)
+        if command == "signin":
+            return ""
+        if command == "item list":
+            return json.dumps([{"id": item["id"]} for item in items])
+        if command == "item get":
+            assert input is not None
+            return "\n".join(json.dumps(item, indent=2) for item in items)
+        return "from-cli"
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(onepassword, "check_output", check_output)
+        monkeypatch.setattr(onepassword, "_OP_VAULTS", {})
+        monkeypatch.delenv("OP_SERVICE_ACCOUNT_TOKEN", raising=False)
+        monkeypatch.delenv("OP_CONNECT_TOKEN", raising=False)
+        prefetch_onepassword_vault(
+            "Prefetched Vault", account="nonsense.1password.com"
+        )
+        assert commands.count("item list") == commands.count("item get") == 1
+        commands.clear()
+        for resource, value in (
+            ("op://Prefetched Vault/Prefetched Item/username", "user"),
+            ("op://vault1/item1/API/token", "api-token"),
+            ("op://Prefetched Vault/item1/s1/abc", "api-token"),
+            ("op://Prefetched Vault/Prefetched Item/one", "1"),
+            ("op://Prefetched Vault/Prefetched Item/duplicate", "from-cli"),
+            ("op://Prefetched Vault/Other Item/password", "from-cli"),
+            ("op://vault1/item1/username?attribute=type", "from-cli"),
+        ):
+            assert (
+                read_onepassword_secret(
+                    resource, account="nonsense.1password.com"
+                )
+                == value
+            )
+        assert asyncio.run(
+            async_read_onepassword_secret(
+                "op://Prefetched Vault/item1/token",
+                account="nonsense.1password.com",
+            )
+        ) == ("api-token")
+        assert commands.count("read") == 3
+
+
+def test_onepassword_cache_policies(
+    op_sessions_path: Path,  # noqa: ARG001
+) -> None:
+    """
+    Verify that one-time passwords are never cached, that other secrets are
+    cached indefinitely by default, and that cache policies can limit how
+    long secrets are cached by reference pattern or field type.
+    """
+    reads: list[str] = []
+
+    def check_output(
+        args: tuple[str, ...],
+        **kwargs: object,  # noqa: ARG001
+    ) -> str:
+        if args[1] != "read":
+            return ""
+        reads.append(args[-1])
+        return str(len(reads))
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(onepassword, "check_output", check_output)
+        monkeypatch.setattr(onepassword, "_OP_VALUES", {})
+        monkeypatch.setattr(onepassword, "_OP_VAULTS", {})
+        monkeypatch.setattr(
+            onepassword,
+            "ONEPASSWORD_CACHE_POLICIES",
+            list(onepassword.ONEPASSWORD_CACHE_POLICIES),
+        )
+        monkeypatch.delenv("OP_SERVICE_ACCOUNT_TOKEN", raising=False)
+        monkeypatch.delenv("OP_CONNECT_TOKEN", raising=False)
+        otp: str = "op://Vault/Policy Item/one-time password?attribute=otp"
+        password: str = "op://Vault/Policy Item/password"
+        short: str = "op://Short/Policy Item/password"
+        set_onepassword_cache_policy("op://Short/*", ttl=0.05)
+        for resource in (otp, otp, password, password, short, short):
+            read_onepassword_secret(resource)
+        assert reads == [otp, otp, password, short]
+        assert _get_unresolved_op_resources((otp, password, short), None) == ()
+        sleep(0.05)
+        read_onepassword_secret(short)
+        assert reads[-1] == short
+        assert len(reads) == 5
+        # Field types are applied where known
+        _set_op_vault(
+            "vault1",
+            "Policy Vault",
+            (
+                (
+                    "item1",
+                    "Policy Item",
+                    {
+                        "password": ("secret", "CONCEALED"),
+                        "totp": ("123456", "OTP"),
+                    },
+                ),
+            ),
+        )
+        assert _get_op_vault_secret("op://Policy Vault/item1/password") == (
+            "secret"
+        )
+        assert _get_op_vault_secret("op://Policy Vault/item1/totp") is None
+
+
+def test_adaptive_onepassword_backends(
+    op_sessions_path: Path,  # noqa: ARG001
+) -> None:
+    """
+    Verify that, with adaptive back-end selection enabled, back ends are
+    tried in the default order (so that the CLI is not tried while the
+    configured SDK succeeds), lookups fail over when a back end cannot be
+    reached, the fastest healthy back end measured is preferred, and
+    secrets which do not exist are reported without failing over or
+    penalizing the back end.
+    """
+    cli_failing: list[bool] = [False]
+    sdk_failing: list[bool] = [False]
+    cli_reads: list[str] = []
+
+    def check_output(
+        args: tuple[str, ...],
+        **kwargs: object,  # noqa: ARG001
+    ) -> str:
+        if args[1] != "read":
+            return ""
+        cli_reads.append(args[-1])
+        if args[-1].endswith("/missing"):
+            raise CalledProcessError(
+                1,
+                args,
+                stderr=(
+                    '[ERROR] could not read secret: "missing" isn\'t a field '
+                    'in the "Adaptive Item" item\n'
+                ),
+            )
+        if cli_failing[0]:
+            raise CalledProcessError(
+                1,
+                args,
+                stderr=(
+                    "[ERROR] Get https://my.1password.com: dial tcp: lookup "
+                    "my.1password.com: no such host\n"
+                ),
+            )
+        return "cli"
+
+    async def async_resolve_resource(token: str, resource: str) -> str:  # noqa: ARG001
+        await asyncio.sleep(0.05)
+        if sdk_failing[0]:
+            message: str = "Network is unreachable"
+            raise OSError(message)
+        return "sdk"
+
+    async def async_check_output(
+        args: tuple[str, ...],
+        **kwargs: object,
+    ) -> str:
+        return check_output(args, **kwargs)
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(onepassword, "check_output", check_output)
+        monkeypatch.setattr(
+            onepassword, "async_check_output", async_check_output
+        )
+        monkeypatch.setattr(
+            onepassword, "_async_resolve_resource", async_resolve_resource
+        )
+        monkeypatch.setattr(onepassword, "_OP_VALUES", {})
+        monkeypatch.setattr(onepassword, "_OP_BACKEND_STATISTICS", {})
+        monkeypatch.setattr(onepassword, "_OP_ADAPTIVE_BACKENDS", [False])
+        monkeypatch.setattr(onepassword, "_OP_BACKEND_COOLDOWN", 0.1)
+        monkeypatch.setenv("OP_SERVICE_ACCOUNT_TOKEN", "token")
+        monkeypatch.delenv("OP_CONNECT_HOST", raising=False)
+        monkeypatch.delenv("OP_CONNECT_TOKEN", raising=False)
+        set_adaptive_onepassword_backends()
+        # The configured SDK is preferred, and the CLI is not tried while
+        # it succeeds
+        assert [
+            read_onepassword_secret(f"op://Vault/Adaptive Item/field-{index}")
+            for index in range(3)
+        ] == ["sdk"] * 3
+        assert not cli_reads
+        assert "cli" not in get_onepassword_backend_statistics()
+        # Lookups fail over, and failed back ends are avoided
+        sdk_failing[0] = True
+        assert read_onepassword_secret("op://Vault/Adaptive Item/fail") == (
+            "cli"
+        )
+        statistics: dict[str, dict[str, object]] = (
+            get_onepassword_backend_statistics()
+        )
+        assert statistics["sdk"]["healthy"] is False
+        assert statistics["cli"]["healthy"] is True
+        assert (
+            asyncio.run(
+                async_read_onepassword_secret("op://Vault/Adaptive Item/async")
+            )
+            == "cli"
+        )
+        assert (
+            get_onepassword_backend_statistics()["sdk"]["error_rate"]
+            == (statistics["sdk"]["error_rate"])
+        )
+        # Secrets which do not exist are not read using other back ends, and
+        # do not count against the health of the back end
+        statistics = get_onepassword_backend_statistics()
+        with pytest.raises(CalledProcessError):
+            read_onepassword_secret("op://Vault/Adaptive Item/missing")
+        assert get_onepassword_backend_statistics()["cli"] == {
+            "latency": statistics["cli"]["latency"],
+            "error_rate": 0,
+            "healthy": True,
+        }
+        # Once both have been measured, and are healthy, the fastest is
+        # preferred
+        sdk_failing[0] = False
+        sleep(0.15)
+        assert read_onepassword_secret("op://Vault/Adaptive Item/fast") == (
+            "cli"
+        )
+        cli_failing[0] = True
+        assert read_onepassword_secret("op://Vault/Adaptive Item/slow") == (
+            "sdk"
+        )
+        # Without adaptive selection, the service account token is used
+        set_adaptive_onepassword_backends(enabled=False)
+        cli_reads.clear()
+        assert read_onepassword_secret("op://Vault/Adaptive Item/last") == (
+            "sdk"
+        )
+        assert not cli_reads
+
+
+def test_is_onepassword_backend_failure() -> None:
+    """
+    Verify that only errors indicating that a back end could not be reached
+    or authenticated with, or failed, count against its health.
+    """
+    assert not _is_onepassword_backend_failure(KeyError("op://V/I/f"))
+    assert not _is_onepassword_backend_failure(
+        FailedToRetrieveItemException("Not found", status_code=404)
+    )
+    assert not _is_onepassword_backend_failure(
+        CalledProcessError(1, ("op", "read"), stderr='"I" isn\'t an item\n')
+    )
+    assert _is_onepassword_backend_failure(
+        FailedToRetrieveItemException("Server error", status_code=503)
+    )
+    assert _is_onepassword_backend_failure(
+        FailedToRetrieveItemException(
+            "Unable to retrieve vaults. Received 401"
+        )
+    )
+    assert _is_onepassword_backend_failure(ConnectionRefusedError())
+    assert _is_onepassword_backend_failure(RateLimitExceededException("429"))
+    assert _is_onepassword_backend_failure(
+        CalledProcessError(
+            1,
+            ("op", "read"),
+            stderr=b"[ERROR] You are not currently signed in",
+        )
+    )
+
+
 if __name__ == "__main__":
     pytest.main(["-s", "-vv", __file__])
+
+
+def test_read_onepassword_document(
+    op_sessions_path: Path,  # noqa: ARG001
+    tmp_path: Path,
+) -> None:
+    """
+    Verify that documents are streamed, unaltered, from `op read` to a
+    private file path, an open file, or an anonymous file, and that output
+    from an attempt which fails due to an expired session is discarded
+    before the command is retried.
+    """
+    data: bytes = bytes(range(256)) * 64 + b"\n"
+    commands: list[tuple[str, ...]] = []
+
+    def check_output(args: tuple[str, ...], **kwargs: object) -> str:  # noqa: ARG001
+        return ""
+
+    def check_stream(
+        args: tuple[str, ...],
+        file: BytesIO,
+        **kwargs: object,  # noqa: ARG001
+    ) -> None:
+        commands.append(args)
+        assert args[1] == "read"
+        assert "--no-newline" in args
+        file.write(data)
+        if len(commands) == 1:
+            file.write(b"partial")
+            raise CalledProcessError(
+                1, args, stderr=b"[ERROR] session expired, sign in again"
+            )
+
+    async def async_check_stream(
+        args: tuple[str, ...], file: BytesIO, **kwargs: object
+    ) -> None:
+        check_stream(args, file, **kwargs)
+
+    resource: str = "op://Vault/Item/keystore.p12"
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(onepassword, "check_output", check_output)
+        monkeypatch.setattr(onepassword, "check_stream", check_stream)
+        monkeypatch.setattr(
+            onepassword, "async_check_stream", async_check_stream
+        )
+        monkeypatch.delenv("OP_SERVICE_ACCOUNT_TOKEN", raising=False)
+        monkeypatch.delenv("OP_CONNECT_TOKEN", raising=False)
+        path: Path = tmp_path / "keystore.p12"
+        assert read_onepassword_document(resource, path) == path
+        assert path.read_bytes() == data
+        if sys.platform != "win32":
+            assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        assert len(commands) == 2
+        buffer: BytesIO = BytesIO(b"prefix")
+        buffer.seek(0, 2)
+        assert read_onepassword_document(resource, buffer) is buffer
+        assert buffer.getvalue() == b"prefix" + data
+        with read_onepassword_document(resource) as file:
+            assert file.read() == data
+        with asyncio.run(async_read_onepassword_document(resource)) as file:
+            assert file.read() == data
+        path.unlink()
+        commands.clear()
+
+        def fail(
+            args: tuple[str, ...],
+            file: BytesIO,  # noqa: ARG001
+            **kwargs: object,  # noqa: ARG001
+        ) -> None:
+            raise CalledProcessError(1, args, stderr=b"[ERROR] not found")
+
+        monkeypatch.setattr(onepassword, "check_stream", fail)
+        with pytest.raises(CalledProcessError):
+            read_onepassword_document(resource, path)
+        assert not path.exists()
+        assert not tuple(tmp_path.glob(f".{path.name}.*"))
@@ -0,0 +1,452 @@
+"""
+Tests and benchmarks of 1Password Connect secret resolution, run against
+a local stand-in for a 1Password Connect server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from time import sleep
+from typing import TYPE_CHECKING
+
+import pytest
+from onepasswordconnectsdk.errors import (  # type: ignore[import-untyped]
+    FailedToRetrieveVaultException,
+    OnePasswordConnectSDKError,
+)
+
+from decorative_secrets import onepassword
+from decorative_secrets._utilities import RateLimiter
+from decorative_secrets.onepassword import (
+    ApplyOnepasswordArgumentsOptions,
+    apply_onepassword_arguments,
+    async_read_onepassword_secret,
+    prefetch_onepassword_vault,
+    read_onepassword_document,
+    read_onepassword_secret,
+    set_onepassword_cache_policy,
+)
+from tests.benchmark import (
+    BENCHMARK_CALLS,
+    BenchmarkResult,
+    benchmark_tasks,
+    benchmark_threads,
+)
+from tests.connect_server import ConnectServer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+VAULTS: dict[str, dict[str, dict[str, str | bytes]]] = {
+    "Connect Vault": {
+        "Database": {
+            "username": "database-user",
+            "password": "database-password",
+            "certificate.pem": bytes(range(256)) * 1024,
+        },
+        "API": {"credential": "api-credential"},
+    },
+    "Other Vault": {"Database": {"password": "other-password"}},
+}
+
+
+@pytest.fixture(name="connect_server")
+def get_connect_server(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[ConnectServer]:
+    """
+    Serve `VAULTS` from a 1Password Connect stand-in, with 1Password state
+    isolated from other tests, and without client-side rate limiting.
+    """
+    name: str
+    for name in (
+        "OP_SERVICE_ACCOUNT_TOKEN",
+        "OP_CONNECT_TOKEN",
+        "OP_CONNECT_HOST",
+        "OP_ACCOUNT",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    for name in (
+        "_CONNECT_IDS",
+        "_CONNECT_ITEMS",
+        "_OP_VALUES",
+        "_OP_FIELD_TYPES",
+        "_OP_VAULTS",
+        "_RATE_LIMITERS",
+    ):
+        monkeypatch.setattr(onepassword, name, {})
+    monkeypatch.setattr(
+        onepassword,
+        "ONEPASSWORD_CACHE_POLICIES",
+        list(onepassword.ONEPASSWORD_CACHE_POLICIES),
+    )
+    monkeypatch.setattr(onepassword, "_RATE_LIMIT", 1_000_000)
+    monkeypatch.setattr(onepassword, "_RATE_LIMIT_BURST", 1_000_000)
+    with ConnectServer(VAULTS) as server:
+        yield server
+
+
+def test_read_onepassword_secret(connect_server: ConnectServer) -> None:
+    """
+    Verify that secrets are read from 1Password Connect by vault name and
+    item title, that names are resolved to IDs once, and that secrets are
+    subsequently read from the cache.
+    """
+    token: str = connect_server.token
+    host: str = connect_server.url
+    assert (
+        read_onepassword_secret(
+            "op://Connect Vault/Database/password", token=token, host=host
+        )
+        == "database-password"
+    )
+    assert (
+        read_onepassword_secret(
+            "op://Connect Vault/Database/username", token=token, host=host
+        )
+        == "database-user"
+    )
+    assert (
+        asyncio.run(
+            async_read_onepassword_secret(
+                "op://Other Vault/Database/password", token=token, host=host
+            )
+        )
+        == "other-password"
+    )
+    assert (
+        read_onepassword_secret(
+            "op://Connect Vault/Database/password", token=token, host=host
+        )
+        == "database-password"
+    )
+    assert connect_server.requests == {"vaults": 1, "items": 2, "item": 2}
+
+
+def test_read_onepassword_secret_uncached(
+    connect_server: ConnectServer,
+) -> None:
+    """
+    Verify that secrets which are never cached are retrieved by ID for
+    every read, so changes are seen immediately.
+    """
+    set_onepassword_cache_policy("op://Connect Vault/*", ttl=0)
+    token: str = connect_server.token
+    host: str = connect_server.url
+    resource: str = "op://Connect Vault/API/credential"
+    assert read_onepassword_secret(resource, token=token, host=host) == (
+        "api-credential"
+    )
+    connect_server.update_item(
+        "Connect Vault", "API", {"credential": "rotated-credential"}
+    )
+    assert read_onepassword_secret(resource, token=token, host=host) == (
+        "rotated-credential"
+    )
+    assert (
+        asyncio.run(
+            async_read_onepassword_secret(resource, token=token, host=host)
+        )
+        == "rotated-credential"
+    )
+    assert connect_server.requests == {"vaults": 1, "items": 1, "item": 3}
+
+
+def test_read_onepassword_secret_short_ttl(
+    connect_server: ConnectServer,
+) -> None:
+    """
+    Verify that, once a secret's cache policy TTL has expired, the cached
+    item it is read from is revalidated, and only retrieved again if it has
+    changed.
+    """
+    set_onepassword_cache_policy("op://Connect Vault/*", ttl=0.25)
+    token: str = connect_server.token
+    host: str = connect_server.url
+    resource: str = "op://Connect Vault/API/credential"
+    assert read_onepassword_secret(resource, token=token, host=host) == (
+        "api-credential"
+    )
+    assert connect_server.requests == {"vaults": 1, "items": 1, "item": 1}
+    connect_server.update_item(
+        "Connect Vault", "API", {"credential": "rotated-credential"}
+    )
+    assert read_onepassword_secret(resource, token=token, host=host) == (
+        "api-credential"
+    )
+    sleep(0.3)
+    assert read_onepassword_secret(resource, token=token, host=host) == (
+        "rotated-credential"
+    )
+    assert connect_server.requests == {"vaults": 1, "items": 2, "item": 2}
+    sleep(0.3)
+    # Unchanged items are revalidated, but not retrieved again
+    assert (
+        asyncio.run(
+            async_read_onepassword_secret(resource, token=token, host=host)
+        )
+        == "rotated-credential"
+    )
+    assert connect_server.requests == {"vaults": 1, "items": 3, "item": 2}
+
+
+def test_read_onepassword_secret_errors(
+    connect_server: ConnectServer,
+) -> None:
+    """
+    Verify that errors returned by 1Password Connect are raised.
+    """
+    connect_server.error_rate = 1
+    with pytest.raises(FailedToRetrieveVaultException):
+        read_onepassword_secret(
+            "op://Connect Vault/API/credential",
+            token=connect_server.token,
+            host=connect_server.url,
+        )
+
+
+@pytest.mark.usefixtures("connect_server")
+def test_read_onepassword_secret_retry_after(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Verify that requests rejected with a 429 status are retried, after
+    pausing for the number of seconds given by the `Retry-After` header.
+    """
+    pauses: list[float | None] = []
+    throttle: Callable[..., None] = RateLimiter.throttle
+
+    with ConnectServer(
+        VAULTS, error_rate=1, error_status=429, retry_after=0.25
+    ) as server:
+
+        def throttle_once(
+            self: RateLimiter, retry_after: float | None = None
+        ) -> None:
+            pauses.append(retry_after)
+            server.error_rate = 0
+            throttle(self, retry_after)
+
+        monkeypatch.setattr(RateLimiter, "throttle", throttle_once)
+        assert (
+            read_onepassword_secret(
+                "op://Connect Vault/API/credential",
+                token=server.token,
+                host=server.url,
+            )
+            == "api-credential"
+        )
+        server.error_rate = 1
+        assert (
+            asyncio.run(
+                async_read_onepassword_secret(
+                    "op://Other Vault/Database/password",
+                    token=server.token,
+                    host=server.url,
+                )
+            )
+            == "other-password"
+        )
+        assert server.requests["error"] == 2  # noqa: PLR2004
+    assert pauses == [0.25, 0.25]
+
+
+def test_apply_onepassword_arguments(connect_server: ConnectServer) -> None:
+    """
+    Verify that `apply_onepassword_arguments` resolves arguments using
+    1Password Connect, for synchronous and asynchronous functions.
+    """
+    options: ApplyOnepasswordArgumentsOptions = (
+        ApplyOnepasswordArgumentsOptions(
+            token=connect_server.token, host=connect_server.url
+        )
+    )
+
+    @apply_onepassword_arguments(
+        options,
+        username="username_onepassword",
+        password="password_onepassword",
+    )
+    def get_credentials(
+        username: str | None = None,
+        password: str | None = None,
+        username_onepassword: str | None = None,  # noqa: ARG001
+        password_onepassword: str | None = None,  # noqa: ARG001
+    ) -> tuple[str | None, str | None]:
+        return username, password
+
+    @apply_onepassword_arguments(options, credential="credential_onepassword")
+    async def get_credential(
+        credential: str | None = None,
+        credential_onepassword: str | None = None,  # noqa: ARG001
+    ) -> str | None:
+        return credential
+
+    assert get_credentials(
+        username_onepassword="op://Connect Vault/Database/username",
+        password_onepassword="op://Connect Vault/Database/password",
+    ) == ("database-user", "database-password")
+    assert (
+        asyncio.run(
+            get_credential(
+                credential_onepassword="op://Connect Vault/API/credential"
+            )
+        )
+        == "api-credential"
+    )
+
+
+def test_prefetch_onepassword_vault(connect_server: ConnectServer) -> None:
+    """
+    Verify that prefetching a vault retrieves each of its items once, after
+    which secrets are read without further requests.
+    """
+    token: str = connect_server.token
+    host: str = connect_server.url
+    prefetch_onepassword_vault("Connect Vault", token=token, host=host)
+    assert connect_server.requests == {"vaults": 1, "items": 1, "item": 2}
+    assert (
+        read_onepassword_secret(
+            "op://Connect Vault/API/credential", token=token, host=host
+        )
+        == "api-credential"
+    )
+    assert connect_server.requests == {"vaults": 1, "items": 1, "item": 2}
+
+
+def test_prefetch_onepassword_vault_credentials(
+    connect_server: ConnectServer,
+) -> None:
+    """
+    Verify that a prefetched vault is only read using the credentials and
+    host it was prefetched with.
+    """
+    token: str = connect_server.token
+    host: str = connect_server.url
+    resource: str = "op://Connect Vault/API/credential"
+    prefetch_onepassword_vault("Connect Vault", token=token, host=host)
+    connect_server.requests.clear()
+    with pytest.raises(OnePasswordConnectSDKError):
+        read_onepassword_secret(resource, token="other-token", host=host)
+    assert connect_server.requests["unauthorized"]
+    # A different server with a vault of the same name, and the same token
+    with ConnectServer(
+        {"Connect Vault": {"API": {"credential": "other-credential"}}},
+        token=token,
+    ) as other_server:
+        assert (
+            read_onepassword_secret(
+                resource, token=token, host=other_server.url
+            )
+            == "other-credential"
+        )
+    assert read_onepassword_secret(resource, token=token, host=host) == (
+        "api-credential"
+    )
+
+
+def test_read_onepassword_document(connect_server: ConnectServer) -> None:
+    """
+    Verify that file attachments are streamed from 1Password Connect.
+    """
+    with read_onepassword_document(
+        "op://Connect Vault/Database/certificate.pem",
+        token=connect_server.token,
+        host=connect_server.url,
+    ) as file:
+        assert (
+            file.read()
+            == VAULTS["Connect Vault"]["Database"]["certificate.pem"]
+        )
+    assert connect_server.requests["content"] == 1
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+@pytest.mark.parametrize("ttl", [None, 0])
+def test_benchmark_read_onepassword_secret(
+    connect_server: ConnectServer, concurrency: int, ttl: float | None
+) -> None:
+    """
+    Measure the throughput and latency of `read_onepassword_secret`, from
+    threads, with secrets cached (`ttl=None`) and uncached (`ttl=0`).
+    """
+    set_onepassword_cache_policy(ttl=ttl)
+    connect_server.latency = 0.001
+    result: BenchmarkResult = benchmark_threads(
+        f"read_onepassword_secret (ttl={ttl})",
+        lambda: read_onepassword_secret(
+            "op://Connect Vault/Database/password",
+            token=connect_server.token,
+            host=connect_server.url,
+        ),
+        concurrency=concurrency,
+    )
+    assert not result.errors
+    if ttl == 0:
+        assert connect_server.requests["item"] == BENCHMARK_CALLS
+    else:
+        # Concurrent reads of a secret which is not yet cached may each
+        # retrieve the item
+        assert connect_server.requests["item"] <= concurrency
+
+
+@pytest.mark.parametrize("concurrency", [1, 32])
+@pytest.mark.parametrize("ttl", [None, 0])
+def test_benchmark_async_read_onepassword_secret(
+    connect_server: ConnectServer, concurrency: int, ttl: float | None
+) -> None:
+    """
+    Measure the throughput and latency of `async_read_onepassword_secret`,
+    from concurrent tasks, with secrets cached and uncached.
+    """
+    set_onepassword_cache_policy(ttl=ttl)
+    connect_server.latency = 0.001
+    result: BenchmarkResult = asyncio.run(
+        benchmark_tasks(
+            f"async_read_onepassword_secret (ttl={ttl})",
+            lambda: async_read_onepassword_secret(
+                "op://Connect Vault/Database/password",
+                token=connect_server.token,
+                host=connect_server.url,
+            ),
+            concurrency=concurrency,
+        )
+    )
+    assert not result.errors
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+def test_benchmark_apply_onepassword_arguments(
+    connect_server: ConnectServer, concurrency: int
+) -> None:
+    """
+    Measure the overhead of resolving arguments using
+    `apply_onepassword_arguments`, from threads, with secrets uncached.
+    """
+    set_onepassword_cache_policy(ttl=0)
+    connect_server.latency = 0.001
+
+    @apply_onepassword_arguments(
+        ApplyOnepasswordArgumentsOptions(
+            token=connect_server.token, host=connect_server.url
+        ),
+        username="username_onepassword",
+        password="password_onepassword",
+    )
+    def get_credentials(
+        username: str | None = None,
+        password: str | None = None,
+        username_onepassword: str | None = None,  # noqa: ARG001
+        password_onepassword: str | None = None,  # noqa: ARG001
+    ) -> tuple[str | None, str | None]:
+        return username, password
+
+    result: BenchmarkResult = benchmark_threads(
+        "apply_onepassword_arguments",
+        lambda: get_credentials(
+            username_onepassword="op://Connect Vault/Database/username",
+            password_onepassword="op://Connect Vault/Database/password",
+        ),
+        concurrency=concurrency,
+    )
+    assert not result.errors
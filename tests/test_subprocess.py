@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import sys
 from contextlib import suppress
-from io import StringIO
+from io import BytesIO, StringIO
 from subprocess import CalledProcessError
 from typing import TYPE_CHECKING, TextIO
 
@@ -19,8 +20,11 @@ from decorative_secrets.errors import (
     HomebrewNotInstalledError,
 )
 from decorative_secrets.subprocess import (
+    async_check_output,
+    async_check_stream,
     check_call,
     check_output,
+    check_stream,
     get_default_shell,
     list2cmdline,
 )
@@ -64,6 +68,85 @@ def test_check_output() -> None:
             sys.stderr = stderr
 
 
+def test_async_check_output() -> None:
+    """
+    Verify that `async_check_output` returns stripped output, passes input,
+    and raises `CalledProcessError` with the captured stderr on failure.
+    """
+    assert asyncio.run(async_check_output(("echo", "hello"))) == "hello"
+    assert (
+        asyncio.run(async_check_output(("echo", "hello"), text=False))
+        == b"hello"
+    )
+    assert asyncio.run(async_check_output(("cat",), input="hello\n")) == (
+        "hello"
+    )
+    with pytest.raises(CalledProcessError) as error_info:
+        asyncio.run(
+            async_check_output(("bash", "-c", "echo oops >&2; exit 3"))
+        )
+    assert error_info.value.returncode == 3
+    assert error_info.value.stderr == b"oops\n"
+
+
+def test_async_check_output_runs_concurrently() -> None:
+    """
+    Verify that concurrent `async_check_output` calls overlap, rather than
+    blocking the event loop.
+    """
+
+    async def run_concurrently() -> float:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        start: float = loop.time()
+        await asyncio.gather(
+            *(async_check_output(("sleep", "0.5")) for _ in range(4))
+        )
+        return loop.time() - start
+
+    assert asyncio.run(run_concurrently()) < 1.5
+
+
+def test_check_stream(tmp_path: Path) -> None:
+    """
+    Verify that `check_stream` and `async_check_stream` write output,
+    unaltered, from the current position of files with and without file
+    descriptors, and raise `CalledProcessError` with the captured stderr
+    on failure.
+    """
+    expression: str = 'bytes(range(256)) * 1024 + b"\\r\\n\\n"'
+    data: bytes = eval(expression)  # noqa: S307
+    args: tuple[str, ...] = (
+        sys.executable,
+        "-c",
+        f"import sys; sys.stdout.buffer.write({expression})",
+    )
+    path: Path = tmp_path / "output"
+    with path.open("w+b") as file:
+        file.write(b"prefix")
+        check_stream(args, file)
+        assert file.tell() == len(data) + 6
+        file.write(b"suffix")
+    assert path.read_bytes() == b"prefix" + data + b"suffix"
+    buffer: BytesIO = BytesIO()
+    check_stream(args, buffer)
+    assert buffer.getvalue() == data
+    with path.open("wb") as file:
+        asyncio.run(async_check_stream(args, file))
+    assert path.read_bytes() == data
+    buffer = BytesIO()
+    asyncio.run(async_check_stream(args, buffer))
+    assert buffer.getvalue() == data
+    failing_args: tuple[str, ...] = ("bash", "-c", "echo oops >&2; exit 3")
+    with pytest.raises(CalledProcessError) as error_info:
+        check_stream(failing_args, BytesIO())
+    assert error_info.value.returncode == 3
+    assert error_info.value.stderr == b"oops\n"
+    with pytest.raises(CalledProcessError) as error_info:
+        asyncio.run(async_check_stream(failing_args, BytesIO()))
+    assert error_info.value.returncode == 3
+    assert error_info.value.stderr == b"oops\n"
+
+
 def test_get_default_shell() -> None:
     """
     `get_default_shell` currently returns `None` (no shell wrapping).